@@ -0,0 +1,39 @@
+"""
+Compares building a SpiderWeb with a loop of add() calls against SpiderWeb.from_iterable().
+
+Usage:
+    python benchmarks/bulk_construction_benchmark.py [size] [max_element_per_level]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from spider_web import SpiderWeb  # noqa: E402
+
+
+def add_loop(size: int, max_element_per_level: int) -> SpiderWeb:
+    spider_web = SpiderWeb(max_element_per_level)
+    for value in range(size):
+        spider_web.add(value)
+    return spider_web
+
+
+def from_iterable(size: int, max_element_per_level: int) -> SpiderWeb:
+    return SpiderWeb.from_iterable(range(size), max_element_per_level)
+
+
+if __name__ == '__main__':
+    arguments = [int(argument) for argument in sys.argv[1:]]
+    size, max_element_per_level = (arguments + [10 ** 6, 64][len(arguments):])[:2]
+    print(f"size={size}, max_element_per_level={max_element_per_level}")
+
+    timings = {}
+    for build in (add_loop, from_iterable):
+        started = time.perf_counter()
+        build(size, max_element_per_level)
+        timings[build.__name__] = time.perf_counter() - started
+        print(f"{build.__name__:>13}: {timings[build.__name__]:.3f} s")
+
+    print(f"      speedup: {timings['add_loop'] / timings['from_iterable']:.2f}x")
@@ -0,0 +1,70 @@
+"""
+Compares the linked node engine with the array backed engine for appends, prepends,
+positional lookups and removals from both ends.
+
+Usage:
+    python benchmarks/engine_benchmark.py [size] [max_element_per_level]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from spider_web import create_spider_web  # noqa: E402
+
+
+def timed(operation, repeat: int) -> float:
+    started = time.perf_counter()
+    operation()
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def run(size: int, max_element_per_level: int) -> None:
+    rng = random.Random(42)
+    positions = [divmod(rng.randrange(size), max_element_per_level) for _ in range(1000)]
+
+    for engine in ("node", "array"):
+        spider_web = create_spider_web(max_element_per_level, engine=engine)
+
+        def add():
+            for value in range(size):
+                spider_web.add(value)
+
+        def get():
+            for level, index in positions:
+                spider_web.get(level, index)
+
+        def set_():
+            for level, index in positions:
+                spider_web.set(level, index, level)
+
+        def remove_first():
+            for _ in range(size // 2):
+                spider_web.remove_first()
+
+        def add_first():
+            for value in range(size // 2):
+                spider_web.add_first(value)
+
+        def remove_last():
+            for _ in range(size):
+                spider_web.remove_last()
+
+        results = [
+            ("add", timed(add, size)),
+            ("get", timed(get, len(positions))),
+            ("set", timed(set_, len(positions))),
+            ("remove_first", timed(remove_first, size // 2)),
+            ("add_first", timed(add_first, size // 2)),
+            ("remove_last", timed(remove_last, size)),
+        ]
+        print(f"{engine:>5}: " + ", ".join(f"{name} {elapsed:.3f} us/op" for name, elapsed in results))
+
+
+if __name__ == '__main__':
+    arguments = [int(argument) for argument in sys.argv[1:]]
+    size, max_element_per_level = (arguments + [10 ** 6, 64][len(arguments):])[:2]
+    print(f"size={size}, max_element_per_level={max_element_per_level}")
+    run(size, max_element_per_level)
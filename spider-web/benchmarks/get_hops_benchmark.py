@@ -0,0 +1,81 @@
+"""
+Compares the node hops and the time spent by positional lookups that walk the SpiderWeb
+element by element with lookups that follow the vertical level links.
+
+Usage:
+    python benchmarks/get_hops_benchmark.py [size] [max_element_per_level] [lookups]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from spider_web import SpiderWeb, SpiderWebNode  # noqa: E402
+
+
+class HopCounter:
+    """
+    Counts the calls to the SpiderWebNode link getters while it is active.
+    """
+
+    _getters = ("get_next_node", "get_prev_node", "get_next_level_node", "get_prev_level_node")
+
+    def __init__(self):
+        self.hops = 0
+        self._originals = {}
+
+    def __enter__(self) -> 'HopCounter':
+        for name in self._getters:
+            original = getattr(SpiderWebNode, name)
+            self._originals[name] = original
+            setattr(SpiderWebNode, name, self._counting(original))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        for name, original in self._originals.items():
+            setattr(SpiderWebNode, name, original)
+
+    def _counting(self, original):
+        def getter(node):
+            self.hops += 1
+            return original(node)
+        return getter
+
+
+def linear_get(spider_web: SpiderWeb, level: int, index: int):
+    # The element by element walk used before the lookups followed the level links.
+    current = spider_web.get_first_node()
+    for _ in range(level * spider_web._max_element_per_level + index):
+        current = current.get_next_node()
+    return current.get_value()
+
+
+def run(size: int, max_element_per_level: int, lookups: int) -> None:
+    spider_web = SpiderWeb(max_element_per_level)
+    for value in range(size):
+        spider_web.add(value)
+
+    rng = random.Random(42)
+    positions = [divmod(rng.randrange(size), max_element_per_level) for _ in range(lookups)]
+
+    for name, lookup in (("linear walk", linear_get), ("level links", SpiderWeb.get)):
+        with HopCounter() as counter:
+            for level, index in positions:
+                lookup(spider_web, level, index)
+        hops = counter.hops
+
+        started = time.perf_counter()
+        for level, index in positions:
+            lookup(spider_web, level, index)
+        elapsed = time.perf_counter() - started
+
+        print(f"{name:>12}: {hops / lookups:>12.1f} hops/lookup, {elapsed / lookups * 1e6:>10.2f} us/lookup")
+
+
+if __name__ == '__main__':
+    arguments = [int(argument) for argument in sys.argv[1:]]
+    size, max_element_per_level, lookups = (arguments + [10 ** 6, 1024, 200][len(arguments):])[:3]
+    print(f"size={size}, max_element_per_level={max_element_per_level}, lookups={lookups}")
+    run(size, max_element_per_level, lookups)
@@ -0,0 +1,62 @@
+"""
+Compares SpiderWeb.insert() and SpiderWeb.remove_at() in the middle of a SpiderWeb against rebuilding the
+SpiderWeb from a list with the element inserted or removed.
+
+Every size uses max_element_per_level = sqrt(size), which keeps the level and the index of a position in
+the same range.
+
+Usage:
+    python benchmarks/insert_benchmark.py [operations] [size ...]
+"""
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from spider_web import SpiderWeb  # noqa: E402
+
+
+def local_repair(spider_web: SpiderWeb, operations: int) -> SpiderWeb:
+    max_element_per_level = spider_web._max_element_per_level
+    for operation in range(operations):
+        position = divmod(spider_web.size() // 2 + operation, max_element_per_level)
+        if operation % 2 == 0:
+            spider_web.insert(*position, -1)
+        else:
+            spider_web.remove_at(*position)
+    return spider_web
+
+
+def rebuild(spider_web: SpiderWeb, operations: int) -> SpiderWeb:
+    max_element_per_level = spider_web._max_element_per_level
+    for operation in range(operations):
+        values = list(spider_web)
+        position = len(values) // 2 + operation
+        if operation % 2 == 0:
+            values.insert(position, -1)
+        else:
+            del values[position]
+        spider_web = SpiderWeb.from_iterable(values, max_element_per_level)
+    return spider_web
+
+
+if __name__ == '__main__':
+    arguments = [int(argument) for argument in sys.argv[1:]]
+    operations = arguments[0] if arguments else 10
+    sizes = arguments[1:] or [10 ** 5, 10 ** 6]
+
+    for size in sizes:
+        max_element_per_level = math.isqrt(size)
+        print(f"size={size}, max_element_per_level={max_element_per_level}, operations={operations}")
+
+        timings = {}
+        for strategy in (local_repair, rebuild):
+            spider_web = SpiderWeb.from_iterable(range(size), max_element_per_level)
+            started = time.perf_counter()
+            strategy(spider_web, operations)
+            timings[strategy.__name__] = (time.perf_counter() - started) / operations
+            print(f"{strategy.__name__:>13}: {timings[strategy.__name__] * 1e6:12.1f} us per operation")
+
+        print(f"      speedup: {timings['rebuild'] / timings['local_repair']:.0f}x")
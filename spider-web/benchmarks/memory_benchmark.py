@@ -0,0 +1,83 @@
+"""
+Reports the memory used per element by a SpiderWeb built from slotted SpiderWebNode objects,
+next to the same chain built from the nodes as they were before they were slotted.
+
+Usage:
+    python benchmarks/memory_benchmark.py [size ...]
+"""
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from spider_web import SpiderWeb  # noqa: E402
+
+
+class DictSpiderWebNode:
+    """
+    A copy of SpiderWebNode before it was slotted, so every node carries a per-instance __dict__.
+    Only the accessors the chain below needs are kept, they do not change the layout of a node.
+    """
+
+    def __init__(self, value, prev_node=None, prev_level_node=None):
+        self._value = value
+        self._prev_node = prev_node
+        self._prev_level_node = prev_level_node
+        self._next_node = None
+        self._next_level_node = None
+
+    def get_next_node(self):
+        return self._next_node
+
+    def set_next_node(self, next_node):
+        self._next_node = next_node
+
+    def set_next_level_node(self, next_level_node):
+        self._next_level_node = next_level_node
+
+
+def build_dict_chain(size: int, max_element_per_level: int) -> DictSpiderWebNode:
+    # SpiderWeb only links SpiderWebNode objects, so the chain is linked here the same way SpiderWeb.add does.
+    first = last = prev_level = None
+    for value in range(size):
+        new_node = DictSpiderWebNode(value, last, prev_level)
+        if last is None:
+            first = new_node
+        else:
+            last.set_next_node(new_node)
+            if prev_level is not None:
+                prev_level.set_next_level_node(new_node)
+                prev_level = prev_level.get_next_node()
+        last = new_node
+        if value + 1 == max_element_per_level:
+            prev_level = first
+    return first
+
+
+def build_spider_web(size: int, max_element_per_level: int) -> SpiderWeb:
+    spider_web = SpiderWeb(max_element_per_level)
+    for value in range(size):
+        spider_web.add(value)
+    return spider_web
+
+
+def bytes_per_element(size: int, build) -> float:
+    gc.collect()
+    tracemalloc.start()
+    structure = build(size, 64)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    # The integers are shared by both layouts, only count the structure itself.
+    integers = sum(sys.getsizeof(value) for value in range(257, size))
+    return (current - integers) / size
+
+
+if __name__ == '__main__':
+    sizes = [int(argument) for argument in sys.argv[1:]] or [10 ** 5, 10 ** 6, 10 ** 7]
+    for size in sizes:
+        print(f"size={size:>10}: "
+              f"__dict__ nodes {bytes_per_element(size, build_dict_chain):7.1f} bytes/element, "
+              f"slotted nodes {bytes_per_element(size, build_spider_web):7.1f} bytes/element")
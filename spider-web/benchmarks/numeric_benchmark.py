@@ -0,0 +1,65 @@
+"""
+Compares whole-web aggregates and memory of a NumericSpiderWeb with the same aggregates computed
+by iterating a node based SpiderWeb.
+
+Usage:
+    python benchmarks/numeric_benchmark.py [size] [max_element_per_level]
+"""
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from numeric_spider_web import NumericSpiderWeb  # noqa: E402
+from spider_web import SpiderWeb  # noqa: E402
+
+
+def build(factory, values):
+    tracemalloc.start()
+    spider_web = factory(values)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return spider_web, current
+
+
+def node_web(values, max_element_per_level):
+    return SpiderWeb.from_iterable(values, max_element_per_level)
+
+
+def numeric_web(values, max_element_per_level):
+    spider_web = NumericSpiderWeb(max_element_per_level, "d")
+    for value in values:
+        spider_web.add(value)
+    return spider_web
+
+
+if __name__ == '__main__':
+    arguments = [int(argument) for argument in sys.argv[1:]]
+    size, max_element_per_level = (arguments + [10 ** 6, 64][len(arguments):])[:2]
+    print(f"size={size}, max_element_per_level={max_element_per_level}")
+    rng = random.Random(42)
+    values = [rng.random() for _ in range(size)]
+
+    nodes, node_bytes = build(lambda items: node_web(items, max_element_per_level), values)
+    numeric, numeric_bytes = build(lambda items: numeric_web(items, max_element_per_level), values)
+    print(f"memory: node {node_bytes / size:.1f} bytes/element, numeric {numeric_bytes / size:.1f} bytes/element")
+
+    aggregates = {
+        "sum": (lambda: sum(nodes), numeric.sum),
+        "min": (lambda: min(nodes), numeric.min),
+        "max": (lambda: max(nodes), numeric.max),
+        "mean": (lambda: sum(nodes) / nodes.size(), numeric.mean),
+        "argmax": (lambda: max(enumerate(nodes), key=lambda pair: pair[1])[0], numeric.argmax),
+    }
+    for name, (node_aggregate, numeric_aggregate) in aggregates.items():
+        started = time.perf_counter()
+        node_aggregate()
+        node_elapsed = time.perf_counter() - started
+        started = time.perf_counter()
+        numeric_aggregate()
+        numeric_elapsed = time.perf_counter() - started
+        print(f"{name:>6}: node {node_elapsed * 1e3:8.2f} ms, numeric {numeric_elapsed * 1e3:8.2f} ms, "
+              f"speedup {node_elapsed / numeric_elapsed:6.1f}x")
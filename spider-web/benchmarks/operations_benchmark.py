@@ -0,0 +1,198 @@
+"""
+Times every public SpiderWeb operation across sizes and max_element_per_level values, and reports the
+throughput, the p50 and p99 latency of single calls and the peak memory, as JSON.
+
+Every operation runs on a SpiderWeb freshly built from range(size). Single calls are timed until the sample
+count or the time budget of the operation is used up, whichever comes first, so the O(n) operations stay
+affordable at 10^6 elements. The peak memory is measured in a separate traced run, so tracemalloc does not
+slow down the timed calls, and covers the SpiderWeb itself plus what the operation allocates on top of it.
+
+Two reports can be compared with --compare, which prints the throughput ratio of every measurement they share.
+
+Usage:
+    python benchmarks/operations_benchmark.py [--sizes N ...] [--levels M ...] [--operations NAME ...]
+                                              [--samples N] [--budget SECONDS] [--output FILE]
+    python benchmarks/operations_benchmark.py --compare BASELINE.json CURRENT.json
+"""
+import argparse
+import contextlib
+import datetime
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from spider_web import SpiderWeb  # noqa: E402
+
+SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+LEVELS = [2, 6, 64, 1024]
+# The SpiderWebs built for the clear samples are not timed, so clear gets fewer samples.
+CLEAR_SAMPLES = 5
+MEMORY_SAMPLES = 10
+
+
+def _random_position(spider_web: SpiderWeb, rng: random.Random) -> tuple:
+    return divmod(rng.randrange(spider_web.size()), spider_web._max_element_per_level)
+
+
+# Each operation takes the SpiderWeb, a random generator and the sample number, and makes a single call.
+OPERATIONS: Dict[str, Callable[[SpiderWeb, random.Random, int], Any]] = {
+    "add": lambda spider_web, rng, sample: spider_web.add(sample),
+    "add_first": lambda spider_web, rng, sample: spider_web.add_first(sample),
+    "get": lambda spider_web, rng, sample: spider_web.get(*_random_position(spider_web, rng)),
+    "set": lambda spider_web, rng, sample: spider_web.set(*_random_position(spider_web, rng), sample),
+    # The searched values sit at the far end, so each search walks the whole SpiderWeb.
+    "index_of": lambda spider_web, rng, sample: spider_web.index_of(spider_web.size() - 1),
+    "last_index_of": lambda spider_web, rng, sample: spider_web.last_index_of(0),
+    "remove_first": lambda spider_web, rng, sample: spider_web.remove_first(),
+    "remove_last": lambda spider_web, rng, sample: spider_web.remove_last(),
+    "copy": lambda spider_web, rng, sample: spider_web.copy(),
+    "clear": lambda spider_web, rng, sample: spider_web.clear(),
+    "print": lambda spider_web, rng, sample: spider_web.print(),
+}
+
+
+def build(size: int, max_element_per_level: int) -> SpiderWeb:
+    return SpiderWeb.from_iterable(range(size), max_element_per_level)
+
+
+def percentile(sorted_latencies: List[float], fraction: float) -> float:
+    return sorted_latencies[min(int(fraction * len(sorted_latencies)), len(sorted_latencies) - 1)]
+
+
+def time_operation(operation: str, size: int, max_element_per_level: int, samples: int, budget: float) -> List[float]:
+    call = OPERATIONS[operation]
+    rng = random.Random(size * 31 + max_element_per_level)
+    if operation == "clear":
+        samples = min(samples, CLEAR_SAMPLES)
+    elif operation in ("remove_first", "remove_last"):
+        samples = min(samples, max(size // 2, 1))
+
+    latencies = []
+    elapsed = 0.0
+    spider_web = build(size, max_element_per_level)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for sample in range(samples):
+            if operation == "clear" and sample > 0:
+                spider_web = build(size, max_element_per_level)
+            started = time.perf_counter()
+            call(spider_web, rng, sample)
+            latency = time.perf_counter() - started
+            latencies.append(latency)
+            elapsed += latency
+            if elapsed >= budget:
+                break
+    return latencies
+
+
+def peak_memory(operation: str, size: int, max_element_per_level: int, samples: int) -> int:
+    call = OPERATIONS[operation]
+    rng = random.Random(size * 31 + max_element_per_level)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        spider_web = build(size, max_element_per_level)
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            for sample in range(samples):
+                call(spider_web, rng, sample)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(operation: str, size: int, max_element_per_level: int, samples: int, budget: float) -> Dict[str, Any]:
+    latencies = time_operation(operation, size, max_element_per_level, samples, budget)
+    memory_samples = min(len(latencies), MEMORY_SAMPLES)
+    latencies.sort()
+    return {
+        "operation": operation,
+        "size": size,
+        "max_element_per_level": max_element_per_level,
+        "samples": len(latencies),
+        "ops_per_second": len(latencies) / sum(latencies) if sum(latencies) > 0 else float("inf"),
+        "p50_seconds": percentile(latencies, 0.50),
+        "p99_seconds": percentile(latencies, 0.99),
+        "peak_memory_bytes": peak_memory(operation, size, max_element_per_level, memory_samples),
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(baseline_path: str, current_path: str) -> None:
+    with open(baseline_path) as file:
+        baseline = json.load(file)
+    with open(current_path) as file:
+        current = json.load(file)
+
+    def key(result: Dict[str, Any]) -> tuple:
+        return result["operation"], result["size"], result["max_element_per_level"]
+
+    baseline_results = {key(result): result for result in baseline["results"]}
+    print(f"{'operation':>14} {'size':>8} {'m':>5} {'baseline ops/s':>15} {'current ops/s':>15} {'ratio':>7}")
+    for result in current["results"]:
+        previous = baseline_results.get(key(result))
+        if previous is None:
+            continue
+        ratio = result["ops_per_second"] / previous["ops_per_second"]
+        print(f"{result['operation']:>14} {result['size']:>8} {result['max_element_per_level']:>5} "
+              f"{previous['ops_per_second']:>15.0f} {result['ops_per_second']:>15.0f} {ratio:>6.2f}x")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmarks every SpiderWeb operation and reports JSON.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--levels", type=int, nargs="+", default=LEVELS, help="max_element_per_level values")
+    parser.add_argument("--operations", nargs="+", default=list(OPERATIONS), choices=list(OPERATIONS))
+    parser.add_argument("--samples", type=int, default=1000, help="maximum timed calls per measurement")
+    parser.add_argument("--budget", type=float, default=0.5, help="maximum timed seconds per measurement")
+    parser.add_argument("--output", help="file to write the JSON report to, instead of stdout")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"), help="compare two JSON reports")
+    arguments = parser.parse_args()
+
+    if arguments.compare:
+        compare(*arguments.compare)
+        sys.exit(0)
+
+    results = []
+    for size in arguments.sizes:
+        for max_element_per_level in arguments.levels:
+            for operation in arguments.operations:
+                result = measure(operation, size, max_element_per_level, arguments.samples, arguments.budget)
+                results.append(result)
+                print(f"{operation:>14} size={size:<8} m={max_element_per_level:<5} "
+                      f"{result['ops_per_second']:>12.0f} ops/s  p50 {result['p50_seconds'] * 1e6:10.1f} us  "
+                      f"p99 {result['p99_seconds'] * 1e6:10.1f} us  "
+                      f"peak {result['peak_memory_bytes'] / 2 ** 20:8.1f} MiB",
+                      file=sys.stderr)
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "samples": arguments.samples,
+        "budget_seconds": arguments.budget,
+        "results": results,
+    }
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
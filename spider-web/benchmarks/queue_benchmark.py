@@ -0,0 +1,103 @@
+"""
+Measures the throughput of SpiderWebQueue against queue.Queue and collections.deque with N producer and
+M consumer threads. deque has no blocking get, so its consumers poll.
+
+Usage:
+    python benchmarks/queue_benchmark.py [items] [producers] [consumers] [batch]
+"""
+import collections
+import os
+import queue
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from spider_web_queue import SpiderWebQueue  # noqa: E402
+
+STOP = object()
+
+
+def run(producers: int, consumers: int, produce, consume, stop) -> float:
+    threads = [threading.Thread(target=consume) for _ in range(consumers)]
+    producer_threads = [threading.Thread(target=produce) for _ in range(producers)]
+    started = time.perf_counter()
+    for thread in threads + producer_threads:
+        thread.start()
+    for thread in producer_threads:
+        thread.join()
+    stop()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - started
+
+
+def queue_like(factory, items: int, producers: int, consumers: int, batch: int) -> float:
+    jobs = factory()
+    per_producer = items // producers
+
+    def produce() -> None:
+        for _ in range(per_producer):
+            jobs.put(1)
+
+    def consume() -> None:
+        while jobs.get() is not STOP:
+            pass
+
+    return run(producers, consumers, produce, consume, lambda: [jobs.put(STOP) for _ in range(consumers)])
+
+
+def spider_web_queue_batched(items: int, producers: int, consumers: int, batch: int) -> float:
+    jobs = SpiderWebQueue(max_element_per_level=64)
+    per_producer = items // producers
+
+    def produce() -> None:
+        for _ in range(per_producer // batch):
+            jobs.put_many([1] * batch)
+
+    def consume() -> None:
+        while True:
+            values = jobs.get_many(batch)
+            stops = values.count(STOP)
+            if stops:
+                # Hand the other consumers back their stop markers.
+                jobs.put_many([STOP] * (stops - 1))
+                return
+
+    return run(producers, consumers, produce, consume, lambda: jobs.put_many([STOP] * consumers))
+
+
+def deque_polling(items: int, producers: int, consumers: int, batch: int) -> float:
+    jobs = collections.deque()
+    per_producer = items // producers
+
+    def produce() -> None:
+        for _ in range(per_producer):
+            jobs.append(1)
+
+    def consume() -> None:
+        while True:
+            try:
+                if jobs.popleft() is STOP:
+                    return
+            except IndexError:
+                time.sleep(0)
+
+    return run(producers, consumers, produce, consume, lambda: jobs.extend([STOP] * consumers))
+
+
+if __name__ == '__main__':
+    arguments = [int(argument) for argument in sys.argv[1:]]
+    items, producers, consumers, batch = (arguments + [200_000, 4, 4, 100][len(arguments):])[:4]
+    print(f"items={items}, producers={producers}, consumers={consumers}, batch={batch}")
+
+    strategies = {
+        "queue.Queue": lambda *args: queue_like(queue.Queue, *args),
+        "SpiderWebQueue": lambda *args: queue_like(lambda: SpiderWebQueue(max_element_per_level=64), *args),
+        "SpiderWebQueue batched": spider_web_queue_batched,
+        "deque (polling)": deque_polling,
+    }
+    for name, strategy in strategies.items():
+        elapsed = strategy(items, producers, consumers, batch)
+        print(f"{name:>22}: {items / elapsed:12,.0f} items/s")
@@ -0,0 +1,45 @@
+"""
+Compares keeping a sliding window of the last samples with add() followed by remove_first() against a
+bounded SpiderWeb with the drop_oldest overflow policy, which reuses the evicted nodes.
+
+Usage:
+    python benchmarks/sliding_window_benchmark.py [samples] [window] [max_element_per_level]
+"""
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from spider_web import SpiderWeb  # noqa: E402
+
+
+def add_and_remove_first(samples: int, window: int, max_element_per_level: int) -> SpiderWeb:
+    spider_web = SpiderWeb(max_element_per_level)
+    for sample in range(samples):
+        spider_web.add(sample)
+        if spider_web.size() > window:
+            spider_web.remove_first()
+    return spider_web
+
+
+def bounded(samples: int, window: int, max_element_per_level: int) -> SpiderWeb:
+    spider_web = SpiderWeb(max_element_per_level, capacity=window)
+    for sample in range(samples):
+        spider_web.add(sample)
+    return spider_web
+
+
+if __name__ == '__main__':
+    arguments = [int(argument) for argument in sys.argv[1:]]
+    samples, window, max_element_per_level = (arguments + [10 ** 6, 10 ** 4, 64][len(arguments):])[:3]
+    print(f"samples={samples}, window={window}, max_element_per_level={max_element_per_level}")
+
+    for strategy in (add_and_remove_first, bounded):
+        collections = sum(stats["collections"] for stats in gc.get_stats())
+        started = time.perf_counter()
+        strategy(samples, window, max_element_per_level)
+        elapsed = time.perf_counter() - started
+        collections = sum(stats["collections"] for stats in gc.get_stats()) - collections
+        print(f"{strategy.__name__:>20}: {samples / elapsed:12,.0f} samples/s, {collections} gc collections")
@@ -10,6 +10,8 @@ import os
 import sys
 
 sys.path.insert(0, os.path.abspath(".."))
+# Modules that import spider_web directly, like the tests do.
+sys.path.insert(0, os.path.abspath(os.path.join("..", "src")))
 
 project = 'spider-web-py'
 copyright = '2023, Milan Savic'
@@ -0,0 +1,382 @@
+from typing import Optional, Any, Dict, List
+
+
+class ArraySpiderWeb:
+    """
+        ArraySpiderWeb is an array backed storage engine for the SpiderWeb data structure. It keeps the
+        public API of :class:`spider_web.SpiderWeb`, but stores every level as a contiguous block of
+        `max_element_per_level` slots instead of a chain of nodes.
+
+        The blocks live in a growable block table that is used as a ring, and the position of the first
+        element inside the first block is tracked as an offset. Positional access becomes block arithmetic,
+        and adding or removing at either end is amortized O(1).
+
+        Example Usage:
+            >>> spider_web = ArraySpiderWeb()
+            >>> spider_web.add(1)
+            >>> spider_web.add(2)
+            >>> spider_web.add_first(0)
+            >>> spider_web.get(0, 2)
+            2
+
+        Attributes:
+            - `max_element_per_level`: The maximum number of elements allowed per level (6).
+
+        """
+
+    _INITIAL_BLOCK_CAPACITY = 4
+
+    def __init__(self, max_element_per_level: int = 6):
+        self._max_element_per_level = max_element_per_level
+        self._blocks: List[Optional[List[Any]]] = [None] * self._INITIAL_BLOCK_CAPACITY
+        self._block_head: int = 0
+        self._block_count: int = 0
+        self._offset: int = 0
+        self._size: int = 0
+
+    # Getter methods for accessing ArraySpiderWeb properties
+
+    def get_level(self) -> int:
+        """
+        Gets the last level of the ArraySpiderWeb.
+
+        :return: The last level of the ArraySpiderWeb.
+        :rtype: int
+        """
+        if self._size == 0:
+            return -1
+        return (self._size - 1) // self._max_element_per_level
+
+    def get_index(self) -> int:
+        """
+        Gets the last index of the ArraySpiderWeb.
+
+        :return: The last index of the ArraySpiderWeb.
+        :rtype: int
+        """
+        if self._size == 0:
+            return -1
+        return (self._size - 1) % self._max_element_per_level
+
+    def get_first(self) -> Any:
+        """
+        Returns the value of the first element in the ArraySpiderWeb.
+
+        :return: The value of the first element.
+        :rtype: Any
+        :raises IndexError: If the ArraySpiderWeb is empty and there is no first element to return.
+        """
+        if self._size == 0:
+            raise IndexError("SpiderWeb is empty, no first element available.")
+        return self._read(0)
+
+    def get_last(self) -> Any:
+        """
+        Returns the value of the last element in the ArraySpiderWeb.
+
+        :return: The value of the last element.
+        :rtype: Any
+        :raises IndexError: If the ArraySpiderWeb is empty and there is no last element to return.
+        """
+        if self._size == 0:
+            raise IndexError("SpiderWeb is empty, no last element available.")
+        return self._read(self._size - 1)
+
+    def size(self) -> int:
+        """
+        Returns the size of the ArraySpiderWeb, indicating the total number of elements stored.
+
+        :return: The size of the ArraySpiderWeb.
+        :rtype: int
+        """
+        return self._size
+
+    # Private helper methods for the block table arithmetic.
+
+    def _block(self, block: int) -> List[Any]:
+        return self._blocks[(self._block_head + block) % len(self._blocks)]
+
+    def _read(self, position: int) -> Any:
+        block, slot = divmod(self._offset + position, self._max_element_per_level)
+        return self._block(block)[slot]
+
+    def _write(self, position: int, value: Any) -> None:
+        block, slot = divmod(self._offset + position, self._max_element_per_level)
+        self._block(block)[slot] = value
+
+    def _grow_block_table(self) -> None:
+        capacity = len(self._blocks)
+        blocks = [self._blocks[(self._block_head + block) % capacity] for block in range(self._block_count)]
+        self._blocks = blocks + [None] * capacity
+        self._block_head = 0
+
+    def _new_block(self) -> List[Any]:
+        return [None] * self._max_element_per_level
+
+    def _is_valid_level_and_index(self, level: int, index: int) -> bool:
+        return (0 <= level <= self.get_level()) and (0 <= index <= self.get_maximum_index_for_level(level))
+
+    # Other public methods...
+
+    def get_maximum_index_for_level(self, level: int) -> int:
+        """
+        Gets the maximum index for a specified level in the ArraySpiderWeb.
+
+        :param level: The level for which to retrieve the maximum index.
+        :type level: int
+        :return: The maximum index for the specified level.
+        :rtype: int
+        :raises ValueError: If the specified level is negative or exceeds the maximum level in the ArraySpiderWeb.
+        :raises ValueError: If the ArraySpiderWeb is empty, and the maximum index cannot be determined.
+        """
+        if level < 0:
+            raise ValueError("Invalid level: Level cannot be negative.")
+        if self._size == 0:
+            raise ValueError("Cannot get maximum index for level on an empty SpiderWeb")
+        if level > self.get_level():
+            raise ValueError(f"Invalid level: {level} exceeds the maximum level {self.get_level()}.")
+
+        if level < self.get_level():
+            return self._max_element_per_level - 1
+
+        return self.get_index()
+
+    def print(self) -> None:
+        """
+        Prints the elements of the ArraySpiderWeb along with their levels and indices.
+
+        :rtype: None
+        """
+        for position in range(self._size):
+            level, index = divmod(position, self._max_element_per_level)
+            print(f"level: {level}, index: {index}, value: {self._read(position)}")
+
+    def add(self, value: Any) -> None:
+        """
+        Adds the specified element to the end of the ArraySpiderWeb in amortized O(1).
+
+        :param value: The value to be added to the end of the ArraySpiderWeb.
+        :type value: Any
+        :rtype: None
+        """
+        block, slot = divmod(self._offset + self._size, self._max_element_per_level)
+        if block == self._block_count:
+            if self._block_count == len(self._blocks):
+                self._grow_block_table()
+            self._blocks[(self._block_head + block) % len(self._blocks)] = self._new_block()
+            self._block_count += 1
+
+        self._block(block)[slot] = value
+        self._size += 1
+
+    def add_first(self, value: Any) -> None:
+        """
+        Adds the specified element to the beginning of the ArraySpiderWeb in amortized O(1).
+
+        :param value: The value to be added to the beginning of the ArraySpiderWeb.
+        :type value: Any
+        :rtype: None
+        """
+        if self._size == 0:
+            self.add(value)
+            return
+
+        if self._offset == 0:
+            if self._block_count == len(self._blocks):
+                self._grow_block_table()
+            self._block_head = (self._block_head - 1) % len(self._blocks)
+            self._blocks[self._block_head] = self._new_block()
+            self._block_count += 1
+            self._offset = self._max_element_per_level
+
+        self._offset -= 1
+        self._block(0)[self._offset] = value
+        self._size += 1
+
+    def add_last(self, value: Any) -> None:
+        """
+        Adds the specified element to the end of the ArraySpiderWeb.
+
+        :param value: The value to be added to the end of the ArraySpiderWeb.
+        :type value: Any
+        :rtype: None
+        """
+        self.add(value)
+
+    def index_of(self, item: Any) -> Dict[str, int]:
+        """
+        Searches for the specified element in the ArraySpiderWeb and returns its level and index.
+
+        :param item: The element to search for in the ArraySpiderWeb.
+        :type item: Any
+        :return: A dictionary containing the level and index of the first occurrence.
+                 If the element is not found, returns {"level": None, "index": None}.
+        :rtype: Dict[str, int]
+        """
+        for position in range(self._size):
+            if self._read(position) == item:
+                level, index = divmod(position, self._max_element_per_level)
+                return {"level": level, "index": index}
+
+        return {"level": None, "index": None}
+
+    def last_index_of(self, item: Any) -> Dict[str, int]:
+        """
+        Searches for the last occurrence of the specified element in the ArraySpiderWeb
+        and returns its level and index.
+
+        :param item: The element to search for in the ArraySpiderWeb.
+        :type item: Any
+        :return: A dictionary containing the level and index of the last occurrence.
+                 If the element is not found, returns {"level": None, "index": None}.
+        :rtype: Dict[str, int]
+        """
+        for position in range(self._size - 1, -1, -1):
+            if self._read(position) == item:
+                level, index = divmod(position, self._max_element_per_level)
+                return {"level": level, "index": index}
+
+        return {"level": None, "index": None}
+
+    def get(self, level: int, index: int) -> Any:
+        """
+        Returns the element at the specified level and index in the ArraySpiderWeb in O(1).
+
+        :param level: The level of the desired element (non-negative).
+        :type level: int
+        :param index: The index of the desired element (non-negative).
+        :type index: int
+        :return: The element at the specified level and index in the ArraySpiderWeb.
+        :rtype: Any
+        :raises ValueError: If the provided level or index is invalid.
+        """
+        if not self._is_valid_level_and_index(level, index):
+            raise ValueError(f"Invalid level or index. Level: {level}, Index: {index}")
+
+        return self._read(level * self._max_element_per_level + index)
+
+    def set(self, level: int, index: int, element: Any) -> Any:
+        """
+        Sets the element at the specified level and index in the ArraySpiderWeb in O(1), replacing any
+        existing element. Returns the previous value at the specified position.
+
+        :param level: The level at which to set the element.
+        :type level: int
+        :param index: The index within the specified level to set the element.
+        :type index: int
+        :param element: The new element to be set at the specified level and index.
+        :type element: Any
+        :return: The previous value at the specified level and index.
+        :rtype: Any
+        :raises ValueError: If the provided level or index is invalid.
+        """
+        if not self._is_valid_level_and_index(level, index):
+            raise ValueError(f"Invalid level or index. Level: {level}, Index: {index}")
+
+        position = level * self._max_element_per_level + index
+        old_value = self._read(position)
+        self._write(position, element)
+        return old_value
+
+    def remove_first(self) -> Any:
+        """
+        Removes and returns the first element from the ArraySpiderWeb in O(1).
+
+        :return: The first element in the ArraySpiderWeb.
+        :rtype: Any
+        :raises IndexError: If the ArraySpiderWeb is empty.
+        """
+        if self._size == 0:
+            raise IndexError("Cannot remove from an empty SpiderWeb.")
+
+        first_block = self._block(0)
+        first_value = first_block[self._offset]
+        first_block[self._offset] = None
+        self._offset += 1
+        self._size -= 1
+
+        if self._offset == self._max_element_per_level or self._size == 0:
+            self._blocks[self._block_head] = None
+            self._block_head = (self._block_head + 1) % len(self._blocks)
+            self._block_count -= 1
+            self._offset = 0
+
+        return first_value
+
+    def remove_last(self) -> Any:
+        """
+        Removes and returns the last element from the ArraySpiderWeb in O(1).
+
+        :return: The last element in the ArraySpiderWeb.
+        :rtype: Any
+        :raises IndexError: If the ArraySpiderWeb is empty.
+        """
+        if self._size == 0:
+            raise IndexError("Cannot remove from an empty SpiderWeb.")
+
+        self._size -= 1
+        block, slot = divmod(self._offset + self._size, self._max_element_per_level)
+        last_block = self._block(block)
+        last_value = last_block[slot]
+        last_block[slot] = None
+
+        if slot == 0 or self._size == 0:
+            self._blocks[(self._block_head + block) % len(self._blocks)] = None
+            self._block_count -= 1
+            if self._size == 0:
+                self._offset = 0
+
+        return last_value
+
+    def clear(self) -> None:
+        """
+        Removes all elements from the ArraySpiderWeb.
+
+        :rtype: None
+        """
+        self._blocks = [None] * self._INITIAL_BLOCK_CAPACITY
+        self._block_head = 0
+        self._block_count = 0
+        self._offset = 0
+        self._size = 0
+
+    def copy(self) -> 'ArraySpiderWeb':
+        """
+        Returns a shallow copy of this ArraySpiderWeb instance. The block table is copied block by block,
+        the stored values are shared.
+
+        :return: A shallow copy of this ArraySpiderWeb instance.
+        :rtype: ArraySpiderWeb
+        """
+        new_instance = ArraySpiderWeb(self._max_element_per_level)
+        new_instance._blocks = [None if block is None else block[:] for block in self._blocks]
+        new_instance._block_head = self._block_head
+        new_instance._block_count = self._block_count
+        new_instance._offset = self._offset
+        new_instance._size = self._size
+        return new_instance
+
+    def __len__(self) -> int:
+        """
+        Returns the size of the ArraySpiderWeb.
+
+        :return: The size of the ArraySpiderWeb.
+        :rtype: int
+        """
+        return self.size()
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the ArraySpiderWeb.
+
+        :return: A string representation of the ArraySpiderWeb.
+        :rtype: str
+        """
+        return (
+            f"ArraySpiderWeb("
+            f"level={self.get_level()}, "
+            f"index={self.get_index()}, "
+            f"size={self.size()}, "
+            f"max_element_per_level={self._max_element_per_level}"
+            f")"
+        )
@@ -0,0 +1,217 @@
+import asyncio
+import collections
+from typing import Optional, Any, AsyncIterator, Callable, Deque
+
+from spider_web import SpiderWeb
+
+
+class AsyncSpiderWeb:
+    """
+        AsyncSpiderWeb wraps a SpiderWeb for asyncio code. Removing from an empty AsyncSpiderWeb waits for an
+        element instead of failing, and adding to a full one waits for room, so a bounded AsyncSpiderWeb
+        applies back-pressure to its producers.
+
+        Waiting coroutines park on futures and are woken by the add or remove that makes progress possible,
+        the way :class:`asyncio.Queue` does it, so nothing polls `size()`. The AsyncSpiderWeb is meant for the
+        coroutines of one event loop and takes no locks.
+
+        Example Usage:
+            >>> samples = AsyncSpiderWeb(capacity=1000)
+            >>> await samples.put(1.5)
+            >>> async for sample in samples:
+            ...     process(sample)
+
+        Attributes:
+            - `max_element_per_level`: The maximum number of elements allowed per level (6).
+            - `capacity`: The maximum number of elements, or None for no limit (None).
+
+        """
+
+    def __init__(self, max_element_per_level: int = 6, capacity: Optional[int] = None):
+        if capacity is not None and capacity < 1:
+            raise ValueError(f"Invalid capacity: {capacity}. The capacity must be at least 1.")
+        self._spider_web = SpiderWeb(max_element_per_level)
+        self._capacity = capacity
+        self._getters: Deque[asyncio.Future] = collections.deque()
+        self._putters: Deque[asyncio.Future] = collections.deque()
+        self._closed: bool = False
+
+    # Getter methods for accessing AsyncSpiderWeb properties
+
+    def size(self) -> int:
+        """
+        Returns the number of elements in the AsyncSpiderWeb.
+
+        :return: The size of the AsyncSpiderWeb.
+        :rtype: int
+        """
+        return self._spider_web.size()
+
+    def get_capacity(self) -> Optional[int]:
+        """
+        Gets the maximum number of elements of the AsyncSpiderWeb.
+
+        :return: The capacity of the AsyncSpiderWeb, or None if it is unbounded.
+        :rtype: Optional[int]
+        """
+        return self._capacity
+
+    def is_closed(self) -> bool:
+        """
+        Returns whether the AsyncSpiderWeb was closed.
+
+        :return: True after :meth:`close` was called.
+        :rtype: bool
+        """
+        return self._closed
+
+    # Private helper methods for parking and waking coroutines.
+
+    def _is_full(self) -> bool:
+        return self._capacity is not None and self._spider_web.size() >= self._capacity
+
+    @staticmethod
+    def _wake_next(waiters: Deque[asyncio.Future]) -> None:
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    @staticmethod
+    def _wake_all(waiters: Deque[asyncio.Future]) -> None:
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def _wait(self, waiters: Deque[asyncio.Future], can_proceed: Callable[[], bool]) -> None:
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            # A cancelled waiter may have been woken already, pass the wake-up on.
+            if can_proceed():
+                self._wake_next(waiters)
+            raise
+
+    async def _wait_for_element(self) -> None:
+        while self._spider_web.size() == 0:
+            if self._closed:
+                raise IndexError("Cannot remove from an empty, closed AsyncSpiderWeb.")
+            await self._wait(self._getters, lambda: self._spider_web.size() > 0 or self._closed)
+
+    def _removed(self) -> None:
+        self._wake_next(self._putters)
+
+    # Other public methods...
+
+    async def put(self, value: Any) -> None:
+        """
+        Adds the value to the end of the AsyncSpiderWeb, waiting for room while it is at its capacity.
+
+        :param value: The value to be added.
+        :type value: Any
+        :rtype: None
+        :raises RuntimeError: If the AsyncSpiderWeb is closed.
+        """
+        while self._is_full():
+            if self._closed:
+                raise RuntimeError("Cannot add to a closed AsyncSpiderWeb.")
+            await self._wait(self._putters, lambda: not self._is_full())
+        self.put_nowait(value)
+
+    def put_nowait(self, value: Any) -> None:
+        """
+        Adds the value to the end of the AsyncSpiderWeb without waiting.
+
+        :param value: The value to be added.
+        :type value: Any
+        :rtype: None
+        :raises asyncio.QueueFull: If the AsyncSpiderWeb is at its capacity.
+        :raises RuntimeError: If the AsyncSpiderWeb is closed.
+        """
+        if self._closed:
+            raise RuntimeError("Cannot add to a closed AsyncSpiderWeb.")
+        if self._is_full():
+            raise asyncio.QueueFull
+        self._spider_web.add(value)
+        self._wake_next(self._getters)
+
+    async def pop_first(self) -> Any:
+        """
+        Removes and returns the first element, waiting for one while the AsyncSpiderWeb is empty.
+
+        :return: The first element.
+        :rtype: Any
+        :raises IndexError: If the AsyncSpiderWeb is empty and closed.
+        """
+        await self._wait_for_element()
+        value = self._spider_web.remove_first()
+        self._removed()
+        return value
+
+    async def pop_last(self) -> Any:
+        """
+        Removes and returns the last element, waiting for one while the AsyncSpiderWeb is empty.
+
+        :return: The last element.
+        :rtype: Any
+        :raises IndexError: If the AsyncSpiderWeb is empty and closed.
+        """
+        await self._wait_for_element()
+        value = self._spider_web.remove_last()
+        self._removed()
+        return value
+
+    def close(self) -> None:
+        """
+        Closes the AsyncSpiderWeb. Adding fails afterwards, while the remaining elements can still be removed.
+        Waiting consumers and `async for` loops finish once the AsyncSpiderWeb is empty.
+
+        :rtype: None
+        """
+        self._closed = True
+        self._wake_all(self._getters)
+        self._wake_all(self._putters)
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        """
+        Iterates over the AsyncSpiderWeb by removing its first element, waiting for new elements while it is
+        empty. The iteration ends when the AsyncSpiderWeb is closed and empty.
+
+        :return: An async iterator that consumes the AsyncSpiderWeb.
+        :rtype: AsyncIterator[Any]
+        """
+        return self._consume()
+
+    async def _consume(self) -> AsyncIterator[Any]:
+        while True:
+            try:
+                yield await self.pop_first()
+            except IndexError:
+                return
+
+    def __len__(self) -> int:
+        """
+        Returns the size of the AsyncSpiderWeb.
+
+        :return: The size of the AsyncSpiderWeb.
+        :rtype: int
+        """
+        return self.size()
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the AsyncSpiderWeb.
+
+        :return: A string representation of the AsyncSpiderWeb.
+        :rtype: str
+        """
+        return f"AsyncSpiderWeb(size={self.size()}, capacity={self._capacity}, closed={self._closed})"
@@ -0,0 +1,507 @@
+import mmap
+import os
+import struct
+from typing import Optional, Any, Dict, Iterable, Iterator
+
+_MAGIC = b"SPWM"
+_VERSION = 1
+# Magic number, format version, max_element_per_level, size and the record format, little-endian.
+_HEADER = struct.Struct("<4sBxxxIQ32s")
+_SIZE_FIELD = struct.Struct("<Q")
+_SIZE_OFFSET = 12
+# The records start after the header, aligned to a cache line.
+_DATA_OFFSET = 64
+
+
+class MappedSpiderWeb:
+    """
+        MappedSpiderWeb is a disk backed variant of the SpiderWeb data structure for fixed-size records,
+        described by a :mod:`struct` format. The records live in a memory-mapped file in which every level
+        is a fixed region of `max_element_per_level` records, so the data may outgrow the RAM and the
+        operating system pages it in on demand.
+
+        get and set by level and index are offset calculations, and :meth:`get_view` returns a record or a
+        whole level as a zero-copy :class:`memoryview` of the mapping. Adding grows the file by whole
+        levels, doubling the number of levels it has room for, so add is amortized O(1). The number of
+        records is kept in the header of the file, which lets other processes open the same file with
+        `read_only=True` and use it right away, without deserializing anything.
+
+        Records are added and removed at the end only, removing the first record would move every level.
+        The MappedSpiderWeb is not thread safe.
+
+        Example Usage:
+            >>> with MappedSpiderWeb("ticks.spw", 1024, record_format="<qd") as ticks:
+            ...     ticks.add((1700000000, 101.25))
+            ...     ticks.get(0, 0)
+            (1700000000, 101.25)
+            >>> readers = MappedSpiderWeb("ticks.spw", read_only=True)
+
+        Attributes:
+            - `path`: The path of the file, created when it does not exist.
+            - `max_element_per_level`: The maximum number of records per level, taken from the file when it
+              exists (6 for a new file).
+            - `record_format`: The :mod:`struct` format of a record, taken from the file when it exists
+              ("d" for a new file).
+            - `read_only`: Whether to map the file read-only, which allows sharing it between processes (False).
+
+        """
+
+    def __init__(
+            self,
+            path: str,
+            max_element_per_level: Optional[int] = None,
+            record_format: Optional[str] = None,
+            read_only: bool = False
+    ):
+        self._path = path
+        self._read_only = read_only
+        if read_only or os.path.exists(path):
+            self._file = open(path, "rb" if read_only else "r+b")
+            try:
+                self._read_header(max_element_per_level, record_format)
+            except BaseException:
+                self._file.close()
+                raise
+        else:
+            self._max_element_per_level = 6 if max_element_per_level is None else max_element_per_level
+            self._record_format = "d" if record_format is None else record_format
+            self._validate_options()
+            self._file = open(path, "w+b")
+            self._file.write(_HEADER.pack(
+                _MAGIC, _VERSION, self._max_element_per_level, 0, self._record_format.encode()
+            ).ljust(_DATA_OFFSET, b"\0"))
+            self._file.flush()
+            self._size = 0
+
+        self._record = struct.Struct(self._record_format)
+        self._single_field = len(self._record.unpack(bytes(self._record.size))) == 1
+        self._level_bytes = self._max_element_per_level * self._record.size
+        self._map = self._map_file()
+
+    # Getter methods for accessing MappedSpiderWeb properties
+
+    def get_record_format(self) -> str:
+        """
+        Gets the struct format of the records.
+
+        :return: The struct format of a record.
+        :rtype: str
+        """
+        return self._record_format
+
+    def get_level(self) -> int:
+        """
+        Gets the last level of the MappedSpiderWeb.
+
+        :return: The last level of the MappedSpiderWeb.
+        :rtype: int
+        """
+        if self._size == 0:
+            return -1
+        return (self._size - 1) // self._max_element_per_level
+
+    def get_index(self) -> int:
+        """
+        Gets the last index of the MappedSpiderWeb.
+
+        :return: The last index of the MappedSpiderWeb.
+        :rtype: int
+        """
+        if self._size == 0:
+            return -1
+        return (self._size - 1) % self._max_element_per_level
+
+    def get_first(self) -> Any:
+        """
+        Returns the first record of the MappedSpiderWeb.
+
+        :return: The first record.
+        :rtype: Any
+        :raises IndexError: If the MappedSpiderWeb is empty and there is no first record to return.
+        """
+        if self._size == 0:
+            raise IndexError("SpiderWeb is empty, no first element available.")
+        return self._read(0)
+
+    def get_last(self) -> Any:
+        """
+        Returns the last record of the MappedSpiderWeb.
+
+        :return: The last record.
+        :rtype: Any
+        :raises IndexError: If the MappedSpiderWeb is empty and there is no last record to return.
+        """
+        if self._size == 0:
+            raise IndexError("SpiderWeb is empty, no last element available.")
+        return self._read(self._size - 1)
+
+    def size(self) -> int:
+        """
+        Returns the size of the MappedSpiderWeb, indicating the total number of records stored.
+
+        :return: The size of the MappedSpiderWeb.
+        :rtype: int
+        """
+        return self._size
+
+    def is_read_only(self) -> bool:
+        """
+        Returns whether the file is mapped read-only.
+
+        :return: True if the MappedSpiderWeb cannot be changed.
+        :rtype: bool
+        """
+        return self._read_only
+
+    # Private helper methods for the file layout.
+
+    def _validate_options(self) -> None:
+        if self._max_element_per_level < 1:
+            raise ValueError(f"Invalid max_element_per_level: {self._max_element_per_level}")
+        if len(self._record_format.encode()) > 32:
+            raise ValueError(f"Invalid record format: {self._record_format} is longer than 32 bytes.")
+        if struct.calcsize(self._record_format) == 0:
+            raise ValueError(f"Invalid record format: {self._record_format} describes an empty record.")
+
+    def _read_header(self, max_element_per_level: Optional[int], record_format: Optional[str]) -> None:
+        header = self._file.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            raise ValueError(f"Not a MappedSpiderWeb file: {self._path}")
+        magic, version, stored_max_element_per_level, size, stored_format = _HEADER.unpack(header)
+        if magic != _MAGIC:
+            raise ValueError(f"Not a MappedSpiderWeb file: {self._path}")
+        if version > _VERSION:
+            raise ValueError(f"Unsupported MappedSpiderWeb file version: {version}")
+
+        stored_format = stored_format.rstrip(b"\0").decode()
+        if max_element_per_level is not None and max_element_per_level != stored_max_element_per_level:
+            raise ValueError(
+                f"Invalid max_element_per_level: {max_element_per_level}, the file uses {stored_max_element_per_level}."
+            )
+        if record_format is not None and record_format != stored_format:
+            raise ValueError(f"Invalid record format: {record_format}, the file uses {stored_format}.")
+
+        self._max_element_per_level = stored_max_element_per_level
+        self._record_format = stored_format
+        self._size = size
+
+    def _map_file(self) -> mmap.mmap:
+        access = mmap.ACCESS_READ if self._read_only else mmap.ACCESS_WRITE
+        return mmap.mmap(self._file.fileno(), 0, access=access)
+
+    def _check_writable(self) -> None:
+        if self._read_only:
+            raise RuntimeError("Cannot modify a read-only MappedSpiderWeb.")
+
+    def _offset(self, position: int) -> int:
+        return _DATA_OFFSET + position * self._record.size
+
+    def _read(self, position: int) -> Any:
+        record = self._record.unpack_from(self._map, self._offset(position))
+        return record[0] if self._single_field else record
+
+    def _write(self, position: int, record: Any) -> None:
+        if self._single_field:
+            self._record.pack_into(self._map, self._offset(position), record)
+        else:
+            self._record.pack_into(self._map, self._offset(position), *record)
+
+    def _set_size(self, size: int) -> None:
+        self._size = size
+        _SIZE_FIELD.pack_into(self._map, _SIZE_OFFSET, size)
+
+    def _reserve(self, size: int) -> None:
+        # Grows the file to whole levels, at least doubling the number of levels it has room for.
+        levels = (len(self._map) - _DATA_OFFSET) // self._level_bytes
+        needed_levels = -(-size // self._max_element_per_level)
+        if needed_levels <= levels:
+            return
+
+        levels = max(needed_levels, 2 * levels, 1)
+        self._file.truncate(_DATA_OFFSET + levels * self._level_bytes)
+        # Views returned by get_view keep the old mapping alive, so it is released instead of closed.
+        self._map = self._map_file()
+
+    def _is_valid_level_and_index(self, level: int, index: int) -> bool:
+        return (0 <= level <= self.get_level()) and (0 <= index <= self.get_maximum_index_for_level(level))
+
+    def _position_to_result(self, position: int) -> Dict[str, int]:
+        level, index = divmod(position, self._max_element_per_level)
+        return {"level": level, "index": index}
+
+    # Other public methods...
+
+    def get_maximum_index_for_level(self, level: int) -> int:
+        """
+        Gets the maximum index for a specified level in the MappedSpiderWeb.
+
+        :param level: The level for which to retrieve the maximum index.
+        :type level: int
+        :return: The maximum index for the specified level.
+        :rtype: int
+        :raises ValueError: If the specified level is negative or exceeds the maximum level.
+        :raises ValueError: If the MappedSpiderWeb is empty, and the maximum index cannot be determined.
+        """
+        if level < 0:
+            raise ValueError("Invalid level: Level cannot be negative.")
+        if self._size == 0:
+            raise ValueError("Cannot get maximum index for level on an empty SpiderWeb")
+        if level > self.get_level():
+            raise ValueError(f"Invalid level: {level} exceeds the maximum level {self.get_level()}.")
+
+        if level < self.get_level():
+            return self._max_element_per_level - 1
+
+        return self.get_index()
+
+    def print(self) -> None:
+        """
+        Prints the records of the MappedSpiderWeb along with their levels and indices.
+
+        :rtype: None
+        """
+        for position, record in enumerate(self):
+            level, index = divmod(position, self._max_element_per_level)
+            print(f"level: {level}, index: {index}, value: {record}")
+
+    def add(self, record: Any) -> None:
+        """
+        Adds the record to the end of the MappedSpiderWeb in amortized O(1). A record is a single value for a
+        struct format with one field, and a tuple of values otherwise.
+
+        :param record: The record to be added to the end of the MappedSpiderWeb.
+        :type record: Any
+        :rtype: None
+        :raises RuntimeError: If the MappedSpiderWeb is read-only.
+        :raises struct.error: If the record does not fit the record format.
+        """
+        self._check_writable()
+        self._reserve(self._size + 1)
+        self._write(self._size, record)
+        self._set_size(self._size + 1)
+
+    def add_last(self, record: Any) -> None:
+        """
+        Adds the record to the end of the MappedSpiderWeb.
+
+        :param record: The record to be added to the end of the MappedSpiderWeb.
+        :type record: Any
+        :rtype: None
+        :raises RuntimeError: If the MappedSpiderWeb is read-only.
+        """
+        self.add(record)
+
+    def extend(self, records: Iterable[Any]) -> None:
+        """
+        Adds the records to the end of the MappedSpiderWeb, updating the size in the header once at the end.
+
+        :param records: The records to be added.
+        :type records: Iterable[Any]
+        :rtype: None
+        :raises RuntimeError: If the MappedSpiderWeb is read-only.
+        :raises struct.error: If a record does not fit the record format. The records before it were added.
+        """
+        self._check_writable()
+        size = self._size
+        try:
+            for record in records:
+                self._reserve(size + 1)
+                self._write(size, record)
+                size += 1
+        finally:
+            self._set_size(size)
+
+    def get(self, level: int, index: int) -> Any:
+        """
+        Returns the record at the specified level and index in the MappedSpiderWeb in O(1).
+
+        :param level: The level of the desired record (non-negative).
+        :type level: int
+        :param index: The index of the desired record (non-negative).
+        :type index: int
+        :return: The record at the specified level and index.
+        :rtype: Any
+        :raises ValueError: If the provided level or index is invalid.
+        """
+        if not self._is_valid_level_and_index(level, index):
+            raise ValueError(f"Invalid level or index. Level: {level}, Index: {index}")
+
+        return self._read(level * self._max_element_per_level + index)
+
+    def get_view(self, level: int, index: Optional[int] = None) -> memoryview:
+        """
+        Returns the raw bytes of the record at the specified level and index, or of every record of the level,
+        as a zero-copy memoryview of the mapped file. The view stays valid after the file grows, and the file
+        cannot be closed while it is held.
+
+        :param level: The level of the desired records (non-negative).
+        :type level: int
+        :param index: The index of the desired record, or None for the whole level.
+        :type index: Optional[int]
+        :return: A memoryview of the bytes of the record or the level.
+        :rtype: memoryview
+        :raises ValueError: If the provided level or index is invalid.
+        """
+        if not self._is_valid_level_and_index(level, 0 if index is None else index):
+            raise ValueError(f"Invalid level or index. Level: {level}, Index: {index}")
+
+        position = level * self._max_element_per_level
+        if index is None:
+            count = self.get_maximum_index_for_level(level) + 1
+        else:
+            position += index
+            count = 1
+        start = self._offset(position)
+        return memoryview(self._map)[start:start + count * self._record.size]
+
+    def set(self, level: int, index: int, element: Any) -> Any:
+        """
+        Sets the record at the specified level and index in O(1) and returns the previous record.
+
+        :param level: The level at which to set the record.
+        :type level: int
+        :param index: The index within the specified level to set the record.
+        :type index: int
+        :param element: The new record.
+        :type element: Any
+        :return: The previous record at the specified level and index.
+        :rtype: Any
+        :raises ValueError: If the provided level or index is invalid.
+        :raises RuntimeError: If the MappedSpiderWeb is read-only.
+        """
+        self._check_writable()
+        if not self._is_valid_level_and_index(level, index):
+            raise ValueError(f"Invalid level or index. Level: {level}, Index: {index}")
+
+        position = level * self._max_element_per_level + index
+        old_record = self._read(position)
+        self._write(position, element)
+        return old_record
+
+    def remove_last(self) -> Any:
+        """
+        Removes and returns the last record of the MappedSpiderWeb in O(1). The file keeps its size, the
+        slot is reused by the next add.
+
+        :return: The last record.
+        :rtype: Any
+        :raises IndexError: If the MappedSpiderWeb is empty.
+        :raises RuntimeError: If the MappedSpiderWeb is read-only.
+        """
+        self._check_writable()
+        if self._size == 0:
+            raise IndexError("Cannot remove from an empty SpiderWeb.")
+
+        last_record = self._read(self._size - 1)
+        self._set_size(self._size - 1)
+        return last_record
+
+    def index_of(self, item: Any) -> Dict[str, int]:
+        """
+        Searches for the specified record and returns the level and index of its first occurrence.
+
+        :param item: The record to search for.
+        :type item: Any
+        :return: A dictionary containing the level and index of the first occurrence.
+                 If the record is not found, returns {"level": None, "index": None}.
+        :rtype: Dict[str, int]
+        """
+        for position, record in enumerate(self):
+            if record == item:
+                return self._position_to_result(position)
+
+        return {"level": None, "index": None}
+
+    def last_index_of(self, item: Any) -> Dict[str, int]:
+        """
+        Searches for the specified record and returns the level and index of its last occurrence.
+
+        :param item: The record to search for.
+        :type item: Any
+        :return: A dictionary containing the level and index of the last occurrence.
+                 If the record is not found, returns {"level": None, "index": None}.
+        :rtype: Dict[str, int]
+        """
+        for position in range(self._size - 1, -1, -1):
+            if self._read(position) == item:
+                return self._position_to_result(position)
+
+        return {"level": None, "index": None}
+
+    def refresh(self) -> None:
+        """
+        Reads the size from the header again and maps the file again if it grew, to see the records that
+        another process added since the file was opened.
+
+        :rtype: None
+        """
+        self._size = _SIZE_FIELD.unpack_from(self._map, _SIZE_OFFSET)[0]
+        if self._offset(self._size) > len(self._map):
+            self._map = self._map_file()
+
+    def flush(self) -> None:
+        """
+        Writes the changed pages of the mapping back to the file.
+
+        :rtype: None
+        """
+        if not self._read_only:
+            self._map.flush()
+
+    def close(self) -> None:
+        """
+        Flushes and closes the file. The views returned by :meth:`get_view` must be released first.
+
+        :rtype: None
+        :raises BufferError: If a view of the mapping is still held.
+        """
+        if self._file.closed:
+            return
+        self.flush()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> 'MappedSpiderWeb':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Returns an iterator over the records, from the first to the last.
+
+        :return: An iterator of the records.
+        :rtype: Iterator[Any]
+        """
+        records = self._record.iter_unpack(memoryview(self._map)[_DATA_OFFSET:self._offset(self._size)])
+        if self._single_field:
+            return (record[0] for record in records)
+        return records
+
+    def __len__(self) -> int:
+        """
+        Returns the size of the MappedSpiderWeb.
+
+        :return: The size of the MappedSpiderWeb.
+        :rtype: int
+        """
+        return self.size()
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the MappedSpiderWeb.
+
+        :return: A string representation of the MappedSpiderWeb.
+        :rtype: str
+        """
+        return (
+            f"MappedSpiderWeb("
+            f"path={self._path}, "
+            f"level={self.get_level()}, "
+            f"index={self.get_index()}, "
+            f"size={self.size()}, "
+            f"max_element_per_level={self._max_element_per_level}, "
+            f"record_format={self._record_format}"
+            f")"
+        )
@@ -0,0 +1,495 @@
+import itertools
+import math
+import pickle
+from array import array
+from contextlib import contextmanager
+from typing import Optional, Any, Dict, Iterator, Tuple, Union
+
+try:
+    import numpy
+except ImportError:
+    # numpy is optional, without it the aggregates iterate the buffer through the builtins.
+    numpy = None
+
+Number = Union[int, float]
+
+
+class NumericSpiderWeb:
+    """
+        NumericSpiderWeb is a typed variant of the SpiderWeb data structure for int or float samples. Instead
+        of boxing every value in its own node, the values are stored in one contiguous :class:`array.array`
+        laid out level by level, so a float64 or int64 value takes 8 bytes.
+
+        Adding and removing at either end is amortized O(1), and get and set by level and index are
+        offset calculations. The aggregates `sum`, `min`, `max`, `mean` and `argmax` run over a view of the
+        buffer without copying it, either for the whole NumericSpiderWeb or for a single level. When numpy is
+        installed, they run in numpy over the packed values. Without it, they run in the builtins, which box
+        every value on the way, so they stay slower than the same builtins over a list of boxed values.
+
+        Example Usage:
+            >>> samples = NumericSpiderWeb(3, typecode="d")
+            >>> for value in [1.5, 2.5, 4.0, 0.5]:
+            ...     samples.add(value)
+            >>> samples.sum(), samples.max(level=0), samples.argmax()
+            (8.5, 4.0, {'level': 0, 'index': 2})
+
+        Attributes:
+            - `max_element_per_level`: The maximum number of elements allowed per level (6).
+            - `typecode`: The :mod:`array` type code of the values, for example "d" for float64
+              or "q" for int64 ("d").
+
+        """
+
+    _MIN_FRONT_GAP = 8
+
+    def __init__(self, max_element_per_level: int = 6, typecode: str = "d"):
+        self._max_element_per_level = max_element_per_level
+        self._typecode = typecode
+        self._buffer = array(typecode)
+        # The elements occupy the buffer from _head to its end, the slots before _head are free.
+        self._head: int = 0
+
+    # Getter methods for accessing NumericSpiderWeb properties
+
+    def get_typecode(self) -> str:
+        """
+        Gets the array type code of the stored values.
+
+        :return: The array type code.
+        :rtype: str
+        """
+        return self._typecode
+
+    def get_level(self) -> int:
+        """
+        Gets the last level of the NumericSpiderWeb.
+
+        :return: The last level of the NumericSpiderWeb.
+        :rtype: int
+        """
+        if self.size() == 0:
+            return -1
+        return (self.size() - 1) // self._max_element_per_level
+
+    def get_index(self) -> int:
+        """
+        Gets the last index of the NumericSpiderWeb.
+
+        :return: The last index of the NumericSpiderWeb.
+        :rtype: int
+        """
+        if self.size() == 0:
+            return -1
+        return (self.size() - 1) % self._max_element_per_level
+
+    def get_first(self) -> Number:
+        """
+        Returns the value of the first element in the NumericSpiderWeb.
+
+        :return: The value of the first element.
+        :rtype: Number
+        :raises IndexError: If the NumericSpiderWeb is empty and there is no first element to return.
+        """
+        if self.size() == 0:
+            raise IndexError("SpiderWeb is empty, no first element available.")
+        return self._buffer[self._head]
+
+    def get_last(self) -> Number:
+        """
+        Returns the value of the last element in the NumericSpiderWeb.
+
+        :return: The value of the last element.
+        :rtype: Number
+        :raises IndexError: If the NumericSpiderWeb is empty and there is no last element to return.
+        """
+        if self.size() == 0:
+            raise IndexError("SpiderWeb is empty, no last element available.")
+        return self._buffer[-1]
+
+    def size(self) -> int:
+        """
+        Returns the size of the NumericSpiderWeb, indicating the total number of elements stored.
+
+        :return: The size of the NumericSpiderWeb.
+        :rtype: int
+        """
+        return len(self._buffer) - self._head
+
+    # Private helper methods for the buffer arithmetic.
+
+    def _is_valid_level_and_index(self, level: int, index: int) -> bool:
+        return (0 <= level <= self.get_level()) and (0 <= index <= self.get_maximum_index_for_level(level))
+
+    def _segment_bounds(self, level: Optional[int]) -> Tuple[int, int]:
+        # The buffer positions of the values of a level, or of the whole NumericSpiderWeb.
+        if level is None:
+            return self._head, len(self._buffer)
+        start = self._head + level * self._max_element_per_level
+        return start, start + self.get_maximum_index_for_level(level) + 1
+
+    @contextmanager
+    def _segment(self, level: Optional[int], empty_message: Optional[str] = None) -> Iterator[memoryview]:
+        # Views the values of a level, or of the whole NumericSpiderWeb, without copying them. The view is
+        # released on exit, because the buffer cannot be resized while it is exported.
+        start, stop = self._segment_bounds(level)
+        if empty_message is not None and start == stop:
+            raise ValueError(empty_message)
+        with memoryview(self._buffer) as view, view[start:stop] as segment:
+            yield segment
+
+    def _segment_start(self, level: Optional[int]) -> int:
+        return 0 if level is None else level * self._max_element_per_level
+
+    def _sum(self, segment: memoryview) -> Number:
+        # Integers are summed by the builtin, so they cannot overflow the 64 bits numpy would sum them in.
+        if numpy is not None and self._typecode in "fd":
+            return numpy.asarray(segment).sum(dtype=numpy.float64).item()
+        return sum(segment)
+
+    def _position_to_result(self, position: int) -> Dict[str, int]:
+        level, index = divmod(position, self._max_element_per_level)
+        return {"level": level, "index": index}
+
+    # Other public methods...
+
+    def get_maximum_index_for_level(self, level: int) -> int:
+        """
+        Gets the maximum index for a specified level in the NumericSpiderWeb.
+
+        :param level: The level for which to retrieve the maximum index.
+        :type level: int
+        :return: The maximum index for the specified level.
+        :rtype: int
+        :raises ValueError: If the specified level is negative or exceeds the maximum level.
+        :raises ValueError: If the NumericSpiderWeb is empty, and the maximum index cannot be determined.
+        """
+        if level < 0:
+            raise ValueError("Invalid level: Level cannot be negative.")
+        if self.size() == 0:
+            raise ValueError("Cannot get maximum index for level on an empty SpiderWeb")
+        if level > self.get_level():
+            raise ValueError(f"Invalid level: {level} exceeds the maximum level {self.get_level()}.")
+
+        if level < self.get_level():
+            return self._max_element_per_level - 1
+
+        return self.get_index()
+
+    def print(self) -> None:
+        """
+        Prints the elements of the NumericSpiderWeb along with their levels and indices.
+
+        :rtype: None
+        """
+        for position, value in enumerate(self):
+            level, index = divmod(position, self._max_element_per_level)
+            print(f"level: {level}, index: {index}, value: {value}")
+
+    def add(self, value: Number) -> None:
+        """
+        Adds the specified value to the end of the NumericSpiderWeb in amortized O(1).
+
+        :param value: The value to be added to the end of the NumericSpiderWeb.
+        :type value: Number
+        :rtype: None
+        :raises TypeError: If the value does not fit the type code.
+        """
+        self._buffer.append(value)
+
+    def add_first(self, value: Number) -> None:
+        """
+        Adds the specified value to the beginning of the NumericSpiderWeb in amortized O(1).
+
+        :param value: The value to be added to the beginning of the NumericSpiderWeb.
+        :type value: Number
+        :rtype: None
+        :raises TypeError: If the value does not fit the type code.
+        """
+        if self._head == 0:
+            # Doubling the free slots in front keeps prepending amortized O(1).
+            gap = max(self.size(), self._MIN_FRONT_GAP)
+            self._buffer = array(self._typecode, bytes(gap * self._buffer.itemsize)) + self._buffer
+            self._head = gap
+
+        self._buffer[self._head - 1] = value
+        self._head -= 1
+
+    def add_last(self, value: Number) -> None:
+        """
+        Adds the specified value to the end of the NumericSpiderWeb.
+
+        :param value: The value to be added to the end of the NumericSpiderWeb.
+        :type value: Number
+        :rtype: None
+        """
+        self.add(value)
+
+    def get(self, level: int, index: int) -> Number:
+        """
+        Returns the value at the specified level and index in the NumericSpiderWeb in O(1).
+
+        :param level: The level of the desired value (non-negative).
+        :type level: int
+        :param index: The index of the desired value (non-negative).
+        :type index: int
+        :return: The value at the specified level and index.
+        :rtype: Number
+        :raises ValueError: If the provided level or index is invalid.
+        """
+        if not self._is_valid_level_and_index(level, index):
+            raise ValueError(f"Invalid level or index. Level: {level}, Index: {index}")
+
+        return self._buffer[self._head + level * self._max_element_per_level + index]
+
+    def set(self, level: int, index: int, element: Number) -> Number:
+        """
+        Sets the value at the specified level and index in O(1) and returns the previous value.
+
+        :param level: The level at which to set the value.
+        :type level: int
+        :param index: The index within the specified level to set the value.
+        :type index: int
+        :param element: The new value.
+        :type element: Number
+        :return: The previous value at the specified level and index.
+        :rtype: Number
+        :raises ValueError: If the provided level or index is invalid.
+        """
+        if not self._is_valid_level_and_index(level, index):
+            raise ValueError(f"Invalid level or index. Level: {level}, Index: {index}")
+
+        position = self._head + level * self._max_element_per_level + index
+        old_value = self._buffer[position]
+        self._buffer[position] = element
+        return old_value
+
+    def remove_first(self) -> Number:
+        """
+        Removes and returns the first value of the NumericSpiderWeb in amortized O(1).
+
+        :return: The first value.
+        :rtype: Number
+        :raises IndexError: If the NumericSpiderWeb is empty.
+        """
+        if self.size() == 0:
+            raise IndexError("Cannot remove from an empty SpiderWeb.")
+
+        first_value = self._buffer[self._head]
+        self._head += 1
+        if self._head > self._MIN_FRONT_GAP and self._head * 4 > len(self._buffer) * 3:
+            # Dropping the free slots once they fill three quarters of the buffer keeps it compact, without
+            # undoing the free slots that add_first just made in front of the elements.
+            del self._buffer[:self._head]
+            self._head = 0
+
+        return first_value
+
+    def remove_last(self) -> Number:
+        """
+        Removes and returns the last value of the NumericSpiderWeb in amortized O(1).
+
+        :return: The last value.
+        :rtype: Number
+        :raises IndexError: If the NumericSpiderWeb is empty.
+        """
+        if self.size() == 0:
+            raise IndexError("Cannot remove from an empty SpiderWeb.")
+
+        last_value = self._buffer.pop()
+        if self.size() == 0:
+            self.clear()
+        return last_value
+
+    def index_of(self, item: Number) -> Dict[str, int]:
+        """
+        Searches for the specified value and returns the level and index of its first occurrence.
+
+        :param item: The value to search for.
+        :type item: Number
+        :return: A dictionary containing the level and index of the first occurrence.
+                 If the value is not found, returns {"level": None, "index": None}.
+        :rtype: Dict[str, int]
+        """
+        try:
+            return self._position_to_result(self._buffer.index(item, self._head) - self._head)
+        except (ValueError, TypeError):
+            return {"level": None, "index": None}
+
+    def last_index_of(self, item: Number) -> Dict[str, int]:
+        """
+        Searches for the specified value and returns the level and index of its last occurrence.
+
+        :param item: The value to search for.
+        :type item: Number
+        :return: A dictionary containing the level and index of the last occurrence.
+                 If the value is not found, returns {"level": None, "index": None}.
+        :rtype: Dict[str, int]
+        """
+        for position in range(self.size() - 1, -1, -1):
+            if self._buffer[self._head + position] == item:
+                return self._position_to_result(position)
+
+        return {"level": None, "index": None}
+
+    def sum(self, level: Optional[int] = None) -> Number:
+        """
+        Returns the sum of the values of the specified level, or of the whole NumericSpiderWeb.
+
+        :param level: The level to aggregate, or None for the whole NumericSpiderWeb.
+        :type level: Optional[int]
+        :return: The sum of the values.
+        :rtype: Number
+        :raises ValueError: If the level is invalid.
+        """
+        with self._segment(level) as segment:
+            return self._sum(segment)
+
+    def min(self, level: Optional[int] = None) -> Number:
+        """
+        Returns the smallest value of the specified level, or of the whole NumericSpiderWeb.
+
+        :param level: The level to aggregate, or None for the whole NumericSpiderWeb.
+        :type level: Optional[int]
+        :return: The smallest value.
+        :rtype: Number
+        :raises ValueError: If the level is invalid or the NumericSpiderWeb is empty.
+        """
+        with self._segment(level, "Cannot compute the min of an empty SpiderWeb.") as segment:
+            if numpy is not None:
+                return numpy.asarray(segment).min().item()
+            return min(segment)
+
+    def max(self, level: Optional[int] = None) -> Number:
+        """
+        Returns the largest value of the specified level, or of the whole NumericSpiderWeb.
+
+        :param level: The level to aggregate, or None for the whole NumericSpiderWeb.
+        :type level: Optional[int]
+        :return: The largest value.
+        :rtype: Number
+        :raises ValueError: If the level is invalid or the NumericSpiderWeb is empty.
+        """
+        with self._segment(level, "Cannot compute the max of an empty SpiderWeb.") as segment:
+            if numpy is not None:
+                return numpy.asarray(segment).max().item()
+            return max(segment)
+
+    def mean(self, level: Optional[int] = None) -> float:
+        """
+        Returns the arithmetic mean of the values of the specified level, or of the whole NumericSpiderWeb.
+
+        :param level: The level to aggregate, or None for the whole NumericSpiderWeb.
+        :type level: Optional[int]
+        :return: The mean of the values.
+        :rtype: float
+        :raises ValueError: If the level is invalid or the NumericSpiderWeb is empty.
+        """
+        with self._segment(level, "Cannot compute the mean of an empty SpiderWeb.") as segment:
+            return self._sum(segment) / len(segment)
+
+    def argmax(self, level: Optional[int] = None) -> Dict[str, int]:
+        """
+        Returns the level and index of the first largest value of the specified level,
+        or of the whole NumericSpiderWeb. With numpy, the values are scanned once. Without it, the largest
+        value is found by the builtin max, and its first position by :meth:`array.array.index`, both in C,
+        which is faster than a single pass that calls back into Python for every value. Like numpy, the
+        position of the first NaN is returned when float values hold one.
+
+        :param level: The level to aggregate, or None for the whole NumericSpiderWeb.
+        :type level: Optional[int]
+        :return: A dictionary containing the level and index of the largest value.
+        :rtype: Dict[str, int]
+        :raises ValueError: If the level is invalid or the NumericSpiderWeb is empty.
+        """
+        with self._segment(level, "Cannot compute the argmax of an empty SpiderWeb.") as segment:
+            if numpy is not None:
+                return self._position_to_result(self._segment_start(level) + int(numpy.asarray(segment).argmax()))
+            if self._typecode in "fd":
+                # NaN is not equal to itself, so array.index cannot find it, and the builtin max skips it.
+                nan_offset = next(itertools.compress(itertools.count(), map(math.isnan, segment)), None)
+                if nan_offset is not None:
+                    return self._position_to_result(self._segment_start(level) + nan_offset)
+            largest = max(segment)
+        start, stop = self._segment_bounds(level)
+        return self._position_to_result(self._buffer.index(largest, start, stop) - self._head)
+
+    def clear(self) -> None:
+        """
+        Removes all values from the NumericSpiderWeb.
+
+        :rtype: None
+        """
+        self._buffer = array(self._typecode)
+        self._head = 0
+
+    def copy(self) -> 'NumericSpiderWeb':
+        """
+        Returns a copy of this NumericSpiderWeb, made with a single copy of the buffer.
+
+        :return: A copy of this NumericSpiderWeb.
+        :rtype: NumericSpiderWeb
+        """
+        new_instance = NumericSpiderWeb(self._max_element_per_level, self._typecode)
+        new_instance._buffer = self._buffer[self._head:]
+        return new_instance
+
+    def __reduce_ex__(self, protocol: int) -> Tuple[Any, ...]:
+        """
+        Pickles the NumericSpiderWeb as its options and the raw bytes of its values. With pickle protocol 5, the
+        values are passed as a :class:`pickle.PickleBuffer`, which can be transferred out-of-band. It exports a
+        copy of the values rather than the buffer itself, which could not grow while the consumer holds it.
+
+        :param protocol: The pickle protocol.
+        :type protocol: int
+        :return: The callable that restores the NumericSpiderWeb and its arguments.
+        :rtype: Tuple[Any, ...]
+        """
+        values = self._buffer[self._head:]
+        payload = pickle.PickleBuffer(values) if protocol >= 5 else values.tobytes()
+        return _restore_numeric_spider_web, (type(self), self._max_element_per_level, self._typecode, payload)
+
+    def __iter__(self) -> Iterator[Number]:
+        """
+        Returns an iterator over the values, from the first to the last.
+
+        :return: An iterator of the values.
+        :rtype: Iterator[Number]
+        """
+        return iter(self._buffer[self._head:])
+
+    def __len__(self) -> int:
+        """
+        Returns the size of the NumericSpiderWeb.
+
+        :return: The size of the NumericSpiderWeb.
+        :rtype: int
+        """
+        return self.size()
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the NumericSpiderWeb.
+
+        :return: A string representation of the NumericSpiderWeb.
+        :rtype: str
+        """
+        return (
+            f"NumericSpiderWeb("
+            f"level={self.get_level()}, "
+            f"index={self.get_index()}, "
+            f"size={self.size()}, "
+            f"max_element_per_level={self._max_element_per_level}, "
+            f"typecode={self._typecode}"
+            f")"
+        )
+
+
+def _restore_numeric_spider_web(
+        cls: type,
+        max_element_per_level: int,
+        typecode: str,
+        payload: Any
+) -> NumericSpiderWeb:
+    numeric_spider_web = cls(max_element_per_level, typecode)
+    numeric_spider_web._buffer.frombytes(memoryview(payload).cast("B"))
+    return numeric_spider_web
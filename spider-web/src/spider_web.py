@@ -1,4 +1,24 @@
-from typing import Optional, Any, Dict
+import bisect
+import collections
+import functools
+import logging
+import os
+import pickle
+import random
+import reprlib
+import struct
+import sys
+import threading
+import time
+import traceback
+import weakref
+from array import array
+from contextlib import contextmanager, nullcontext
+from typing import Optional, Any, Dict, Iterator, Iterable, Tuple, Callable, ContextManager, List, Union, \
+    NamedTuple, Deque
+
+# Evicted nodes are only recycled where reference counts tell whether a handle to them is still held.
+_getrefcount = getattr(sys, "getrefcount", None)
 
 
 class SpiderWebNode:
@@ -14,8 +34,12 @@ class SpiderWebNode:
         - `value`: The value stored in the node.
         - `prev_node`: Reference to the previous node.
         - `prev_level_node`: Reference to the node on the previous level.
+
+    The node is slotted, so it carries no per-instance `__dict__`.
     """
 
+    __slots__ = ("_value", "_prev_node", "_next_node", "_prev_level_node", "_next_level_node")
+
     def __init__(
             self,
             value: Any,
@@ -165,6 +189,552 @@ class SpiderWebNode:
         return f"SpiderWebNode(value={self._value})"
 
 
+class ReadWriteLock:
+    """
+    A reentrant readers-writer lock. Any number of threads may hold the read lock at the same time,
+    while the write lock is exclusive. Waiting writers take precedence over new readers, so a steady
+    stream of readers cannot starve a writer.
+
+    A thread that holds the write lock may also take the read lock. Upgrading a held read lock to the
+    write lock is not supported, because two upgrading readers would wait for each other forever.
+
+    Under CPython's GIL the readers do not run in parallel, and taking the read lock costs more than a
+    plain mutex. For short reads such as `get`, benchmarks/contention_benchmark.py measures a lower read
+    throughput than a single global mutex at every reader count, about 4% to 22% lower.
+
+    Example Usage:
+        >>> lock = ReadWriteLock()
+        >>> with lock.read_locked():
+        ...     pass
+    """
+
+    def __init__(self):
+        # Every thread keeps the depth of its own read lock, so reentrant reads take no lock at all. The
+        # read path takes the plain lock, and only goes through the condition when it has to wait or to
+        # wake a waiting writer, which keeps uncontended reads cheap.
+        self._mutex = threading.Lock()
+        self._condition = threading.Condition(self._mutex)
+        self._local = threading.local()
+        self._readers: int = 0
+        self._writer: Optional[int] = None
+        self._writer_depth: int = 0
+        self._waiting_writers: int = 0
+
+    def acquire_read(self) -> None:
+        """
+        Acquires the read lock, waiting while another thread holds or waits for the write lock.
+
+        :rtype: None
+        """
+        local = self._local
+        depth = getattr(local, "read_depth", 0)
+        if depth:
+            local.read_depth = depth + 1
+            return
+        with self._mutex:
+            if (self._writer is not None or self._waiting_writers) and self._writer != threading.get_ident():
+                while self._writer is not None or self._waiting_writers:
+                    self._condition.wait()
+            self._readers += 1
+        local.read_depth = 1
+
+    def release_read(self) -> None:
+        """
+        Releases the read lock held by the current thread.
+
+        :rtype: None
+        :raises RuntimeError: If the current thread does not hold the read lock.
+        """
+        local = self._local
+        depth = getattr(local, "read_depth", 0)
+        if not depth:
+            raise RuntimeError("Cannot release a read lock that is not held.")
+        local.read_depth = depth - 1
+        if depth > 1:
+            return
+        with self._mutex:
+            self._readers -= 1
+            # Only writers wait for the readers to leave.
+            if not self._readers and self._waiting_writers:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """
+        Acquires the write lock, waiting until no other thread holds the read or the write lock.
+
+        :rtype: None
+        :raises RuntimeError: If the current thread holds the read lock without the write lock.
+        """
+        thread_id = threading.get_ident()
+        with self._condition:
+            if self._writer == thread_id:
+                self._writer_depth += 1
+                return
+            if getattr(self._local, "read_depth", 0):
+                raise RuntimeError("Cannot upgrade a read lock to a write lock.")
+
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = thread_id
+            self._writer_depth = 1
+
+    def release_write(self) -> None:
+        """
+        Releases the write lock held by the current thread.
+
+        :rtype: None
+        :raises RuntimeError: If the current thread does not hold the write lock.
+        """
+        with self._condition:
+            if self._writer != threading.get_ident():
+                raise RuntimeError("Cannot release a write lock that is not held.")
+            self._writer_depth -= 1
+            if self._writer_depth == 0:
+                self._writer = None
+                self._condition.notify_all()
+
+    def wait_for(self, predicate: Callable[[], bool]) -> None:
+        """
+        Waits until the predicate holds, while the current thread holds the write lock. Like
+        :meth:`threading.Condition.wait_for`, the write lock is released while waiting and held again
+        whenever the predicate is evaluated, so other threads can read and write in the meantime.
+
+        :param predicate: The condition to wait for.
+        :type predicate: Callable[[], bool]
+        :rtype: None
+        :raises RuntimeError: If the current thread does not hold the write lock.
+        """
+        thread_id = threading.get_ident()
+        with self._condition:
+            if self._writer != thread_id:
+                raise RuntimeError("Cannot wait without holding the write lock.")
+            depth = self._writer_depth
+            while not predicate():
+                self._writer = None
+                self._writer_depth = 0
+                self._condition.notify_all()
+                self._condition.wait()
+
+                self._waiting_writers += 1
+                try:
+                    while self._writer is not None or self._readers:
+                        self._condition.wait()
+                finally:
+                    self._waiting_writers -= 1
+                self._writer = thread_id
+                self._writer_depth = depth
+
+    @contextmanager
+    def read_locked(self) -> Iterator[None]:
+        """
+        Holds the read lock for the duration of a `with` block.
+        """
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self) -> Iterator[None]:
+        """
+        Holds the write lock for the duration of a `with` block.
+        """
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+def _operation_name(method: Callable) -> str:
+    # The name an operation is counted under by SpiderWeb.stats, private helpers drop their underscore.
+    name = method.__name__
+    return name if name.startswith("__") else name.lstrip("_")
+
+
+def _read_operation(method: Callable) -> Callable:
+    # Runs the method under the read lock when the SpiderWeb was created with thread_safe=True.
+    name = _operation_name(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._stats is not None and self._stats.is_idle():
+            return self._stats.measure(name, wrapper, self, args, kwargs)
+        lock = self._lock
+        if lock is None:
+            return method(self, *args, **kwargs)
+        lock.acquire_read()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            lock.release_read()
+
+    return wrapper
+
+
+def _measured_operation(method: Callable) -> Callable:
+    # Only measures the method for SpiderWeb.stats, for an operation that takes the locks itself.
+    name = _operation_name(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._stats is not None and self._stats.is_idle():
+            return self._stats.measure(name, wrapper, self, args, kwargs)
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _write_operation(method: Callable) -> Callable:
+    # Runs the method under the write lock when the SpiderWeb was created with thread_safe=True,
+    # after giving the SpiderWeb nodes of its own if it still shares them with a snapshot.
+    return _mutating_operation(method, append=False)
+
+
+def _append_operation(method: Callable) -> Callable:
+    # Like _write_operation, but a SpiderWeb that only appends after its last node keeps sharing
+    # its nodes with its snapshots, because a snapshot never looks past its own last node.
+    return _mutating_operation(method, append=True)
+
+
+def _mutating_operation(method: Callable, append: bool) -> Callable:
+    name = _operation_name(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._stats is not None and self._stats.is_idle():
+            return self._stats.measure(name, wrapper, self, args, kwargs)
+        lock = self._lock
+        if lock is None:
+            if self._shared:
+                self._unshare(append)
+            result = method(self, *args, **kwargs)
+            # An attached journal is compacted between operations, when the SpiderWeb is consistent.
+            if self._journal is not None and self._journal.compaction_due:
+                self._journal.compact()
+            return result
+        lock.acquire_write()
+        try:
+            if self._shared:
+                self._unshare(append)
+            result = method(self, *args, **kwargs)
+            if self._journal is not None and self._journal.compaction_due:
+                self._journal.compact()
+            return result
+        finally:
+            lock.release_write()
+
+    return wrapper
+
+
+class _ValueIndex:
+    # Maps every hashable value of a SpiderWeb to the ordered deque of its absolute positions.
+    # The flat position of an element is its absolute position minus the origin, so adding or
+    # removing at the front only moves the origin instead of renumbering every position. The
+    # deques keep adding and removing at either end O(1) for values with many duplicates.
+
+    def __init__(self):
+        self._positions: Dict[Any, Deque[int]] = {}
+        self._origin: int = 0
+        self._unhashable: int = 0
+
+    def is_complete(self) -> bool:
+        # An unhashable value could still compare equal to a hashable one, so lookups only trust
+        # the index while every stored value is hashable.
+        return self._unhashable == 0
+
+    def add_last(self, value: Any, size: int) -> None:
+        try:
+            self._positions.setdefault(value, collections.deque()).append(self._origin + size)
+        except TypeError:
+            self._unhashable += 1
+
+    def add_first(self, value: Any) -> None:
+        self._origin -= 1
+        try:
+            self._positions.setdefault(value, collections.deque()).appendleft(self._origin)
+        except TypeError:
+            self._unhashable += 1
+
+    def remove_first(self, value: Any) -> None:
+        self._discard(value, collections.deque.popleft)
+        self._origin += 1
+
+    def remove_last(self, value: Any) -> None:
+        self._discard(value, collections.deque.pop)
+
+    def replace(self, position: int, old_value: Any, new_value: Any) -> None:
+        absolute = self._origin + position
+        try:
+            positions = self._positions[old_value]
+            del positions[bisect.bisect_left(positions, absolute)]
+            if not positions:
+                del self._positions[old_value]
+        except TypeError:
+            self._unhashable -= 1
+        try:
+            bisect.insort(self._positions.setdefault(new_value, collections.deque()), absolute)
+        except TypeError:
+            self._unhashable += 1
+
+    def insert(self, position: int, value: Any) -> None:
+        # Every element from `position` on moves one position further.
+        absolute = self._origin + position
+        self._shift(absolute, 1)
+        try:
+            bisect.insort(self._positions.setdefault(value, collections.deque()), absolute)
+        except TypeError:
+            self._unhashable += 1
+
+    def remove(self, position: int, value: Any) -> None:
+        absolute = self._origin + position
+        try:
+            positions = self._positions[value]
+            del positions[bisect.bisect_left(positions, absolute)]
+            if not positions:
+                del self._positions[value]
+        except TypeError:
+            self._unhashable -= 1
+        self._shift(absolute + 1, -1)
+
+    def clear(self) -> None:
+        self._positions.clear()
+        self._origin = 0
+        self._unhashable = 0
+
+    def first(self, value: Any) -> Optional[int]:
+        positions = self._positions.get(value)
+        return None if positions is None else positions[0] - self._origin
+
+    def last(self, value: Any) -> Optional[int]:
+        positions = self._positions.get(value)
+        return None if positions is None else positions[-1] - self._origin
+
+    def count(self, value: Any) -> int:
+        positions = self._positions.get(value)
+        return 0 if positions is None else len(positions)
+
+    def _shift(self, absolute: int, step: int) -> None:
+        # Takes the positions from `absolute` on off the right end and puts them back moved, indexing into
+        # the middle of a deque is not O(1).
+        for positions in self._positions.values():
+            moved = []
+            while positions and positions[-1] >= absolute:
+                moved.append(positions.pop() + step)
+            positions.extend(reversed(moved))
+
+    def _discard(self, value: Any, pop: Callable[[Deque[int]], int]) -> None:
+        try:
+            positions = self._positions[value]
+        except TypeError:
+            self._unhashable -= 1
+            return
+        pop(positions)
+        if not positions:
+            del self._positions[value]
+
+
+class OperationStats(NamedTuple):
+    """
+    The statistics of one SpiderWeb operation, as returned by :meth:`SpiderWeb.stats`. `histogram` counts the
+    calls per latency bucket, from "<1us" up to ">=1s" in powers of ten.
+    """
+    calls: int
+    hops: int
+    max_hops: int
+    seconds: float
+    max_seconds: float
+    histogram: Dict[str, int]
+
+
+_LATENCY_BOUNDS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+_LATENCY_BUCKETS = ("<1us", "<10us", "<100us", "<1ms", "<10ms", "<100ms", "<1s", ">=1s")
+
+
+class SlowOperation(NamedTuple):
+    """
+    Describes an operation that went over the budget set with :meth:`SpiderWeb.on_slow_op`. `level` and `index`
+    are the position the operation reached, or None when it has none, and `stack` summarizes the callers as
+    "file:line in function", starting with the innermost caller outside of the SpiderWeb.
+    """
+    operation: str
+    args: tuple
+    kwargs: Dict[str, Any]
+    level: Optional[int]
+    index: Optional[int]
+    hops: int
+    seconds: float
+    stack: Tuple[str, ...]
+
+
+SLOW_OPERATIONS = ("get", "get_node", "set", "index_of", "last_index_of", "copy", "clear")
+_LOGGER = logging.getLogger(__name__)
+
+
+class _SlowOperationHook:
+    # Reports the operations that go over a hop or time budget, to a callback or to a logger.
+
+    _STACK_DEPTH = 5
+
+    def __init__(
+            self,
+            callback: Optional[Callable[[SlowOperation], Any]],
+            threshold_hops: Optional[int],
+            threshold_seconds: Optional[float],
+            sample_rate: float,
+            operations: Iterable[str],
+            logger: logging.Logger
+    ):
+        self._callback = callback
+        self._threshold_hops = threshold_hops
+        self._threshold_seconds = threshold_seconds
+        self._sample_rate = sample_rate
+        self._operations = frozenset(operations)
+        self._logger = logger
+
+    def check(self, name: str, args: tuple, kwargs: dict, result: Any, hops: int, seconds: float) -> None:
+        if name not in self._operations:
+            return
+        if not ((self._threshold_hops is not None and hops > self._threshold_hops)
+                or (self._threshold_seconds is not None and seconds > self._threshold_seconds)):
+            return
+        if self._sample_rate < 1.0 and random.random() >= self._sample_rate:
+            return
+
+        if name in ("index_of", "last_index_of"):
+            level, index = result["level"], result["index"]
+        elif name in ("get", "get_node", "set"):
+            # They take the level and the index first, each either positionally or by name.
+            arguments = {**kwargs, **dict(zip(("level", "index"), args))}
+            level, index = arguments.get("level"), arguments.get("index")
+        else:
+            level, index = None, None
+        event = SlowOperation(name, args, kwargs, level, index, hops, seconds, self._caller_stack())
+
+        if self._callback is not None:
+            self._callback(event)
+        else:
+            self._logger.warning(
+                "Slow SpiderWeb operation %s(%s) reached level %s, index %s after %d hops in %.3f ms, called from %s",
+                name, ", ".join(reprlib.repr(argument) for argument in args), level, index, hops, seconds * 1000,
+                " <- ".join(event.stack), extra={"slow_operation": event}
+            )
+
+    def _caller_stack(self) -> Tuple[str, ...]:
+        frames = [frame for frame in traceback.extract_stack() if frame.filename != __file__]
+        return tuple(
+            f"{os.path.basename(frame.filename)}:{frame.lineno} in {frame.name}"
+            for frame in reversed(frames[-self._STACK_DEPTH:])
+        )
+
+
+class _Stats:
+    # Measures the operations of a SpiderWeb, for the statistics of SpiderWeb.stats and for the slow
+    # operation hook. Only the outermost operation of a call is measured, the node hops of the operations
+    # it calls internally count towards it.
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._operations: Dict[str, List[Any]] = {}
+        self.collecting: bool = False
+        self.slow_operation_hook: Optional[_SlowOperationHook] = None
+
+    def is_idle(self) -> bool:
+        return not getattr(self._local, "active", False)
+
+    def add_hops(self, hops: int) -> None:
+        local = self._local
+        if getattr(local, "active", False):
+            local.hops += hops
+
+    def measure(self, name: str, operation: Callable, spider_web: 'SpiderWeb', args: tuple, kwargs: dict) -> Any:
+        local = self._local
+        local.active = True
+        local.hops = 0
+        started = time.perf_counter()
+        try:
+            result = operation(spider_web, *args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - started
+            local.active = False
+            if self.collecting:
+                self._record(name, local.hops, seconds)
+
+        if self.slow_operation_hook is not None:
+            self.slow_operation_hook.check(name, args, kwargs, result, local.hops, seconds)
+        return result
+
+    def _record(self, name: str, hops: int, seconds: float) -> None:
+        with self._lock:
+            counters = self._operations.get(name)
+            if counters is None:
+                counters = self._operations[name] = [0, 0, 0, 0.0, 0.0, [0] * len(_LATENCY_BUCKETS)]
+            counters[0] += 1
+            counters[1] += hops
+            counters[2] = max(counters[2], hops)
+            counters[3] += seconds
+            counters[4] = max(counters[4], seconds)
+            counters[5][bisect.bisect_right(_LATENCY_BOUNDS, seconds)] += 1
+
+    def snapshot(self) -> Dict[str, OperationStats]:
+        with self._lock:
+            return {
+                name: OperationStats(calls, hops, max_hops, seconds, max_seconds, dict(zip(_LATENCY_BUCKETS, buckets)))
+                for name, (calls, hops, max_hops, seconds, max_seconds, buckets) in self._operations.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._operations = {}
+
+
+class AggregateSummary(NamedTuple):
+    """
+    The count, sum, smallest and largest value of a range of elements, as computed by the default
+    aggregate of :meth:`SpiderWeb.aggregate`.
+    """
+    count: int
+    sum: Any
+    min: Any
+    max: Any
+
+
+class AggregateMonoid(NamedTuple):
+    """
+    Describes how :meth:`SpiderWeb.aggregate` summarizes elements. `lift` turns a single element into a
+    summary and `combine` merges two summaries of adjacent ranges, and must be associative. An empty
+    range has no summary and aggregates to None.
+
+    Example Usage:
+        >>> product = AggregateMonoid(lift=lambda value: value, combine=lambda left, right: left * right)
+    """
+    lift: Callable[[Any], Any]
+    combine: Callable[[Any, Any], Any]
+
+
+def _lift_summary(value: Any) -> AggregateSummary:
+    return AggregateSummary(1, value, value, value)
+
+
+def _combine_summaries(left: AggregateSummary, right: AggregateSummary) -> AggregateSummary:
+    return AggregateSummary(
+        left.count + right.count,
+        left.sum + right.sum,
+        min(left.min, right.min),
+        max(left.max, right.max)
+    )
+
+
+# Built from module level functions, so a SpiderWeb with aggregates enabled can be pickled.
+SUMMARY_MONOID = AggregateMonoid(lift=_lift_summary, combine=_combine_summaries)
+
+
 class SpiderWeb:
     """
         SpiderWeb is a custom data structure designed to organize elements in a hierarchical
@@ -182,19 +752,54 @@ class SpiderWeb:
 
         Attributes:
             - `max_element_per_level`: The maximum number of elements allowed per level (6).
+            - `thread_safe`: Guards the SpiderWeb with a :class:`ReadWriteLock`, so many threads can read
+              it concurrently while mutations are serialized (False).
+            - `index_values`: Keeps an index from every hashable value to its positions, so `index_of`,
+              `last_index_of`, `count` and `in` take O(1) on average (False).
+            - `capacity`: The maximum number of elements, or None for no limit (None).
+            - `overflow`: What adding to a full SpiderWeb does. "drop_oldest" evicts the first element and
+              reuses its node, "drop_newest" ignores the new element, and "block" waits until another thread
+              removes an element, which requires `thread_safe` ("drop_oldest").
 
         """
 
-    def __init__(self, max_element_per_level: int = 6):
+    OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+    def __init__(
+            self,
+            max_element_per_level: int = 6,
+            thread_safe: bool = False,
+            index_values: bool = False,
+            capacity: Optional[int] = None,
+            overflow: str = "drop_oldest"
+    ):
+        if capacity is not None and capacity < 1:
+            raise ValueError(f"Invalid capacity: {capacity}. The capacity must be at least 1.")
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}. Expected one of {self.OVERFLOW_POLICIES}.")
+        if overflow == "block" and not thread_safe:
+            raise ValueError("The block overflow policy requires thread_safe=True.")
+
         self._first: Optional[SpiderWebNode] = None
         self._last: Optional[SpiderWebNode] = None
         self._prev_level: Optional[SpiderWebNode] = None
         self._level: int = 0
         self._index: int = 0
-        self._tmp_level: int = 0
-        self._tmp_index: int = 0
         self._size: int = 0
         self._max_element_per_level = max_element_per_level
+        self._lock: Optional[ReadWriteLock] = ReadWriteLock() if thread_safe else None
+        self._value_index: Optional[_ValueIndex] = _ValueIndex() if index_values else None
+        self._aggregate_monoid: Optional[AggregateMonoid] = None
+        self._level_aggregates: Dict[int, Any] = {}
+        self._shared: bool = False
+        self._is_snapshot: bool = False
+        self._snapshots: Optional[weakref.WeakSet] = None
+        self._node_ranks: Optional[Dict[SpiderWebNode, int]] = None
+        self._capacity: Optional[int] = capacity
+        self._overflow: str = overflow
+        self._spare_node: Optional[SpiderWebNode] = None
+        self._journal: Optional[Any] = None
+        self._stats: Optional[_Stats] = None
 
     # Getter methods for accessing SpiderWeb properties
 
@@ -251,6 +856,16 @@ class SpiderWeb:
             return self._max_element_per_level - 1
         return self._index - 1
 
+    def get_capacity(self) -> Optional[int]:
+        """
+        Gets the maximum number of elements of the SpiderWeb.
+
+        :return: The capacity of the SpiderWeb, or None if it is unbounded.
+        :rtype: Optional[int]
+        """
+        return self._capacity
+
+    @_read_operation
     def get_first(self) -> Any:
         """
         Returns the value of the first element in the SpiderWeb.
@@ -263,6 +878,7 @@ class SpiderWeb:
             raise IndexError("SpiderWeb is empty, no first element available.")
         return self._first.get_value()
 
+    @_read_operation
     def get_last(self) -> Any:
         """
         Returns the value of the last element in the SpiderWeb.
@@ -297,29 +913,9 @@ class SpiderWeb:
         self._index = 0
         self._size = 0
 
-    def _reset_tmp_variables(self) -> None:
-        self._tmp_level = 0
-        self._tmp_index = 0
-
-    def _reset_tmp_variables_last(self) -> None:
-        self._tmp_index = self._index - 1
-        if self._tmp_index < 0:
-            self._tmp_index = self._max_element_per_level - 1
-            self._tmp_level = self._level - 1
-        else:
-            self._tmp_level = self._level
-
-    def _next_index(self) -> None:
-        self._tmp_index += 1
-        if self._tmp_index == self._max_element_per_level:
-            self._tmp_level += 1
-            self._tmp_index = 0
-
-    def _prev_index(self) -> None:
-        self._tmp_index -= 1
-        if self._tmp_index == -1:
-            self._tmp_level -= 1
-            self._tmp_index = self._max_element_per_level - 1
+    def _position_to_result(self, position: int) -> Dict[str, int]:
+        level, index = divmod(position, self._max_element_per_level)
+        return {"level": level, "index": index}
 
     def _increment_index(self) -> None:
         self._index += 1
@@ -345,27 +941,234 @@ class SpiderWeb:
     def _is_valid_level_and_index(self, level: int, index: int) -> bool:
         return (0 <= level <= self.get_level()) and (0 <= index <= self.get_maximum_index_for_level(level))
 
+    def _write_locked(self) -> ContextManager[None]:
+        if self._lock is None:
+            return nullcontext()
+        return self._lock.write_locked()
+
+    def _journal_record(self, operation: str, *arguments: Any) -> Optional[bytes]:
+        # A mutation encodes its journal record before it changes anything, so a value the journal cannot
+        # encode fails the mutation instead of leaving the SpiderWeb ahead of its log.
+        return None if self._journal is None else self._journal.encode(operation, *arguments)
+
+    def _write_journal(self, record: Optional[bytes]) -> None:
+        if record is not None:
+            self._journal.write(record)
+
+    def _chain_values(self) -> Iterator[Any]:
+        # Reads the node slots directly and stops at the last node, which a snapshot may share with
+        # a SpiderWeb that appended after it.
+        current = self._first
+        last = self._last
+        while current is not None:
+            yield current._value
+            if current is last:
+                break
+            current = current._next_node
+
+    def _unshare(self, append: bool) -> None:
+        # A snapshot copies the shared nodes before any mutation, and leaves the snapshots of the SpiderWeb that
+        # owns the nodes. That SpiderWeb keeps appending to the shared nodes, and only copies them for other
+        # mutations while a snapshot is alive.
+        if self._is_snapshot:
+            self._clone_nodes()
+            self._snapshots.discard(self)
+        elif append:
+            return
+        elif self._snapshots:
+            self._clone_nodes()
+
+        self._shared = False
+        self._is_snapshot = False
+        self._snapshots = None
+
+    def _clone_nodes(self) -> None:
+        if self._stats is not None:
+            self._stats.add_hops(self._size)
+        clone = SpiderWeb(self._max_element_per_level)
+        clone.extend(self._chain_values())
+        self._first = clone._first
+        self._last = clone._last
+        self._prev_level = clone._prev_level
+        # The snapshots keep the nodes the SpiderWeb copies away from, handles to them no longer resolve.
+        self._node_ranks = None
+
+    def _node_position(self, node: SpiderWebNode) -> Optional[int]:
+        # The nodes are numbered on demand, by the first lookup of a node handle, so a SpiderWeb whose handles
+        # are never looked up pays no memory for them. Adding and removing at either end keeps the numbers
+        # consecutive, the position of a node is the difference to the number of the first node. An insertion
+        # or removal in the middle drops the numbers, and the next lookup numbers the nodes again in one pass.
+        node_ranks = self._node_ranks
+        if node_ranks is None:
+            if self._first is None:
+                return None
+            if self._stats is not None:
+                self._stats.add_hops(self._size)
+            node_ranks = {}
+            rank = 0
+            current = self._first
+            while current is not None:
+                node_ranks[current] = rank
+                if current is self._last:
+                    break
+                rank += 1
+                current = current._next_node
+            self._node_ranks = node_ranks
+        rank = node_ranks.get(node)
+        return None if rank is None else rank - node_ranks[self._first]
+
+    def _invalidate_aggregates(self, from_level: int = 0) -> None:
+        # Drops the cached summaries of the levels from `from_level` on, they are rebuilt on demand.
+        if from_level <= 0:
+            self._level_aggregates.clear()
+        else:
+            for level in [level for level in self._level_aggregates if level >= from_level]:
+                del self._level_aggregates[level]
+
+    def _summarize(self, current: SpiderWebNode, count: int, monoid: AggregateMonoid) -> Tuple[Any, SpiderWebNode]:
+        # Folds `count` elements starting at `current`, returns the summary and the node after them.
+        lift, combine = monoid
+        if self._stats is not None:
+            self._stats.add_hops(count)
+        summary = lift(current.get_value())
+        current = current.get_next_node()
+        for _ in range(count - 1):
+            summary = combine(summary, lift(current.get_value()))
+            current = current.get_next_node()
+        return summary, current
+
+    def _locate_node(self, level: int, index: int) -> Optional[SpiderWebNode]:
+        # Jumps whole levels through the vertical links and then steps sideways to the index,
+        # starting from whichever end of the SpiderWeb needs fewer hops. The level and index
+        # must already be validated.
+        last_level = self.get_level()
+        last_index = self.get_index()
+
+        if level + index <= (last_level - level) + abs(last_index - index):
+            if self._stats is not None:
+                self._stats.add_hops(level + index)
+            current = self._first
+            for _ in range(level):
+                current = current.get_next_level_node()
+            for _ in range(index):
+                current = current.get_next_node()
+            return current
+
+        if self._stats is not None:
+            self._stats.add_hops((last_level - level) + abs(last_index - index))
+        current = self._last
+        for _ in range(last_level - level):
+            current = current.get_prev_level_node()
+        if index < last_index:
+            for _ in range(last_index - index):
+                current = current.get_prev_node()
+        else:
+            for _ in range(index - last_index):
+                current = current.get_next_node()
+        return current
+
+    def _advance(self, current: SpiderWebNode, step: int) -> SpiderWebNode:
+        # Moves `step` positions forward, or backward for a negative step, jumping whole levels first.
+        levels, index = divmod(abs(step), self._max_element_per_level)
+        if self._stats is not None:
+            self._stats.add_hops(levels + index)
+        if step > 0:
+            for _ in range(levels):
+                current = current.get_next_level_node()
+            for _ in range(index):
+                current = current.get_next_node()
+        else:
+            for _ in range(levels):
+                current = current.get_prev_level_node()
+            for _ in range(index):
+                current = current.get_prev_node()
+        return current
+
+    def _flat_position(self, position: int) -> int:
+        flat_position = position + self._size if position < 0 else position
+        if not 0 <= flat_position < self._size:
+            raise IndexError(f"SpiderWeb index out of range: {position}")
+        return flat_position
+
+    def _make_room(self, append: bool) -> bool:
+        # Applies the overflow policy when the SpiderWeb is full, returns False when the new element has to be
+        # dropped. An evicted first node is kept as the spare node, so the next add can reuse it, unless a
+        # handle to it is still held outside the SpiderWeb, such as one returned by get_node. Reusing that
+        # node would make the stale handle refer to the new element.
+        if self._capacity is None or self._size < self._capacity:
+            return True
+        if self._overflow == "drop_newest":
+            return False
+        if self._overflow == "block":
+            self._lock.wait_for(lambda: self._size < self._capacity)
+            if self._shared:
+                self._unshare(append)
+            return True
+
+        if self._shared:
+            self._unshare(False)
+        evicted_node = self._first
+        self.remove_first()
+        # Only the local variable and the argument of getrefcount refer to an unreferenced node.
+        if _getrefcount is not None and _getrefcount(evicted_node) <= 2:
+            self._spare_node = evicted_node
+        return True
+
+    def _relink_levels(self, current: SpiderWebNode, position: int, stop: int) -> None:
+        # Points every node from `current`, at the flat `position`, up to the flat position `stop` at the node
+        # max_element_per_level positions further, and that node back at it. Only the horizontal links are
+        # followed, because the vertical links around an inserted or removed node are not valid yet.
+        below = current
+        for _ in range(self._max_element_per_level - 1):
+            below = below.get_next_node() if below is not None else None
+        if position == 0 and below is not None:
+            # The last node of the first level may have been on the second level before.
+            below.set_prev_level_node(None)
+        below = below.get_next_node() if below is not None else None
+
+        for _ in range(position, stop):
+            current.set_next_level_node(below)
+            if below is not None:
+                below.set_prev_level_node(current)
+                below = below.get_next_node()
+            current = current.get_next_node()
+
+    def _reset_prev_level(self) -> None:
+        if self._size < self._max_element_per_level:
+            self._prev_level = None
+        elif self._size == self._max_element_per_level:
+            self._prev_level = self._first
+        else:
+            self._prev_level = self._last.get_prev_level_node().get_next_node()
+
     def _add_first_node(self, new_node: Optional[SpiderWebNode]) -> None:
+        if self._node_ranks is not None:
+            self._node_ranks[new_node] = 0 if self._first is None else self._node_ranks[self._first] - 1
         if self._first is None:
             self._first = new_node
             self._last = new_node
         else:
-            self._first.set_prev_node(new_node)
-            new_node.set_next_node(self._first)
+            old_first = self._first
+            old_first.set_prev_node(new_node)
+            new_node.set_next_node(old_first)
             self._first = new_node
 
+            # Every other element moves one position further, so all existing vertical links stay valid and
+            # only the new head needs one. The node below it is the old node at index max_element_per_level - 1,
+            # found right before the node below the old head, or as the last node when there is none.
             if self._size >= self._max_element_per_level:
-                tmp_pointer = self._first
-                for i in range(self._max_element_per_level):
-                    tmp_pointer = tmp_pointer.get_next_node()
+                old_next_level = old_first.get_next_level_node()
+                next_level = self._last if old_next_level is None else old_next_level.get_prev_node()
 
-                self._first.set_next_level_node(tmp_pointer)
-                tmp_pointer.set_prev_level_node(self._first)
+                new_node.set_next_level_node(next_level)
+                next_level.set_prev_level_node(new_node)
 
         self._increment_index()
         self._increment_size()
 
     def _add_last_node(self, new_node: Optional[SpiderWebNode]) -> None:
+        if self._node_ranks is not None:
+            self._node_ranks[new_node] = 0 if self._last is None else self._node_ranks[self._last] + 1
         if self._first is None:
             self._first = new_node
             self._last = new_node
@@ -404,6 +1207,7 @@ class SpiderWeb:
 
         return self.get_index()
 
+    @_read_operation
     def print(self) -> None:
         """
         Prints the elements of the SpiderWeb along with their levels and indices.
@@ -412,46 +1216,79 @@ class SpiderWeb:
 
         :rtype: None
         """
-        current: Optional[SpiderWebNode] = self._first
-        self._reset_tmp_variables()
-        while current is not None:
-            print(f"level: {self._tmp_level}, index: {self._tmp_index}, value: {current.get_value()}")
-            current = current.get_next_node()
-            self._next_index()
+        if self._stats is not None:
+            self._stats.add_hops(max(self._size - 1, 0))
+        for level, index, value in self.iter_with_positions():
+            print(f"level: {level}, index: {index}, value: {value}")
 
+    @_append_operation
     def add(self, value: Any) -> None:
         """
         Adds the specified element or SpiderWebNode to the end of the SpiderWeb.
+        When a bounded SpiderWeb is full, the overflow policy decides what happens. With "drop_oldest", the
+        first element is evicted in O(1) and its node is reused for the new element, so a sliding window
+        allocates no nodes once it is full. A node still held outside the SpiderWeb is not reused.
 
         :param value: The value to be added to the end of the SpiderWeb.
         :type value: Any
         :rtype: None
         """
+        record = self._journal_record("add", value.get_value() if isinstance(value, SpiderWebNode) else value)
+        if self._capacity is not None and not self._make_room(append=True):
+            return
+
         if isinstance(value, SpiderWebNode):
             new_node = value
             new_node.reset_pointers()
             new_node.set_prev_node(self._last)
             new_node.set_prev_level_node(self._prev_level)
+        elif self._spare_node is not None:
+            new_node = self._spare_node
+            self._spare_node = None
+            new_node.set_value(value)
+            new_node.set_prev_node(self._last)
+            new_node.set_prev_level_node(self._prev_level)
         else:
             new_node = SpiderWebNode(value, self._last, self._prev_level)
 
+        if self._value_index is not None:
+            self._value_index.add_last(new_node.get_value(), self._size)
+        if self._aggregate_monoid is not None:
+            level, index = divmod(self._size, self._max_element_per_level)
+            summary = self._aggregate_monoid.lift(new_node.get_value())
+            if index == 0:
+                self._level_aggregates[level] = summary
+            elif level in self._level_aggregates:
+                self._level_aggregates[level] = self._aggregate_monoid.combine(self._level_aggregates[level], summary)
         self._add_last_node(new_node)
+        self._write_journal(record)
 
+    @_write_operation
     def add_first(self, value: Any) -> None:
         """
-        Adds the specified element or SpiderWebNode to the beginning of the SpiderWeb.
+        Adds the specified element or SpiderWebNode to the beginning of the SpiderWeb in O(1).
+        Every existing element moves one position further, and the level links stay consistent.
+        On a full bounded SpiderWeb, the overflow policy applies as in :meth:`add`.
 
         :param value: The value to be added to the beginning of the SpiderWeb.
         :type value: Any
         :rtype: None
         """
+        record = self._journal_record("add_first", value.get_value() if isinstance(value, SpiderWebNode) else value)
+        if self._capacity is not None and not self._make_room(append=False):
+            return
+
         if isinstance(value, SpiderWebNode):
             new_node = value
             new_node.reset_pointers()
         else:
             new_node = SpiderWebNode(value)
 
+        if self._value_index is not None:
+            self._value_index.add_first(new_node.get_value())
+        self._invalidate_aggregates()
         self._add_first_node(new_node)
+        self._write_journal(record)
 
     def add_last(self, value: Any) -> None:
         """
@@ -463,9 +1300,101 @@ class SpiderWeb:
         """
         self.add(value)
 
+    @_append_operation
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Adds every element of the iterable to the end of the SpiderWeb. The horizontal and vertical links
+        are built in a single pass and the level bookkeeping is updated once at the end, which is much
+        faster than calling :meth:`add` per element. The iterable is consumed lazily, so generators
+        never need to be materialized. Every element is stored as a value, SpiderWebNode objects included.
+
+        Example Usage:
+            >>> spider_web.extend(range(10))
+
+        :param iterable: The elements to be added to the end of the SpiderWeb.
+        :type iterable: Iterable[Any]
+        :rtype: None
+        """
+        if self._capacity is not None:
+            # Every element may evict another one, the overflow policy is applied per element.
+            for value in iterable:
+                self.add(value)
+            return
+
+        record = None
+        if self._journal is not None:
+            # The journal needs the values as well, so a generator is materialized first.
+            iterable = list(iterable)
+            record = self._journal_record("extend", iterable)
+        max_element_per_level = self._max_element_per_level
+        value_index = self._value_index
+        self._invalidate_aggregates(self._size // max_element_per_level)
+        first = self._first
+        last = self._last
+        prev_level = self._prev_level
+        size = self._size
+        node_ranks = self._node_ranks
+        rank = 0 if last is None or node_ranks is None else node_ranks[last] + 1 - size
+
+        # The loop writes the node slots directly, the setters would double the cost per element.
+        try:
+            for value in iterable:
+                new_node = SpiderWebNode(value, last, prev_level)
+                if node_ranks is not None:
+                    node_ranks[new_node] = rank + size
+                if last is None:
+                    first = new_node
+                else:
+                    last._next_node = new_node
+                    if prev_level is not None:
+                        prev_level._next_level_node = new_node
+                        prev_level = prev_level._next_node
+                last = new_node
+                if value_index is not None:
+                    value_index.add_last(value, size)
+                size += 1
+                if size == max_element_per_level:
+                    prev_level = first
+        finally:
+            self._first = first
+            self._last = last
+            self._prev_level = prev_level
+            if record is not None and size > self._size:
+                if size - self._size < len(iterable):
+                    # The loop failed part of the way, only the elements that were added are recorded.
+                    record = self._journal_record("extend", iterable[:size - self._size])
+                self._write_journal(record)
+            if self._stats is not None:
+                self._stats.add_hops(size - self._size)
+            self._size = size
+            self._level, self._index = divmod(size, max_element_per_level)
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[Any], max_element_per_level: int = 6, **kwargs) -> 'SpiderWeb':
+        """
+        Creates a SpiderWeb holding the elements of the iterable, built in a single pass by :meth:`extend`.
+
+        Example Usage:
+            >>> spider_web = SpiderWeb.from_iterable(range(10), 3)
+
+        :param iterable: The elements of the new SpiderWeb.
+        :type iterable: Iterable[Any]
+        :param max_element_per_level: The maximum number of elements allowed per level.
+        :type max_element_per_level: int
+        :param kwargs: Further SpiderWeb options, such as `thread_safe` or `index_values`.
+        :return: The new SpiderWeb.
+        :rtype: SpiderWeb
+        """
+        spider_web = cls(max_element_per_level, **kwargs)
+        spider_web.extend(iterable)
+        return spider_web
+
+    @_read_operation
     def index_of(self, item: Any = None, node: Optional[SpiderWebNode] = None) -> Dict[str, int]:
         """
         Searches for the specified element or object in the SpiderWeb and returns its level and index.
+        With `index_values` enabled, searching for a hashable element takes O(1) on average. A node of this
+        SpiderWeb is found in O(1) from its number, the first lookup of a node numbers the nodes in O(n).
 
         :param item: The element to search for in the SpiderWeb. If None, the search is based on the node.
         :type item: Any
@@ -475,25 +1404,42 @@ class SpiderWeb:
                  If the element or object is not found, returns {"level": None, "index": None}.
         :rtype: Dict[str, int]
         """
+        if isinstance(node, SpiderWebNode):
+            position = self._node_position(node)
+            return {"level": None, "index": None} if position is None else self._position_to_result(position)
+        if node is None and self._value_index is not None and self._value_index.is_complete():
+            try:
+                position = self._value_index.first(item)
+            except TypeError:
+                pass
+            else:
+                return {"level": None, "index": None} if position is None else self._position_to_result(position)
+
         current = self._first
-        result = {"level": None, "index": None}
-        self._reset_tmp_variables()
+        position = 0
 
         while current is not None:
             if (node is not None and current == node) or (node is None and current.get_value() == item):
-                result["level"] = self._tmp_level
-                result["index"] = self._tmp_index
-                return result
+                if self._stats is not None:
+                    self._stats.add_hops(position)
+                return self._position_to_result(position)
+            if current is self._last:
+                break
 
-            self._next_index()
+            position += 1
             current = current.get_next_node()
 
-        return result
+        if self._stats is not None:
+            self._stats.add_hops(position)
+        return {"level": None, "index": None}
 
+    @_read_operation
     def last_index_of(self, item: Any = None, node: Optional[SpiderWebNode] = None) -> Dict[str, int]:
         """
         Searches for the last occurrence of the specified element or object in the SpiderWeb
-        and returns its level and index.
+        and returns its level and index. With `index_values` enabled, searching for a hashable
+        element takes O(1) on average. A node of this SpiderWeb is found in O(1) from its number, the first lookup
+        of a node numbers the nodes in O(n).
 
         :param item: The element to search for in the SpiderWeb. If None, the search is based on the node.
         :type item: Any
@@ -503,24 +1449,39 @@ class SpiderWeb:
                  If the element or object is not found, returns {"level": None, "index": None}.
         :rtype: Dict[str, int]
         """
+        if isinstance(node, SpiderWebNode):
+            position = self._node_position(node)
+            return {"level": None, "index": None} if position is None else self._position_to_result(position)
+        if node is None and self._value_index is not None and self._value_index.is_complete():
+            try:
+                position = self._value_index.last(item)
+            except TypeError:
+                pass
+            else:
+                return {"level": None, "index": None} if position is None else self._position_to_result(position)
+
         current = self._last
-        result = {"level": None, "index": None}
-        self._reset_tmp_variables_last()
+        position = self._size - 1
 
         while current is not None:
             if (node is not None and current == node) or (node is None and current.get_value() == item):
-                result["level"] = self._tmp_level
-                result["index"] = self._tmp_index
-                return result
+                if self._stats is not None:
+                    self._stats.add_hops(self._size - 1 - position)
+                return self._position_to_result(position)
 
-            self._prev_index()
+            position -= 1
             current = current.get_prev_node()
 
-        return result
+        if self._stats is not None:
+            self._stats.add_hops(max(self._size - 1, 0))
+        return {"level": None, "index": None}
 
+    @_read_operation
     def get(self, level: int, index: int) -> Any:
         """
         Returns the element at the specified level and index in the SpiderWeb.
+        The element is reached through the vertical level links, which costs
+        O(level + max_element_per_level) node hops instead of a walk over every preceding element.
 
         :param level: The level of the desired element (non-negative).
         :type level: int
@@ -534,21 +1495,17 @@ class SpiderWeb:
         if not self._is_valid_level_and_index(level, index):
             raise ValueError(f"Invalid level or index. Level: {level}, Index: {index}")
 
-        self._reset_tmp_variables()
-        current = self._first
-
-        while current is not None:
-            if self._tmp_level == level and self._tmp_index == index:
-                return current.get_value()
-
-            self._next_index()
-            current = current.get_next_node()
+        current = self._locate_node(level, index)
+        if current is None:
+            raise RuntimeError(f"Failed to get element. Level: {level}, Index: {index}")
 
-        raise RuntimeError(f"Failed to get element. Level: {level}, Index: {index}")
+        return current.get_value()
 
+    @_read_operation
     def get_node(self, level: int, index: int) -> Any:
         """
         Returns the SpiderWebNode at the specified level and index in the SpiderWeb.
+        The node is reached through the vertical level links in O(level + max_element_per_level) node hops.
 
         :param level: The level of the desired SpiderWebNode (non-negative).
         :type level: int
@@ -563,22 +1520,18 @@ class SpiderWeb:
         if not self._is_valid_level_and_index(level, index):
             raise ValueError(f"Invalid level or index. Level: {level}, Index: {index}")
 
-        self._reset_tmp_variables()
-        current = self._first
-
-        while current is not None:
-            if self._tmp_level == level and self._tmp_index == index:
-                return current
+        current = self._locate_node(level, index)
+        if current is None:
+            raise RuntimeError(f"Failed to get element. Level: {level}, Index: {index}")
 
-            self._next_index()
-            current = current.get_next_node()
-
-        raise RuntimeError(f"Failed to get element. Level: {level}, Index: {index}")
+        return current
 
+    @_write_operation
     def set(self, level: int, index: int, element: Any) -> Any:
         """
         Sets the element at the specified level and index in the SpiderWeb, replacing any existing element.
         Returns the previous value at the specified position.
+        The position is reached through the vertical level links in O(level + max_element_per_level) node hops.
 
         :param level: The level at which to set the element.
         :type level: int
@@ -594,68 +1547,283 @@ class SpiderWeb:
         if not self._is_valid_level_and_index(level, index):
             raise ValueError(f"Invalid level or index. Level: {level}, Index: {index}")
 
-        self._reset_tmp_variables()
-        current = self._first
+        current = self._locate_node(level, index)
+        if current is None:
+            raise RuntimeError(f"Failed to set element. Level: {level}, Index: {index}")
 
-        while current is not None:
-            if self._tmp_level == level and self._tmp_index == index:
-                old_value = current.get_value()
-                current.set_value(element)
-                return old_value
+        record = self._journal_record("set", level, index, element)
+        old_value = current.get_value()
+        current.set_value(element)
+        if self._value_index is not None:
+            self._value_index.replace(level * self._max_element_per_level + index, old_value, element)
+        self._level_aggregates.pop(level, None)
+        self._write_journal(record)
+        return old_value
 
-            self._next_index()
-            current = current.get_next_node()
+    @_write_operation
+    def insert(self, level: int, index: int, value: Any) -> None:
+        """
+        Inserts the specified element or SpiderWebNode at the specified level and index. The element at that
+        position and every element after it move one position further.
+
+        Only the vertical links of the max_element_per_level nodes before the new node change, so they are
+        repaired in place instead of rebuilding the SpiderWeb. Reaching the position takes
+        O(level + max_element_per_level) node hops, from whichever end is closer, and the repair
+        O(max_element_per_level). With the value index enabled, the positions of the moved elements are also
+        renumbered, in O(n).
 
-        raise RuntimeError(f"Failed to set element. Level: {level}, Index: {index}")
+        On a full bounded SpiderWeb, the overflow policy applies as in :meth:`add`. When "drop_oldest" evicts
+        the first element, the new element still lands before the element that was at the position.
 
-    def remove_first(self) -> Any:
+        Example Usage:
+            >>> spider_web = SpiderWeb.from_iterable([0, 1, 3], 2)
+            >>> spider_web.insert(1, 0, 2)
+            >>> list(spider_web)
+            [0, 1, 2, 3]
+
+        :param level: The level at which to insert the element.
+        :type level: int
+        :param index: The index within the specified level at which to insert the element.
+        :type index: int
+        :param value: The value to be inserted.
+        :type value: Any
+        :rtype: None
+        :raises ValueError: If the provided level or index is neither an existing position nor the position
+                            right after the last element.
         """
-        Removes and returns the first element from the SpiderWeb.
+        position = level * self._max_element_per_level + index
+        if not (0 <= index < self._max_element_per_level and 0 <= position <= self._size):
+            raise ValueError(f"Invalid level or index. Level: {level}, Index: {index}")
+        element = value.get_value() if isinstance(value, SpiderWebNode) else value
+        record = self._journal_record("insert", level, index, element)
+        if self._capacity is not None:
+            size = self._size
+            if not self._make_room(append=False):
+                return
+            if self._overflow == "drop_oldest":
+                # An evicted first element moves the target one position back.
+                position = max(position - (size - self._size), 0)
+            if position > self._size:
+                raise ValueError(f"Invalid level or index. Level: {level}, Index: {index}")
+            level, index = divmod(position, self._max_element_per_level)
+            record = self._journal_record("insert", level, index, element)
+        if position == 0:
+            self.add_first(value)
+            return
+        if position == self._size:
+            self.add(value)
+            return
+
+        if isinstance(value, SpiderWebNode):
+            new_node = value
+            new_node.reset_pointers()
+        else:
+            new_node = SpiderWebNode(value)
+
+        next_node = self._locate_node(level, index)
+        prev_node = next_node.get_prev_node()
+        new_node.set_prev_node(prev_node)
+        new_node.set_next_node(next_node)
+        prev_node.set_next_node(new_node)
+        next_node.set_prev_node(new_node)
+
+        if self._value_index is not None:
+            self._value_index.insert(position, new_node.get_value())
+        self._write_journal(record)
+        self._invalidate_aggregates(level)
+        self._node_ranks = None
+        self._increment_index()
+        self._increment_size()
 
-        :return: The first element in the SpiderWeb.
+        start = max(position - self._max_element_per_level, 0)
+        current = new_node
+        for _ in range(position - start):
+            current = current.get_prev_node()
+        self._relink_levels(current, start, position + 1)
+        self._reset_prev_level()
+
+    @_write_operation
+    def remove_at(self, level: int, index: int) -> Any:
+        """
+        Removes and returns the element at the specified level and index. Every element after it moves one
+        position back.
+
+        Like :meth:`insert`, only the vertical links of the max_element_per_level nodes before the removed node
+        are repaired, so the removal takes O(level + max_element_per_level) node hops, plus O(n) to renumber
+        the value index when it is enabled.
+
+        :param level: The level of the element to remove.
+        :type level: int
+        :param index: The index within the specified level of the element to remove.
+        :type index: int
+        :return: The removed element.
+        :rtype: Any
+        :raises ValueError: If the provided level or index is invalid.
+        """
+        if not self._is_valid_level_and_index(level, index):
+            raise ValueError(f"Invalid level or index. Level: {level}, Index: {index}")
+
+        return self._unlink_node(self._locate_node(level, index), level * self._max_element_per_level + index)
+
+    @_measured_operation
+    def remove_node(self, node: SpiderWebNode) -> Any:
+        """
+        Removes the specified SpiderWebNode from the SpiderWeb and returns its value. The node is found
+        through its number instead of a search, so only the vertical links of the max_element_per_level
+        nodes before it need work, in O(max_element_per_level). The nodes are numbered by the first node
+        lookup, and again by the first one after an insertion or removal in the middle, in O(n).
+
+        While a snapshot is alive, the node is removed from the copy of the nodes the SpiderWeb makes first.
+        Handles to the nodes of a SpiderWeb stop resolving when another mutation copies its nodes away from a
+        live snapshot.
+
+        Example Usage:
+            >>> node = spider_web.get_node(3, 1)
+            >>> spider_web.remove_node(node)
+
+        :param node: The node to remove.
+        :type node: SpiderWebNode
+        :return: The value of the removed node.
+        :rtype: Any
+        :raises ValueError: If the node does not belong to this SpiderWeb.
+        """
+        # The position is resolved before the write copies the nodes away from a live snapshot, because the
+        # handle does not resolve in the copy.
+        with self._write_locked():
+            position = self._node_position(node) if isinstance(node, SpiderWebNode) else None
+            if position is None:
+                raise ValueError("The node does not belong to this SpiderWeb.")
+            return self._remove_node(node, position)
+
+    @_write_operation
+    def _remove_node(self, node: SpiderWebNode, position: int) -> Any:
+        if self._node_ranks is None:
+            # The nodes were copied, the node at the same position of the copy is removed instead.
+            node = self._locate_node(*divmod(position, self._max_element_per_level))
+        return self._unlink_node(node, position)
+
+    def _unlink_node(self, removed_node: SpiderWebNode, position: int) -> Any:
+        if position == 0:
+            return self.remove_first()
+        if position == self._size - 1:
+            return self.remove_last()
+
+        level = position // self._max_element_per_level
+        record = self._journal_record("remove_at", level, position % self._max_element_per_level)
+        removed_value = removed_node.get_value()
+        prev_node = removed_node.get_prev_node()
+        next_node = removed_node.get_next_node()
+        prev_node.set_next_node(next_node)
+        next_node.set_prev_node(prev_node)
+        removed_node.reset_spider_web_node()
+
+        if self._value_index is not None:
+            self._value_index.remove(position, removed_value)
+        self._write_journal(record)
+        self._invalidate_aggregates(level)
+        self._node_ranks = None
+        self._decrement_index()
+        self._decrement_size()
+
+        start = max(position - self._max_element_per_level, 0)
+        current = prev_node
+        for _ in range(position - 1 - start):
+            current = current.get_prev_node()
+        self._relink_levels(current, start, position)
+        self._reset_prev_level()
+
+        return removed_value
+
+    @_write_operation
+    def remove_first(self, count: Optional[int] = None) -> Any:
+        """
+        Removes and returns the first element from the SpiderWeb. With a `count`, removes the first `count`
+        elements at once and returns them in order, as a list. The run of nodes is cut off the chain in one
+        step and the level and index are recomputed instead of being decremented per element, so only the
+        vertical links of the first level that remains need work.
+
+        Example Usage:
+            >>> batch = spider_web.remove_first(500)
+
+        :param count: The number of elements to remove, or None to remove and return a single element.
+        :type count: Optional[int]
+        :return: The first element in the SpiderWeb, or the list of the first `count` elements.
         :rtype: Any
-        :raises IndexError: If the SpiderWeb is empty.
+        :raises IndexError: If the SpiderWeb is empty, or holds fewer than `count` elements.
+        :raises ValueError: If `count` is negative.
         """
+        if count is not None:
+            return self._cut_first(self._checked_count(count))
         if self._first is None:
             raise IndexError("Cannot remove from an empty SpiderWeb.")
 
-        next_node = self._first.get_next_node()
-        next_level = self._first.get_next_level_node()
-        first_value = self._first.get_value()
+        first_node = self._first
+        next_node = first_node.get_next_node()
+        next_level = first_node.get_next_level_node()
+        first_value = first_node.get_value()
+        if self._value_index is not None:
+            self._value_index.remove_first(first_value)
+        if self._journal is not None:
+            self._journal.append("remove_first", 1)
+        if self._node_ranks is not None:
+            del self._node_ranks[first_node]
+        self._invalidate_aggregates()
 
         if next_node is not None:
             next_node.set_prev_node(None)
-            self._first.set_next_node(None)
             if next_level is not None:
                 next_level.set_prev_level_node(None)
-                self._first.set_next_level_node(None)
+            if self._prev_level is first_node:
+                self._prev_level = None
             self._first = next_node
         else:
             self._reset_pointers()
+        first_node.reset_pointers()
 
         self._decrement_index()
         self._decrement_size()
 
         return first_value
 
-    def remove_last(self) -> Any:
+    @_write_operation
+    def remove_last(self, count: Optional[int] = None) -> Any:
         """
-        Removes and returns the last element from the SpiderWeb.
+        Removes and returns the last element from the SpiderWeb. With a `count`, removes the last `count`
+        elements at once and returns them in the order of removal, starting with the last element, as a
+        list. Like :meth:`remove_first`, the run of nodes is cut off the chain in one step.
 
-        :return: The last element in the SpiderWeb.
+        :param count: The number of elements to remove, or None to remove and return a single element.
+        :type count: Optional[int]
+        :return: The last element in the SpiderWeb, or the list of the last `count` elements.
         :rtype: Any
-        :raises IndexError: If the SpiderWeb is empty.
+        :raises IndexError: If the SpiderWeb is empty, or holds fewer than `count` elements.
+        :raises ValueError: If `count` is negative.
         """
+        if count is not None:
+            return self._cut_last(self._checked_count(count))
         if self._first is None:
             raise IndexError("Cannot remove from an empty SpiderWeb.")
 
         prev_node = self._last.get_prev_node()
         last_value = self._last.get_value()
+        if self._value_index is not None:
+            self._value_index.remove_last(last_value)
+        if self._journal is not None:
+            self._journal.append("remove_last", 1)
+        if self._node_ranks is not None:
+            del self._node_ranks[self._last]
+        self._level_aggregates.pop(self.get_level(), None)
 
         if prev_node is None:
+            self._last.reset_spider_web_node()
             self._reset_pointers()
         else:
-            self._last.set_value(None)
+            prev_level_node = self._last.get_prev_level_node()
+            if prev_level_node is not None:
+                prev_level_node.set_next_level_node(None)
+            if self._prev_level is not None:
+                self._prev_level = self._prev_level.get_prev_node()
+            self._last.reset_spider_web_node()
             prev_node.set_next_node(None)
             self._last = prev_node
 
@@ -664,6 +1832,142 @@ class SpiderWeb:
 
         return last_value
 
+    def drain(self, count: Optional[int] = None) -> Iterator[Any]:
+        """
+        Removes up to `count` elements from the beginning of the SpiderWeb and returns an iterator over them
+        in order. The elements are cut off in one batch, like :meth:`remove_first` does, when drain is called.
+        Unlike :meth:`remove_first`, draining more elements than the SpiderWeb holds is not an error.
+
+        Example Usage:
+            >>> for job in spider_web.drain(500):
+            ...     process(job)
+
+        :param count: The maximum number of elements to remove, or None to remove every element.
+        :type count: Optional[int]
+        :return: An iterator over the removed elements.
+        :rtype: Iterator[Any]
+        :raises ValueError: If `count` is negative.
+        """
+        if count is not None and count < 0:
+            raise ValueError(f"Invalid count: {count}")
+        return iter(self._drain_first(count))
+
+    @_write_operation
+    def _drain_first(self, count: Optional[int]) -> List[Any]:
+        return self._cut_first(self._size if count is None else min(count, self._size))
+
+    def _checked_count(self, count: int) -> int:
+        if count < 0:
+            raise ValueError(f"Invalid count: {count}")
+        if count > self._size:
+            raise IndexError(f"Cannot remove {count} elements from a SpiderWeb of size {self._size}.")
+        return count
+
+    def _cut_first(self, count: int) -> List[Any]:
+        # Unlinks the first `count` nodes in one pass. The remaining nodes keep their vertical links, except
+        # the first level, whose nodes lose the links to the levels that were cut off.
+        if count == 0:
+            return []
+        if self._journal is not None:
+            self._journal.append("remove_first", count)
+        if count == self._size:
+            return self._cut_all()
+        if self._stats is not None:
+            # The cut off nodes, and the first level whose vertical links are cleared.
+            self._stats.add_hops(count + min(self._max_element_per_level, self._size - count))
+
+        values = []
+        node_ranks = self._node_ranks
+        current = self._first
+        for _ in range(count):
+            next_node = current._next_node
+            values.append(current._value)
+            if node_ranks is not None:
+                del node_ranks[current]
+            current.reset_pointers()
+            current = next_node
+        current.set_prev_node(None)
+        self._first = current
+
+        for _ in range(self._max_element_per_level):
+            if current is None:
+                break
+            current.set_prev_level_node(None)
+            current = current._next_node
+
+        if self._value_index is not None:
+            for value in values:
+                self._value_index.remove_first(value)
+        self._invalidate_aggregates()
+        self._size -= count
+        self._level, self._index = divmod(self._size, self._max_element_per_level)
+        if self._size < self._max_element_per_level:
+            self._prev_level = None
+        return values
+
+    def _cut_last(self, count: int) -> List[Any]:
+        # Unlinks the last `count` nodes in one pass, then clears the vertical links of the last level that
+        # remains, which pointed into the levels that were cut off.
+        if count == 0:
+            return []
+        if self._journal is not None:
+            self._journal.append("remove_last", count)
+        if count == self._size:
+            return self._cut_all()[::-1]
+        if self._stats is not None:
+            # The cut off nodes, and the last level whose vertical links are cleared.
+            self._stats.add_hops(count + min(self._max_element_per_level, self._size - count))
+
+        values = []
+        node_ranks = self._node_ranks
+        current = self._last
+        for _ in range(count):
+            prev_node = current._prev_node
+            values.append(current._value)
+            if node_ranks is not None:
+                del node_ranks[current]
+            current.reset_spider_web_node()
+            current = prev_node
+        current.set_next_node(None)
+        self._last = current
+
+        self._size -= count
+        self._level, self._index = divmod(self._size, self._max_element_per_level)
+        self._prev_level = None
+        for _ in range(self._max_element_per_level):
+            if current is None:
+                break
+            current.set_next_level_node(None)
+            self._prev_level = current
+            current = current._prev_node
+        if self._size < self._max_element_per_level:
+            self._prev_level = None
+
+        if self._value_index is not None:
+            for value in values:
+                self._value_index.remove_last(value)
+        self._invalidate_aggregates(self._size // self._max_element_per_level)
+        return values
+
+    def _cut_all(self) -> List[Any]:
+        if self._stats is not None:
+            self._stats.add_hops(max(self._size - 1, 0))
+        values = []
+        current = self._first
+        while current is not None:
+            next_node = current._next_node
+            values.append(current._value)
+            current.reset_pointers()
+            current = next_node
+
+        self._reset_spider_web()
+        self._node_ranks = None
+        if self._value_index is not None:
+            self._value_index.clear()
+        self._invalidate_aggregates()
+        return values
+
+    @_write_operation
     def clear(self) -> None:
         """
         Removes all elements from the SpiderWeb.
@@ -671,6 +1975,9 @@ class SpiderWeb:
 
         :rtype: None
         """
+        record = self._journal_record("clear")
+        if self._stats is not None:
+            self._stats.add_hops(max(self._size - 1, 0))
         current = self._first
 
         while current is not None:
@@ -679,22 +1986,657 @@ class SpiderWeb:
             current = next_node
 
         self._reset_spider_web()
+        self._node_ranks = None
+        if self._value_index is not None:
+            self._value_index.clear()
+        self._invalidate_aggregates()
+        self._write_journal(record)
 
+    @_read_operation
     def copy(self) -> 'SpiderWeb':
         """
         Returns a shallow copy of this SpiderWeb instance.
         A shallow copy creates a new instance of SpiderWeb and populates it with the values from the current instance.
+        The node chain and the level links are rebuilt in a single pass by :meth:`extend`.
 
         :return: A shallow copy of this SpiderWeb instance.
         :rtype: SpiderWeb
         """
-        new_instance = SpiderWeb(self._max_element_per_level)
-        current = self.get_first_node()
+        new_instance = SpiderWeb(
+            self._max_element_per_level,
+            thread_safe=self._lock is not None,
+            index_values=self._value_index is not None,
+            capacity=self._capacity,
+            overflow=self._overflow
+        )
+        new_instance._aggregate_monoid = self._aggregate_monoid
+        if self._stats is not None:
+            self._stats.add_hops(max(self._size - 1, 0))
+        new_instance.extend(self._chain_values())
+
+        return new_instance
+
+    def snapshot(self) -> 'SpiderWeb':
+        """
+        Returns a copy-on-write snapshot of this SpiderWeb in O(1). The snapshot shares the nodes with this
+        SpiderWeb until one of them mutates. Appending to this SpiderWeb keeps the nodes shared, any other
+        mutation while a snapshot is alive first copies the nodes once, just like the first mutation of the
+        snapshot itself. A snapshot of a snapshot shares the same nodes and counts as a snapshot of the SpiderWeb
+        that owns them. The snapshot does not carry the value index.
+
+        Values changed directly through :meth:`SpiderWebNode.set_value` are seen by both sides.
+
+        Example Usage:
+            >>> report = spider_web.snapshot()
+            >>> spider_web.add(42)
+            >>> report.size() == spider_web.size() - 1
+            True
+
+        :return: A snapshot of this SpiderWeb.
+        :rtype: SpiderWeb
+        """
+        with self._write_locked():
+            new_instance = SpiderWeb(self._max_element_per_level, thread_safe=self._lock is not None)
+            if self._first is None:
+                return new_instance
+
+            new_instance._first = self._first
+            new_instance._last = self._last
+            new_instance._prev_level = self._prev_level
+            new_instance._level = self._level
+            new_instance._index = self._index
+            new_instance._size = self._size
+            new_instance._shared = True
+            new_instance._is_snapshot = True
+
+            # Every snapshot of the same nodes is registered with the SpiderWeb that owns them, snapshots of
+            # snapshots included, and carries its set of snapshots.
+            if not self._is_snapshot:
+                if self._snapshots is None:
+                    self._snapshots = weakref.WeakSet()
+                self._shared = True
+            self._snapshots.add(new_instance)
+            new_instance._snapshots = self._snapshots
+
+            return new_instance
+
+    @_read_operation
+    def dump(self, path: str) -> None:
+        """
+        Writes the elements of the SpiderWeb to a binary checkpoint file. The file starts with a header that
+        holds a magic number, the format version, the payload encoding, max_element_per_level and the number
+        of elements. When every element is an int that fits in 64 bits, or every element is a float, the
+        elements are written as one raw array, otherwise they are pickled as a list. Only the elements are
+        written, the links are rebuilt by :meth:`load`.
+
+        Example Usage:
+            >>> spider_web.dump("checkpoint.spw")
+            >>> restored = SpiderWeb.load("checkpoint.spw")
+
+        :param path: The path of the checkpoint file.
+        :type path: str
+        :rtype: None
+        """
+        typecode, payload = _encode_values(self._chain_values())
+        with open(path, "wb") as file:
+            file.write(_DUMP_HEADER.pack(
+                _DUMP_MAGIC, _DUMP_VERSION, typecode.encode(), self._max_element_per_level, self._size
+            ))
+            if typecode == _PICKLED:
+                pickle.dump(payload, file, protocol=pickle.HIGHEST_PROTOCOL)
+            else:
+                if sys.byteorder == "big":
+                    payload.byteswap()
+                payload.tofile(file)
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> 'SpiderWeb':
+        """
+        Creates a SpiderWeb from a checkpoint file written by :meth:`dump`, built in a single pass by
+        :meth:`extend`.
+
+        :param path: The path of the checkpoint file.
+        :type path: str
+        :param kwargs: Further SpiderWeb options, such as `thread_safe` or `index_values`.
+        :return: The restored SpiderWeb.
+        :rtype: SpiderWeb
+        :raises ValueError: If the file is not a SpiderWeb checkpoint, or was written by a newer version.
+        """
+        with open(path, "rb") as file:
+            header = file.read(_DUMP_HEADER.size)
+            if len(header) != _DUMP_HEADER.size:
+                raise ValueError(f"Not a SpiderWeb checkpoint: {path}")
+            magic, version, typecode, max_element_per_level, size = _DUMP_HEADER.unpack(header)
+            if magic != _DUMP_MAGIC:
+                raise ValueError(f"Not a SpiderWeb checkpoint: {path}")
+            if version > _DUMP_VERSION:
+                raise ValueError(f"Unsupported SpiderWeb checkpoint version: {version}")
+
+            typecode = typecode.decode()
+            if typecode == _PICKLED:
+                values = pickle.load(file)
+            else:
+                values = array(typecode)
+                values.fromfile(file, size)
+                if sys.byteorder == "big":
+                    values.byteswap()
+
+        return cls.from_iterable(values, max_element_per_level, **kwargs)
+
+    @_read_operation
+    def count(self, item: Any) -> int:
+        """
+        Returns the number of elements in the SpiderWeb that are equal to the specified element.
+        With `index_values` enabled, counting a hashable element takes O(1) on average.
+
+        :param item: The element to count.
+        :type item: Any
+        :return: The number of occurrences of the element.
+        :rtype: int
+        """
+        if self._value_index is not None and self._value_index.is_complete():
+            try:
+                return self._value_index.count(item)
+            except TypeError:
+                pass
+
+        if self._stats is not None:
+            self._stats.add_hops(max(self._size - 1, 0))
+        return sum(1 for value in self._chain_values() if value == item)
+
+    def enable_value_index(self) -> None:
+        """
+        Builds the value index from the current elements and keeps it up to date from now on.
+        Values changed directly through :meth:`SpiderWebNode.set_value` bypass the index.
+
+        :rtype: None
+        """
+        with self._write_locked():
+            value_index = _ValueIndex()
+            for position, value in enumerate(self._chain_values()):
+                value_index.add_last(value, position)
+            self._value_index = value_index
+
+    def disable_value_index(self) -> None:
+        """
+        Drops the value index, so searches scan the SpiderWeb again.
+
+        :rtype: None
+        """
+        with self._write_locked():
+            self._value_index = None
+
+    def get_level_values(self, level: int) -> 'SpiderWebView':
+        """
+        Returns a lazy view over the elements of the specified level. The view supports `len()`, iteration
+        and item access without copying the level, and iterating it finds the head of the level once
+        through the vertical level links. The view keeps the positions of the level, once the SpiderWeb
+        shrinks below them, iterating it raises IndexError like item access does.
+
+        Example Usage:
+            >>> row = spider_web.get_level_values(2)
+            >>> len(row), row[0], list(row)
+
+        :param level: The level to view.
+        :type level: int
+        :return: A view over the elements of the level.
+        :rtype: SpiderWebView
+        :raises ValueError: If the specified level is negative or exceeds the maximum level in the SpiderWeb.
+        :raises ValueError: If the SpiderWeb is empty.
+        """
+        count = self.get_maximum_index_for_level(level) + 1
+        start = level * self._max_element_per_level
+        return SpiderWebView(self, range(start, start + count))
+
+    @_write_operation
+    def set_level_values(self, level: int, values: Iterable[Any]) -> List[Any]:
+        """
+        Replaces every element of the specified level in a single pass along the level.
+
+        :param level: The level to replace.
+        :type level: int
+        :param values: The new elements, exactly as many as the level holds.
+        :type values: Iterable[Any]
+        :return: The previous elements of the level.
+        :rtype: List[Any]
+        :raises ValueError: If the level is invalid or the number of values does not match the level.
+        """
+        values = list(values)
+        count = self.get_maximum_index_for_level(level) + 1
+        if len(values) != count:
+            raise ValueError(f"Level {level} holds {count} elements, got {len(values)} values.")
+
+        start = level * self._max_element_per_level
+        records = [self._journal_record("set", level, offset, value) for offset, value in enumerate(values)]
+        old_values = []
+        current = self._locate_node(level, 0)
+        if self._stats is not None:
+            self._stats.add_hops(count - 1)
+        for offset, value in enumerate(values):
+            old_values.append(current.get_value())
+            current.set_value(value)
+            if self._value_index is not None:
+                self._value_index.replace(start + offset, old_values[-1], value)
+            self._write_journal(records[offset])
+            current = current.get_next_node()
+        self._level_aggregates.pop(level, None)
+
+        return old_values
+
+    def enable_aggregates(self, monoid: AggregateMonoid = SUMMARY_MONOID) -> None:
+        """
+        Caches a summary per level for :meth:`aggregate`. The summaries are built on demand and kept up to
+        date by appends. Replacing or removing the last elements drops the summary of the affected level,
+        and adding or removing at the front drops every summary, because all elements move to a new
+        position. Dropped summaries are rebuilt lazily by the next aggregate that needs them.
+
+        :param monoid: How elements are summarized, counting, summing and taking the extremes by default.
+        :type monoid: AggregateMonoid
+        :rtype: None
+        """
+        with self._write_locked():
+            self._aggregate_monoid = monoid
+            self._level_aggregates = {}
+
+    def disable_aggregates(self) -> None:
+        """
+        Drops the cached level summaries, so :meth:`aggregate` walks every element again.
+
+        :rtype: None
+        """
+        with self._write_locked():
+            self._aggregate_monoid = None
+            self._level_aggregates = {}
+
+    def enable_stats(self) -> None:
+        """
+        Starts counting the calls, the node hops and the time of every locked operation, see :meth:`stats`.
+        An operation that calls others internally, like insert calling add, is counted once, with the hops
+        of the whole call. While the stats are disabled, each operation only checks that they are.
+
+        :rtype: None
+        """
+        with self._write_locked():
+            if self._stats is None:
+                self._stats = _Stats()
+            self._stats.collecting = True
+
+    def disable_stats(self) -> None:
+        """
+        Stops counting operations and drops the collected stats.
+
+        :rtype: None
+        """
+        with self._write_locked():
+            if self._stats is None:
+                return
+            self._stats.collecting = False
+            self._stats.reset()
+            if self._stats.slow_operation_hook is None:
+                self._stats = None
+
+    def stats(self) -> Dict[str, OperationStats]:
+        """
+        Returns the statistics collected since :meth:`enable_stats` or :meth:`reset_stats`, per operation: the
+        number of calls, the total and the largest number of node hops of a call, the total and the largest
+        time of a call in seconds, and a histogram of the call latencies. The time includes waiting for the
+        lock of a thread safe SpiderWeb.
+
+        Example Usage:
+            >>> spider_web.enable_stats()
+            >>> spider_web.get(40, 3)
+            >>> spider_web.stats()["get"].max_hops
+            43
+
+        :return: The statistics by operation name, or an empty dictionary when the stats are disabled.
+        :rtype: Dict[str, OperationStats]
+        """
+        stats = self._stats
+        return {} if stats is None or not stats.collecting else stats.snapshot()
+
+    def reset_stats(self) -> None:
+        """
+        Sets every collected statistic back to zero, the stats stay enabled.
+
+        :rtype: None
+        """
+        stats = self._stats
+        if stats is not None:
+            stats.reset()
+
+    def on_slow_op(
+            self,
+            callback: Optional[Callable[[SlowOperation], Any]] = None,
+            threshold_hops: Optional[int] = None,
+            threshold_seconds: Optional[float] = None,
+            sample_rate: float = 1.0,
+            operations: Iterable[str] = SLOW_OPERATIONS,
+            logger: Optional[logging.Logger] = None
+    ) -> None:
+        """
+        Reports every call of the watched operations that takes more than `threshold_hops` node hops or more
+        than `threshold_seconds`, as a :class:`SlowOperation` with the arguments, the position reached, the hops,
+        the time and a summary of the callers. Without a callback, the report is logged as a warning, with the
+        SlowOperation in the `slow_operation` attribute of the log record. A `sample_rate` below 1 reports only
+        that fraction of the slow calls, so the hook can stay on in production. Calling it again replaces the
+        previous hook.
+
+        Example Usage:
+            >>> spider_web.on_slow_op(threshold_hops=10_000, sample_rate=0.01)
+            >>> spider_web.on_slow_op(alerts.append, threshold_seconds=0.005)
+
+        :param callback: Called with the SlowOperation after the operation returned, or None to log it.
+        :type callback: Optional[Callable[[SlowOperation], Any]]
+        :param threshold_hops: The number of node hops a call may take, or None for no limit.
+        :type threshold_hops: Optional[int]
+        :param threshold_seconds: The number of seconds a call may take, or None for no limit.
+        :type threshold_seconds: Optional[float]
+        :param sample_rate: The fraction of the slow calls to report.
+        :type sample_rate: float
+        :param operations: The names of the operations to watch, get, get_node, set, index_of, last_index_of,
+                           copy and clear by default.
+        :type operations: Iterable[str]
+        :param logger: The logger to report to without a callback, the `spider_web` logger by default.
+        :type logger: Optional[logging.Logger]
+        :rtype: None
+        :raises ValueError: If neither threshold is set, or the sample rate is not in (0, 1].
+        """
+        if threshold_hops is None and threshold_seconds is None:
+            raise ValueError("Either threshold_hops or threshold_seconds must be set.")
+        if not 0 < sample_rate <= 1:
+            raise ValueError(f"Invalid sample rate: {sample_rate}. It must be in (0, 1].")
+
+        hook = _SlowOperationHook(
+            callback, threshold_hops, threshold_seconds, sample_rate, operations, logger or _LOGGER
+        )
+        with self._write_locked():
+            if self._stats is None:
+                self._stats = _Stats()
+            self._stats.slow_operation_hook = hook
+
+    def disable_slow_op(self) -> None:
+        """
+        Removes the hook set with :meth:`on_slow_op`.
+
+        :rtype: None
+        """
+        with self._write_locked():
+            if self._stats is None:
+                return
+            self._stats.slow_operation_hook = None
+            if not self._stats.collecting:
+                self._stats = None
+
+    def attach_journal(self, journal: Any) -> None:
+        """
+        Records every later mutation in the journal, see :class:`spider_web_journal.SpiderWebJournal`. Unless
+        the journal was just recovered into this SpiderWeb, it first writes a snapshot of the current elements,
+        so that replaying it restores this SpiderWeb. Changing values through :meth:`SpiderWebNode.set_value`
+        is not recorded.
+
+        :param journal: The journal to record the mutations in.
+        :type journal: SpiderWebJournal
+        :rtype: None
+        """
+        with self._write_locked():
+            journal.bind(self)
+            self._journal = journal
+
+    def detach_journal(self) -> None:
+        """
+        Stops recording mutations in the attached journal.
+
+        :rtype: None
+        """
+        with self._write_locked():
+            self._journal = None
+
+    @_read_operation
+    def aggregate(self, start: int = 0, end: Optional[int] = None) -> Any:
+        """
+        Summarizes the elements at the flat positions from `start` up to, but excluding, `end`.
+        With :meth:`enable_aggregates`, whole levels inside the range are taken from the level summaries,
+        and only the partial levels at the edges are walked, which costs
+        O(n / max_element_per_level + max_element_per_level). Without it, every element in the range is
+        walked and summarized with the default :class:`AggregateSummary`.
+
+        Example Usage:
+            >>> spider_web.enable_aggregates()
+            >>> summary = spider_web.aggregate(100, 5000)
+            >>> summary.sum / summary.count
+
+        :param start: The flat position of the first element in the range.
+        :type start: int
+        :param end: The flat position after the last element in the range, the end of the SpiderWeb by default.
+        :type end: Optional[int]
+        :return: The summary of the range, or None for an empty range.
+        :rtype: Any
+        :raises IndexError: If the range does not lie within the SpiderWeb.
+        """
+        if end is None:
+            end = self._size
+        if not 0 <= start <= end <= self._size:
+            raise IndexError(f"Invalid aggregate range. Start: {start}, End: {end}")
+        if start == end:
+            return None
+
+        max_element_per_level = self._max_element_per_level
+        monoid = self._aggregate_monoid or SUMMARY_MONOID
+        cache = self._level_aggregates if self._aggregate_monoid is not None else None
+        summaries = []
+
+        position = start
+        current = self._locate_node(*divmod(start, max_element_per_level))
+        head_boundary = min(end, -(-start // max_element_per_level) * max_element_per_level)
+        if start < head_boundary:
+            summary, current = self._summarize(current, head_boundary - start, monoid)
+            summaries.append(summary)
+            position = head_boundary
+
+        while position + max_element_per_level <= end:
+            level = position // max_element_per_level
+            summary = None if cache is None else cache.get(level)
+            if summary is None:
+                summary, _ = self._summarize(current, max_element_per_level, monoid)
+                if cache is not None:
+                    cache[level] = summary
+            summaries.append(summary)
+            current = current.get_next_level_node()
+            position += max_element_per_level
+
+        if position < end:
+            summary, _ = self._summarize(current, end - position, monoid)
+            summaries.append(summary)
+
+        result = summaries[0]
+        for summary in summaries[1:]:
+            result = monoid.combine(result, summary)
+        return result
+
+    def read_locked(self) -> ContextManager[None]:
+        """
+        Returns a context manager that holds the read lock of a thread safe SpiderWeb, for example to
+        iterate over it while other threads mutate it. For a SpiderWeb created without thread_safe it does nothing.
+
+        Example Usage:
+            >>> with spider_web.read_locked():
+            ...     values = list(spider_web)
+
+        :return: A context manager holding the read lock.
+        :rtype: ContextManager[None]
+        """
+        if self._lock is None:
+            return nullcontext()
+        return self._lock.read_locked()
+
+    def iter_nodes(self) -> Iterator[SpiderWebNode]:
+        """
+        Returns a generator over the SpiderWebNodes of the SpiderWeb, from the first to the last node.
+
+        :return: A generator of the SpiderWebNodes.
+        :rtype: Iterator[SpiderWebNode]
+        """
+        current = self._first
         while current is not None:
-            new_instance.add(current.get_value())
+            yield current
+            if current is self._last:
+                break
             current = current.get_next_node()
 
-        return new_instance
+    def iter_with_positions(self) -> Iterator[Tuple[int, int, Any]]:
+        """
+        Returns a generator over the elements of the SpiderWeb together with their levels and indices.
+
+        Example Usage:
+            >>> for level, index, value in spider_web.iter_with_positions():
+            ...     print(level, index, value)
+
+        :return: A generator of (level, index, value) tuples.
+        :rtype: Iterator[Tuple[int, int, Any]]
+        """
+        level = 0
+        index = 0
+        current = self._first
+        while current is not None:
+            yield level, index, current.get_value()
+            if current is self._last:
+                break
+            current = current.get_next_node()
+            index += 1
+            if index == self._max_element_per_level:
+                level += 1
+                index = 0
+
+    def iter_level(self, level: int) -> Iterator[Any]:
+        """
+        Returns a generator over the elements of the specified level. The first element of the level
+        is reached through the vertical level links in O(level).
+
+        :param level: The level to iterate over.
+        :type level: int
+        :return: A generator of the elements on the level.
+        :rtype: Iterator[Any]
+        :raises ValueError: If the specified level is negative or exceeds the maximum level in the SpiderWeb.
+        :raises ValueError: If the SpiderWeb is empty.
+        """
+        count = self.get_maximum_index_for_level(level) + 1
+        return self._iter_values(self._locate_node(level, 0), count)
+
+    @staticmethod
+    def _iter_values(current: Optional[SpiderWebNode], count: int) -> Iterator[Any]:
+        for _ in range(count):
+            yield current.get_value()
+            current = current.get_next_node()
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Returns a generator over the elements of the SpiderWeb, from the first to the last element.
+
+        :return: A generator of the elements.
+        :rtype: Iterator[Any]
+        """
+        current = self._first
+        while current is not None:
+            yield current.get_value()
+            if current is self._last:
+                break
+            current = current.get_next_node()
+
+    def __reversed__(self) -> Iterator[Any]:
+        """
+        Returns a generator over the elements of the SpiderWeb, from the last to the first element.
+
+        :return: A generator of the elements in reverse order.
+        :rtype: Iterator[Any]
+        """
+        current = self._last
+        while current is not None:
+            yield current.get_value()
+            current = current.get_prev_node()
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        """
+        Returns the element at the specified flat position, counted across levels from the first element.
+        Negative positions count from the end. The position is reached through a level jump plus an
+        in-level offset, in O(position / max_element_per_level + max_element_per_level) node hops.
+
+        A slice returns a lazy :class:`SpiderWebView` over the selected positions instead of a copy.
+
+        Example Usage:
+            >>> spider_web = SpiderWeb.from_iterable(range(10), 3)
+            >>> spider_web[4], spider_web[-1]
+            (4, 9)
+            >>> list(spider_web[2:8:2])
+            [2, 4, 6]
+
+        :param key: The flat position of the element, or a slice of flat positions.
+        :type key: Union[int, slice]
+        :return: The element at the position, or a view over the slice.
+        :rtype: Any
+        :raises IndexError: If the position is out of range.
+        """
+        if isinstance(key, slice):
+            return SpiderWebView(self, range(self._size)[key])
+
+        level, index = divmod(self._flat_position(key), self._max_element_per_level)
+        return self.get(level, index)
+
+    def __setitem__(self, key: int, value: Any) -> None:
+        """
+        Replaces the element at the specified flat position, counted across levels from the first element.
+        Negative positions count from the end.
+
+        :param key: The flat position of the element.
+        :type key: int
+        :param value: The new element.
+        :type value: Any
+        :rtype: None
+        :raises IndexError: If the position is out of range.
+        :raises TypeError: If the key is a slice, which is not supported for assignment.
+        """
+        if isinstance(key, slice):
+            raise TypeError("SpiderWeb does not support slice assignment.")
+
+        level, index = divmod(self._flat_position(key), self._max_element_per_level)
+        self.set(level, index, value)
+
+    def __contains__(self, item: Any) -> bool:
+        """
+        Checks whether the SpiderWeb contains an element equal to the specified element.
+        With `index_values` enabled, the check takes O(1) on average for a hashable element.
+
+        :param item: The element to look for.
+        :type item: Any
+        :return: True if the element is in the SpiderWeb, False otherwise.
+        :rtype: bool
+        """
+        return self.index_of(item)["level"] is not None
+
+    @_read_operation
+    def __reduce_ex__(self, protocol: int) -> Tuple[Any, ...]:
+        """
+        Pickles the SpiderWeb as its options and its elements in order, the links are rebuilt on load. This
+        avoids recursing through the node chain, which fails on long SpiderWebs. With pickle protocol 5, a
+        SpiderWeb of only ints or only floats passes its elements as a :class:`pickle.PickleBuffer`, which can
+        be transferred out-of-band.
+
+        :param protocol: The pickle protocol.
+        :type protocol: int
+        :return: The callable that restores the SpiderWeb and its arguments.
+        :rtype: Tuple[Any, ...]
+        """
+        options = {
+            "thread_safe": self._lock is not None,
+            "index_values": self._value_index is not None,
+            "capacity": self._capacity,
+            "overflow": self._overflow
+        }
+        typecode, payload = _encode_values(self._chain_values())
+        if typecode != _PICKLED and protocol >= 5:
+            payload = pickle.PickleBuffer(payload)
+        return _restore_spider_web, (
+            type(self), self._max_element_per_level, options, self._aggregate_monoid, typecode, payload
+        )
 
     def __len__(self) -> int:
         """
@@ -720,3 +2662,176 @@ class SpiderWeb:
             f"max_element_per_level={self._max_element_per_level}"
             f")"
         )
+
+
+class SpiderWebView:
+    """
+    A lazy view over a range of flat positions of a SpiderWeb, as returned by slicing a SpiderWeb.
+    The view does not copy any elements, it reads them from the SpiderWeb on access, so it always
+    reflects the current contents. Its positions are fixed when the view is created.
+
+    Iterating the view locates the first position through the level links once and then moves from
+    position to position, jumping whole levels for large steps. The elements are read under the read
+    lock of a thread safe SpiderWeb when the iteration starts.
+
+    Example Usage:
+        >>> view = spider_web[10:20]
+        >>> len(view), view[0], list(view)
+    """
+
+    def __init__(self, spider_web: SpiderWeb, positions: range):
+        """
+            Initialize a SpiderWebView.
+
+            :param spider_web: The SpiderWeb the view reads from.
+            :type spider_web: :class:`SpiderWeb`
+            :param positions: The flat positions covered by the view.
+            :type positions: range
+        """
+        self._spider_web = spider_web
+        self._positions = positions
+
+    def __len__(self) -> int:
+        """
+        Returns the number of positions covered by the view.
+
+        :return: The length of the view.
+        :rtype: int
+        """
+        return len(self._positions)
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Returns an iterator over the elements covered by the view.
+
+        :return: An iterator of the elements.
+        :rtype: Iterator[Any]
+        :raises IndexError: If the SpiderWeb shrank below a position of the view since it was created.
+        """
+        positions = self._positions
+        if not positions:
+            return iter(())
+
+        spider_web = self._spider_web
+        with spider_web.read_locked():
+            # A view fixes its positions, the SpiderWeb may have shrunk below them since.
+            last_position = max(positions[0], positions[-1])
+            if last_position >= spider_web._size:
+                raise IndexError(f"SpiderWeb index out of range: {last_position}")
+
+            current = spider_web._locate_node(*divmod(positions[0], spider_web._max_element_per_level))
+            values = [current.get_value()]
+            for _ in range(len(positions) - 1):
+                current = spider_web._advance(current, positions.step)
+                values.append(current.get_value())
+        return iter(values)
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        """
+        Returns the element at the specified position of the view, or a narrower view for a slice.
+
+        :param key: The position within the view, or a slice of it.
+        :type key: Union[int, slice]
+        :return: The element or the narrower view.
+        :rtype: Any
+        :raises IndexError: If the position is out of range.
+        """
+        if isinstance(key, slice):
+            return SpiderWebView(self._spider_web, self._positions[key])
+        return self._spider_web[self._positions[key]]
+
+    def __setitem__(self, key: int, value: Any) -> None:
+        """
+        Replaces the element at the specified position of the view in the underlying SpiderWeb.
+
+        :param key: The position within the view.
+        :type key: int
+        :param value: The new element.
+        :type value: Any
+        :rtype: None
+        :raises IndexError: If the position is out of range.
+        """
+        self._spider_web[self._positions[key]] = value
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the SpiderWebView.
+
+        :return: A string representation of the SpiderWebView.
+        :rtype: str
+        """
+        return (
+            f"SpiderWebView("
+            f"start={self._positions.start}, "
+            f"stop={self._positions.stop}, "
+            f"step={self._positions.step}, "
+            f"size={len(self._positions)}"
+            f")"
+        )
+
+
+_DUMP_MAGIC = b"SPWB"
+_DUMP_VERSION = 1
+# Magic number, format version, payload encoding, max_element_per_level and size, little-endian.
+_DUMP_HEADER = struct.Struct("<4sBcIQ")
+# The payload encoding of elements that are not all 64-bit ints or all floats.
+_PICKLED = "p"
+
+
+def _encode_values(values: Iterable[Any]) -> Tuple[str, Any]:
+    # Packs the elements into an array of int64 ("q") or float64 ("d") when they all share one of these types,
+    # or returns them as a list to be pickled.
+    values = list(values)
+    if values and all(type(value) is int for value in values):
+        try:
+            return "q", array("q", values)
+        except OverflowError:
+            pass
+    elif values and all(type(value) is float for value in values):
+        return "d", array("d", values)
+    return _PICKLED, values
+
+
+def _restore_spider_web(
+        cls: type,
+        max_element_per_level: int,
+        options: Dict[str, Any],
+        aggregate_monoid: Optional[AggregateMonoid],
+        typecode: str,
+        payload: Any
+) -> SpiderWeb:
+    if typecode != _PICKLED and not isinstance(payload, array):
+        # A pickle.PickleBuffer arrives as a bytes-like object.
+        values = array(typecode)
+        values.frombytes(memoryview(payload).cast("B"))
+        payload = values
+
+    spider_web = cls(max_element_per_level, **options)
+    if aggregate_monoid is not None:
+        spider_web.enable_aggregates(aggregate_monoid)
+    spider_web.extend(payload)
+    return spider_web
+
+
+def create_spider_web(max_element_per_level: int = 6, engine: str = "node") -> Any:
+    """
+    Creates a SpiderWeb with the requested storage engine.
+
+    Example Usage:
+        >>> spider_web = create_spider_web(64, engine="array")
+
+    :param max_element_per_level: The maximum number of elements allowed per level.
+    :type max_element_per_level: int
+    :param engine: The storage engine, either "node" for the linked :class:`SpiderWeb` or "array" for the
+                   block backed :class:`array_spider_web.ArraySpiderWeb`.
+    :type engine: str
+    :return: The new, empty SpiderWeb.
+    :rtype: SpiderWeb or ArraySpiderWeb
+    :raises ValueError: If the engine is unknown.
+    """
+    if engine == "node":
+        return SpiderWeb(max_element_per_level)
+    if engine == "array":
+        from array_spider_web import ArraySpiderWeb
+        return ArraySpiderWeb(max_element_per_level)
+    raise ValueError(f"Unknown SpiderWeb engine: {engine}")
@@ -0,0 +1,461 @@
+import os
+import pickle
+import struct
+import sys
+import threading
+import time
+import zlib
+from array import array
+from typing import Optional, Any, List, Sequence
+
+from spider_web import SpiderWeb, _encode_values
+
+_MAGIC = b"SPWJ"
+_VERSION = 1
+# Magic number, format version, max_element_per_level and the generation of the snapshot the log continues.
+_HEADER = struct.Struct("<4sBIQ")
+# Operation, payload length and CRC-32 of the payload.
+_RECORD = struct.Struct("<BII")
+_POSITION = struct.Struct("<QQ")
+_COUNT = struct.Struct("<Q")
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+
+_OPERATIONS = ("add", "add_first", "set", "insert", "remove_at", "remove_first", "remove_last", "clear", "extend")
+_OPERATION_CODES = {operation: code for code, operation in enumerate(_OPERATIONS)}
+
+
+class SpiderWebJournal:
+    """
+        SpiderWebJournal is an append-only write-ahead log for a SpiderWeb, so its elements survive a restart
+        of the process. Every mutation of the attached SpiderWeb is encoded as a compact binary record with a
+        CRC-32, ints and floats without pickling. A mutation is encoded before it changes the SpiderWeb, so a
+        value that cannot be pickled fails the mutation and never leaves the SpiderWeb ahead of its log.
+
+        Records are group committed: they collect in memory and are written and fsync-ed together once
+        `fsync_every` records are pending, or once the oldest pending record is `fsync_interval` seconds
+        old, so a crash loses at most that much. A background thread writes records that are still pending
+        when `fsync_interval` runs out, even if no further mutation comes in. Once the log grows past `compact_threshold` bytes, it is
+        compacted into a snapshot written by :meth:`SpiderWeb.dump` and a new, empty log.
+
+        :meth:`recover` loads the snapshot and replays the log, appending runs of added elements through
+        :meth:`SpiderWeb.extend`. A record torn by a crash at the end of the log is dropped.
+
+        Example Usage:
+            >>> journal = SpiderWebJournal("events.wal", fsync_every=256)
+            >>> events = journal.recover(64, thread_safe=True)
+            >>> events.add("started")
+            >>> journal.close()
+
+        Attributes:
+            - `path`: The path of the log. Snapshots are written next to it.
+            - `fsync_every`: The number of records written and fsync-ed together (64).
+            - `fsync_interval`: The number of seconds after which pending records are written even if fewer
+              than `fsync_every` are pending, or None to wait for `fsync_every` records (0.1).
+            - `compact_threshold`: The size of the log in bytes that triggers a compaction (64 MiB).
+
+        """
+
+    def __init__(
+            self,
+            path: str,
+            fsync_every: int = 64,
+            fsync_interval: Optional[float] = 0.1,
+            compact_threshold: int = 64 * 1024 * 1024
+    ):
+        if fsync_every < 1:
+            raise ValueError(f"Invalid fsync_every: {fsync_every}. At least one record must be pending.")
+        self._path = path
+        self._fsync_every = fsync_every
+        self._fsync_interval = fsync_interval
+        self._compact_threshold = compact_threshold
+        self._spider_web: Optional[SpiderWeb] = None
+        self._file = None
+        self._generation: int = 0
+        self._buffer = bytearray()
+        self._pending: int = 0
+        self._pending_since: float = 0.0
+        self._log_size: int = 0
+        self._lock = threading.Lock()
+        self._flush_condition = threading.Condition(self._lock)
+        self._flusher: Optional[threading.Thread] = None
+        self._closed: bool = False
+        self.compaction_due: bool = False
+
+    # Getter methods for accessing SpiderWebJournal properties
+
+    def get_log_size(self) -> int:
+        """
+        Returns the number of bytes written to the log since the last compaction, including its header.
+
+        :return: The size of the log.
+        :rtype: int
+        """
+        return self._log_size
+
+    def get_pending(self) -> int:
+        """
+        Returns the number of records that were not written and fsync-ed yet.
+
+        :return: The number of pending records.
+        :rtype: int
+        """
+        return self._pending
+
+    # Private helper methods for the file layout.
+
+    def _snapshot_path(self, generation: int) -> str:
+        return f"{self._path}.{generation}.snapshot"
+
+    def _commit_locked(self) -> None:
+        # Called with the journal lock held.
+        if not self._buffer:
+            return
+        self._file.write(self._buffer)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._log_size += len(self._buffer)
+        self._buffer.clear()
+        self._pending = 0
+        self.compaction_due = self._log_size >= self._compact_threshold
+
+    def _flush_pending(self) -> None:
+        # Runs on the flusher thread, and writes the records whose fsync_interval ran out.
+        with self._flush_condition:
+            while not self._closed:
+                if self._pending == 0:
+                    self._flush_condition.wait()
+                    continue
+                remaining = self._pending_since + self._fsync_interval - time.monotonic()
+                if remaining > 0:
+                    self._flush_condition.wait(remaining)
+                elif self._file is not None:
+                    self._commit_locked()
+                else:
+                    self._flush_condition.wait()
+
+    def _install_log(self, max_element_per_level: int, generation: int) -> None:
+        # Replaces the log with an empty one that continues the snapshot of the generation.
+        temporary_path = self._path + ".tmp"
+        with open(temporary_path, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, _VERSION, max_element_per_level, generation))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self._path)
+        _fsync_directory(self._path)
+
+        if self._file is not None:
+            self._file.close()
+        self._file = open(self._path, "ab")
+        self._generation = generation
+        self._log_size = _HEADER.size
+        self.compaction_due = False
+
+    def _read_log(self) -> Optional[memoryview]:
+        try:
+            with open(self._path, "rb") as file:
+                data = memoryview(file.read())
+        except FileNotFoundError:
+            return None
+
+        if len(data) < _HEADER.size:
+            raise ValueError(f"Not a SpiderWeb journal: {self._path}")
+        magic, version, _, self._generation = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError(f"Not a SpiderWeb journal: {self._path}")
+        if version > _VERSION:
+            raise ValueError(f"Unsupported SpiderWeb journal version: {version}")
+        return data
+
+    @staticmethod
+    def _replay(spider_web: SpiderWeb, data: memoryview) -> int:
+        # Applies the intact records and returns the offset after the last one.
+        offset = _HEADER.size
+        added: List[Any] = []
+        while offset + _RECORD.size <= len(data):
+            code, length, checksum = _RECORD.unpack_from(data, offset)
+            start = offset + _RECORD.size
+            payload = data[start:start + length]
+            if len(payload) != length or zlib.crc32(payload) != checksum or code >= len(_OPERATIONS):
+                break
+
+            operation = _OPERATIONS[code]
+            if operation == "add":
+                # Runs of appended elements are rebuilt in bulk.
+                added.append(_decode_value(payload))
+            else:
+                if added:
+                    spider_web.extend(added)
+                    added = []
+                _apply(spider_web, operation, payload)
+            offset = start + length
+
+        if added:
+            spider_web.extend(added)
+        return offset
+
+    # Other public methods...
+
+    def recover(self, max_element_per_level: int = 6, **kwargs) -> SpiderWeb:
+        """
+        Restores the SpiderWeb from the latest snapshot and the log, and attaches the journal to it. Without
+        a log, the journal starts with an empty SpiderWeb.
+
+        :param max_element_per_level: The maximum number of elements allowed per level of a new SpiderWeb.
+                                      A recovered SpiderWeb keeps the one it was created with.
+        :type max_element_per_level: int
+        :param kwargs: Further SpiderWeb options, such as `thread_safe` or `capacity`.
+        :return: The recovered SpiderWeb.
+        :rtype: SpiderWeb
+        :raises ValueError: If the log is not a SpiderWeb journal, or was written by a newer version.
+        :raises RuntimeError: If the journal is already attached to a SpiderWeb.
+        """
+        if self._spider_web is not None:
+            raise RuntimeError("The journal is already attached to a SpiderWeb.")
+
+        data = self._read_log()
+        if data is None:
+            spider_web = SpiderWeb(max_element_per_level, **kwargs)
+            self._install_log(max_element_per_level, 0)
+        else:
+            _, _, max_element_per_level, generation = _HEADER.unpack_from(data)
+            if generation > 0:
+                spider_web = SpiderWeb.load(self._snapshot_path(generation), **kwargs)
+            else:
+                spider_web = SpiderWeb(max_element_per_level, **kwargs)
+
+            end = self._replay(spider_web, data)
+            self._file = open(self._path, "ab")
+            if end < len(data):
+                self._file.truncate(end)
+            self._log_size = end
+
+        self._spider_web = spider_web
+        spider_web.attach_journal(self)
+        return spider_web
+
+    def bind(self, spider_web: SpiderWeb) -> None:
+        """
+        Called by :meth:`SpiderWeb.attach_journal`. Unless the SpiderWeb was recovered by this journal,
+        starts the journal over with a snapshot of its current elements.
+
+        :param spider_web: The SpiderWeb the journal is attached to.
+        :type spider_web: SpiderWeb
+        :rtype: None
+        :raises RuntimeError: If the journal is already attached to another SpiderWeb.
+        """
+        if self._spider_web is spider_web:
+            return
+        if self._spider_web is not None:
+            raise RuntimeError("The journal is already attached to a SpiderWeb.")
+
+        if self._read_log() is None:
+            self._generation = 0
+        self._spider_web = spider_web
+        self.compact()
+
+    def encode(self, operation: str, *arguments: Any) -> bytes:
+        """
+        Encodes a mutation of the attached SpiderWeb as a record for :meth:`write`. The SpiderWeb encodes a
+        mutation before it changes anything, so a value that cannot be encoded fails the mutation and leaves
+        the SpiderWeb and the log in step.
+
+        :param operation: The name of the mutating method, for example "add" or "remove_first".
+        :type operation: str
+        :param arguments: The arguments of the mutation, such as the level, the index and the value.
+        :return: The record, with its header.
+        :rtype: bytes
+        :raises TypeError: If a value cannot be pickled.
+        """
+        payload = _encode_arguments(operation, arguments)
+        return _RECORD.pack(_OPERATION_CODES[operation], len(payload), zlib.crc32(payload)) + payload
+
+    def write(self, record: bytes) -> None:
+        """
+        Adds a record built by :meth:`encode` to the log, once the SpiderWeb applied the mutation. The SpiderWeb
+        calls it, while it holds its write lock.
+
+        :param record: The encoded record.
+        :type record: bytes
+        :rtype: None
+        """
+        with self._lock:
+            if self._pending == 0:
+                self._pending_since = time.monotonic()
+                if self._fsync_interval is not None:
+                    if self._flusher is None:
+                        self._closed = False
+                        self._flusher = threading.Thread(
+                            target=self._flush_pending, name="SpiderWebJournal-flusher", daemon=True
+                        )
+                        self._flusher.start()
+                    self._flush_condition.notify()
+            self._buffer += record
+            self._pending += 1
+            if self._pending >= self._fsync_every or (
+                    self._fsync_interval is not None and time.monotonic() - self._pending_since >= self._fsync_interval
+            ):
+                self._commit_locked()
+
+    def append(self, operation: str, *arguments: Any) -> None:
+        """
+        Encodes a mutation of the attached SpiderWeb and adds it to the log, like :meth:`encode` followed by
+        :meth:`write`.
+
+        :param operation: The name of the mutating method, for example "add" or "remove_first".
+        :type operation: str
+        :param arguments: The arguments of the mutation, such as the level, the index and the value.
+        :rtype: None
+        """
+        self.write(self.encode(operation, *arguments))
+
+    def commit(self) -> None:
+        """
+        Writes and fsyncs the pending records now.
+
+        :rtype: None
+        """
+        with self._lock:
+            self._commit_locked()
+
+    def compact(self) -> None:
+        """
+        Writes a snapshot of the attached SpiderWeb and starts a new, empty log that continues it. Each file is
+        written completely before it replaces the previous one, and the previous snapshot is deleted last, so a
+        crash at any point leaves a snapshot and a log that restore the SpiderWeb.
+
+        :rtype: None
+        :raises RuntimeError: If the journal is not attached to a SpiderWeb.
+        """
+        spider_web = self._spider_web
+        if spider_web is None:
+            raise RuntimeError("The journal is not attached to a SpiderWeb.")
+
+        with spider_web.read_locked(), self._lock:
+            if self._file is not None:
+                self._commit_locked()
+            generation = self._generation + 1
+            snapshot_path = self._snapshot_path(generation)
+            spider_web.dump(snapshot_path + ".tmp")
+            with open(snapshot_path + ".tmp", "rb+") as file:
+                os.fsync(file.fileno())
+            os.replace(snapshot_path + ".tmp", snapshot_path)
+
+            self._install_log(spider_web._max_element_per_level, generation)
+            if os.path.exists(self._snapshot_path(generation - 1)):
+                os.remove(self._snapshot_path(generation - 1))
+
+    def close(self) -> None:
+        """
+        Writes the pending records, stops the background flusher, detaches the journal from its SpiderWeb and
+        closes the log.
+
+        :rtype: None
+        """
+        if self._spider_web is not None:
+            self._spider_web.detach_journal()
+            self._spider_web = None
+        with self._flush_condition:
+            self._closed = True
+            self._flush_condition.notify()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        with self._lock:
+            if self._file is not None:
+                self._commit_locked()
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> 'SpiderWebJournal':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the SpiderWebJournal.
+
+        :return: A string representation of the SpiderWebJournal.
+        :rtype: str
+        """
+        return (
+            f"SpiderWebJournal("
+            f"path={self._path}, "
+            f"generation={self._generation}, "
+            f"log_size={self._log_size}, "
+            f"pending={self._pending}"
+            f")"
+        )
+
+
+def _fsync_directory(path: str) -> None:
+    # Makes a rename durable. Directories cannot be opened for fsync outside of POSIX.
+    if os.name != "posix":
+        return
+    descriptor = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+def _encode_value(value: Any) -> bytes:
+    if type(value) is int and -2 ** 63 <= value < 2 ** 63:
+        return b"q" + _INT.pack(value)
+    if type(value) is float:
+        return b"d" + _FLOAT.pack(value)
+    return b"p" + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode_value(payload: memoryview) -> Any:
+    tag = payload[0]
+    if tag == ord("q"):
+        return _INT.unpack_from(payload, 1)[0]
+    if tag == ord("d"):
+        return _FLOAT.unpack_from(payload, 1)[0]
+    return pickle.loads(payload[1:])
+
+
+def _encode_arguments(operation: str, arguments: Sequence[Any]) -> bytes:
+    if operation in ("add", "add_first"):
+        return _encode_value(arguments[0])
+    if operation in ("set", "insert"):
+        return _POSITION.pack(arguments[0], arguments[1]) + _encode_value(arguments[2])
+    if operation == "remove_at":
+        return _POSITION.pack(arguments[0], arguments[1])
+    if operation in ("remove_first", "remove_last"):
+        return _COUNT.pack(arguments[0])
+    if operation == "extend":
+        typecode, values = _encode_values(arguments[0])
+        if isinstance(values, array):
+            if sys.byteorder == "big":
+                values.byteswap()
+            return typecode.encode() + values.tobytes()
+        return b"p" + pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+    return b""
+
+
+def _apply(spider_web: SpiderWeb, operation: str, payload: memoryview) -> None:
+    if operation == "add_first":
+        spider_web.add_first(_decode_value(payload))
+    elif operation in ("set", "insert"):
+        level, index = _POSITION.unpack_from(payload)
+        getattr(spider_web, operation)(level, index, _decode_value(payload[_POSITION.size:]))
+    elif operation == "remove_at":
+        spider_web.remove_at(*_POSITION.unpack_from(payload))
+    elif operation in ("remove_first", "remove_last"):
+        getattr(spider_web, operation)(_COUNT.unpack_from(payload)[0])
+    elif operation == "clear":
+        spider_web.clear()
+    elif operation == "extend":
+        tag = chr(payload[0])
+        if tag == "p":
+            spider_web.extend(pickle.loads(payload[1:]))
+        else:
+            values = array(tag)
+            values.frombytes(payload[1:])
+            if sys.byteorder == "big":
+                values.byteswap()
+            spider_web.extend(values)
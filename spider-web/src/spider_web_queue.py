@@ -0,0 +1,281 @@
+import threading
+import time
+from queue import Empty, Full
+from typing import Optional, Any, Iterable, List
+
+from spider_web import SpiderWeb
+
+
+class SpiderWebQueue:
+    """
+        SpiderWebQueue is a thread safe FIFO queue for producer/consumer pipelines, with the semantics of
+        :class:`queue.Queue`, that stores its elements in SpiderWeb instances.
+
+        Producers append to a tail SpiderWeb under the tail lock, and consumers remove from a head SpiderWeb
+        under the head lock, so a producer and a consumer only meet when the head runs empty. A consumer then
+        swaps the two SpiderWebs under both locks. Each SpiderWeb is only ever mutated under one lock, which
+        keeps its level and index bookkeeping consistent without a lock of its own.
+
+        Example Usage:
+            >>> jobs = SpiderWebQueue(maxsize=1000)
+            >>> jobs.put("resize")
+            >>> jobs.put_many(["crop", "upload"])
+            >>> jobs.get_many(10)
+            ['resize', 'crop', 'upload']
+
+        Attributes:
+            - `maxsize`: The maximum number of elements, or 0 for no limit (0).
+            - `max_element_per_level`: The maximum number of elements allowed per level of the SpiderWebs (6).
+
+        """
+
+    def __init__(self, maxsize: int = 0, max_element_per_level: int = 6):
+        self._maxsize = maxsize
+        self._head = SpiderWeb(max_element_per_level)
+        self._tail = SpiderWeb(max_element_per_level)
+        self._head_lock = threading.Lock()
+        self._tail_lock = threading.Lock()
+        self._not_empty = threading.Condition(self._tail_lock)
+        self._not_full = threading.Condition(self._tail_lock)
+        self._all_tasks_done = threading.Condition(self._tail_lock)
+        self._unfinished_tasks: int = 0
+
+    # Getter methods for accessing SpiderWebQueue properties
+
+    def qsize(self) -> int:
+        """
+        Returns the approximate number of elements in the SpiderWebQueue.
+
+        :return: The number of elements in the SpiderWebQueue.
+        :rtype: int
+        """
+        return self._head.size() + self._tail.size()
+
+    def empty(self) -> bool:
+        """
+        Returns True if the SpiderWebQueue is empty, which other threads may change right away.
+
+        :return: Whether the SpiderWebQueue is empty.
+        :rtype: bool
+        """
+        return self.qsize() == 0
+
+    def full(self) -> bool:
+        """
+        Returns True if the SpiderWebQueue is full, which other threads may change right away.
+
+        :return: Whether the SpiderWebQueue is full.
+        :rtype: bool
+        """
+        return 0 < self._maxsize <= self.qsize()
+
+    # Private helper methods for the locking protocol.
+
+    @staticmethod
+    def _remaining(deadline: Optional[float]) -> Optional[float]:
+        return None if deadline is None else max(deadline - time.monotonic(), 0.0)
+
+    @staticmethod
+    def _deadline(block: bool, timeout: Optional[float]) -> Optional[float]:
+        if not block:
+            return time.monotonic()
+        if timeout is None:
+            return None
+        if timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        return time.monotonic() + timeout
+
+    def _wait_for_room(self, deadline: Optional[float]) -> None:
+        # Called with the tail lock held.
+        while self._maxsize <= self.qsize():
+            remaining = self._remaining(deadline)
+            if remaining == 0.0 or not self._not_full.wait(remaining):
+                if self._maxsize <= self.qsize():
+                    raise Full
+
+    def _refill_head(self, deadline: Optional[float]) -> None:
+        # Called with the head lock held and an empty head. Waits for the producers and takes their SpiderWeb.
+        with self._not_empty:
+            while self._tail.size() == 0:
+                remaining = self._remaining(deadline)
+                if remaining == 0.0 or not self._not_empty.wait(remaining):
+                    if self._tail.size() == 0:
+                        raise Empty
+            self._head, self._tail = self._tail, self._head
+
+    def _take(self, count: int, block: bool, timeout: Optional[float]) -> List[Any]:
+        deadline = self._deadline(block, timeout)
+        remaining = self._remaining(deadline)
+        if not self._head_lock.acquire(timeout=-1 if remaining is None else remaining):
+            raise Empty
+        try:
+            if self._head.size() == 0:
+                self._refill_head(deadline)
+            values = self._head.remove_first(min(count, self._head.size()))
+            if len(values) < count and self._tail.size() > 0:
+                with self._tail_lock:
+                    self._head, self._tail = self._tail, self._head
+                values.extend(self._head.remove_first(min(count - len(values), self._head.size())))
+        finally:
+            self._head_lock.release()
+
+        if self._maxsize > 0:
+            with self._not_full:
+                self._not_full.notify(len(values))
+        return values
+
+    # Other public methods...
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Adds the item to the end of the SpiderWebQueue. A full SpiderWebQueue makes the call wait for a
+        free slot, at most `timeout` seconds, or fail right away if `block` is False.
+
+        :param item: The item to add.
+        :type item: Any
+        :param block: Whether to wait for a free slot.
+        :type block: bool
+        :param timeout: The maximum number of seconds to wait, or None to wait for as long as it takes.
+        :type timeout: Optional[float]
+        :rtype: None
+        :raises queue.Full: If no free slot became available in time.
+        """
+        with self._not_full:
+            if self._maxsize > 0:
+                self._wait_for_room(self._deadline(block, timeout))
+            self._tail.add(item)
+            self._unfinished_tasks += 1
+            self._not_empty.notify()
+
+    def put_nowait(self, item: Any) -> None:
+        """
+        Adds the item to the end of the SpiderWebQueue if there is a free slot right away.
+
+        :param item: The item to add.
+        :type item: Any
+        :rtype: None
+        :raises queue.Full: If the SpiderWebQueue is full.
+        """
+        self.put(item, block=False)
+
+    def put_many(self, items: Iterable[Any], block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Adds the items to the end of the SpiderWebQueue under a single acquisition of the tail lock. An
+        unbounded SpiderWebQueue appends them in one :meth:`SpiderWeb.extend`. A bounded one adds them one by
+        one and waits for free slots like :meth:`put`, with the timeout covering the whole call.
+
+        :param items: The items to add.
+        :type items: Iterable[Any]
+        :param block: Whether to wait for free slots.
+        :type block: bool
+        :param timeout: The maximum number of seconds to wait, or None to wait for as long as it takes.
+        :type timeout: Optional[float]
+        :rtype: None
+        :raises queue.Full: If no free slot became available in time. The items before it were added.
+        """
+        with self._not_full:
+            if self._maxsize > 0:
+                # Consumers may take the items while a bounded put_many waits, so each one is published at once.
+                deadline = self._deadline(block, timeout)
+                for item in items:
+                    self._wait_for_room(deadline)
+                    self._tail.add(item)
+                    self._unfinished_tasks += 1
+                    self._not_empty.notify()
+                return
+
+            size = self._tail.size()
+            try:
+                self._tail.extend(items)
+            finally:
+                added = self._tail.size() - size
+                self._unfinished_tasks += added
+                self._not_empty.notify(added)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """
+        Removes and returns the first item of the SpiderWebQueue. An empty SpiderWebQueue makes the call wait
+        for an item, at most `timeout` seconds, or fail right away if `block` is False.
+
+        :param block: Whether to wait for an item.
+        :type block: bool
+        :param timeout: The maximum number of seconds to wait, or None to wait for as long as it takes.
+        :type timeout: Optional[float]
+        :return: The first item.
+        :rtype: Any
+        :raises queue.Empty: If no item became available in time.
+        """
+        return self._take(1, block, timeout)[0]
+
+    def get_nowait(self) -> Any:
+        """
+        Removes and returns the first item of the SpiderWebQueue if one is available right away.
+
+        :return: The first item.
+        :rtype: Any
+        :raises queue.Empty: If the SpiderWebQueue is empty.
+        """
+        return self.get(block=False)
+
+    def get_many(self, count: int, block: bool = True, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Removes and returns up to `count` items from the beginning of the SpiderWebQueue in one batch, cut off
+        with :meth:`SpiderWeb.remove_first`. Waits like :meth:`get` until at least one item is available,
+        then returns whatever is there, up to `count` items.
+
+        :param count: The maximum number of items to return.
+        :type count: int
+        :param block: Whether to wait for an item.
+        :type block: bool
+        :param timeout: The maximum number of seconds to wait, or None to wait for as long as it takes.
+        :type timeout: Optional[float]
+        :return: The removed items, in order.
+        :rtype: List[Any]
+        :raises ValueError: If `count` is not positive.
+        :raises queue.Empty: If no item became available in time.
+        """
+        if count < 1:
+            raise ValueError(f"Invalid count: {count}")
+        return self._take(count, block, timeout)
+
+    def task_done(self) -> None:
+        """
+        Marks an item taken from the SpiderWebQueue as processed, like :meth:`queue.Queue.task_done`.
+
+        :rtype: None
+        :raises ValueError: If called more times than there were items put.
+        """
+        with self._all_tasks_done:
+            if self._unfinished_tasks <= 0:
+                raise ValueError("task_done() called too many times")
+            self._unfinished_tasks -= 1
+            if self._unfinished_tasks == 0:
+                self._all_tasks_done.notify_all()
+
+    def join(self) -> None:
+        """
+        Waits until every item put into the SpiderWebQueue was marked as processed with :meth:`task_done`.
+
+        :rtype: None
+        """
+        with self._all_tasks_done:
+            while self._unfinished_tasks:
+                self._all_tasks_done.wait()
+
+    def __len__(self) -> int:
+        """
+        Returns the approximate number of elements in the SpiderWebQueue.
+
+        :return: The number of elements in the SpiderWebQueue.
+        :rtype: int
+        """
+        return self.qsize()
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the SpiderWebQueue.
+
+        :return: A string representation of the SpiderWebQueue.
+        :rtype: str
+        """
+        return f"SpiderWebQueue(size={self.qsize()}, maxsize={self._maxsize})"
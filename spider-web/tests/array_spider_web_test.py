@@ -0,0 +1,206 @@
+import pytest
+from assertpy import assert_that
+from array_spider_web import ArraySpiderWeb
+from spider_web import SpiderWeb, create_spider_web
+
+
+@pytest.fixture(scope="function")
+def array_spider_web() -> ArraySpiderWeb:
+    """
+    Fixture for creating an ArraySpiderWeb instance with a custom max_element_per_level (3).
+    """
+    return ArraySpiderWeb(max_element_per_level=3)
+
+
+@pytest.fixture(scope="function")
+def array_spider_web_with_values() -> ArraySpiderWeb:
+    """
+    Fixture for creating an ArraySpiderWeb instance with values [0, 1, 2, 3, 4, 1, 2, 3].
+    """
+    spider_web = ArraySpiderWeb(max_element_per_level=3)
+    for value in [0, 1, 2, 3, 4, 1, 2, 3]:
+        spider_web.add(value)
+    return spider_web
+
+
+@pytest.mark.array_spider_web
+def test_empty_array_spider_web(array_spider_web: ArraySpiderWeb) -> None:
+    """
+    Test the properties of an empty ArraySpiderWeb.
+    """
+    assert_that(array_spider_web).is_empty()
+    assert_that(array_spider_web.get_level()).is_equal_to(-1)
+    assert_that(array_spider_web.get_index()).is_equal_to(-1)
+    with pytest.raises(IndexError):
+        array_spider_web.get_first()
+    with pytest.raises(IndexError):
+        array_spider_web.get_last()
+    with pytest.raises(IndexError):
+        array_spider_web.remove_first()
+    with pytest.raises(IndexError):
+        array_spider_web.remove_last()
+
+
+@pytest.mark.parametrize("element_count, expected_level, expected_index", [
+    (1, 0, 0),
+    (3, 0, 2),
+    (4, 1, 0),
+    (10, 3, 0)
+])
+@pytest.mark.array_spider_web
+def test_get_level_and_index(
+        array_spider_web: ArraySpiderWeb,
+        element_count: int,
+        expected_level: int,
+        expected_index: int
+) -> None:
+    """
+    Test that get_level and get_index follow the same layout as SpiderWeb.
+
+    :param element_count: The number of elements to add to the ArraySpiderWeb.
+    :param expected_level: The expected last level.
+    :param expected_index: The expected last index.
+    """
+    for i in range(element_count):
+        array_spider_web.add(i)
+
+    assert_that(array_spider_web.get_level()).is_equal_to(expected_level)
+    assert_that(array_spider_web.get_index()).is_equal_to(expected_index)
+
+
+@pytest.mark.parametrize("level, index, expected_value", [
+    (0, 0, 0),
+    (0, 2, 2),
+    (1, 0, 3),
+    (2, 1, 3),
+    (-1, 0, ValueError),
+    (0, -1, ValueError),
+    (0, 3, ValueError),
+    (2, 2, ValueError)
+])
+@pytest.mark.array_spider_web
+def test_get(array_spider_web_with_values: ArraySpiderWeb, level: int, index: int, expected_value: int) -> None:
+    """
+    Test the get method of the ArraySpiderWeb.
+
+    :param level: The level of the element to retrieve.
+    :param index: The index within the specified level to retrieve.
+    :param expected_value: The expected value or ValueError if an error is expected.
+    """
+    if expected_value == ValueError:
+        with pytest.raises(ValueError):
+            array_spider_web_with_values.get(level=level, index=index)
+    else:
+        assert_that(array_spider_web_with_values.get(level=level, index=index)).is_equal_to(expected_value)
+
+
+@pytest.mark.array_spider_web
+def test_set(array_spider_web_with_values: ArraySpiderWeb) -> None:
+    """
+    Test that set replaces the element and returns the previous one.
+    """
+    assert_that(array_spider_web_with_values.set(2, 1, 30)).is_equal_to(3)
+    assert_that(array_spider_web_with_values.get(2, 1)).is_equal_to(30)
+    with pytest.raises(ValueError):
+        array_spider_web_with_values.set(2, 2, 40)
+
+
+@pytest.mark.array_spider_web
+def test_index_of_and_last_index_of(array_spider_web_with_values: ArraySpiderWeb) -> None:
+    """
+    Test the index_of and last_index_of methods of the ArraySpiderWeb.
+    """
+    assert_that(array_spider_web_with_values.index_of(1)).is_equal_to({"level": 0, "index": 1})
+    assert_that(array_spider_web_with_values.last_index_of(1)).is_equal_to({"level": 1, "index": 2})
+    assert_that(array_spider_web_with_values.index_of(10)).is_equal_to({"level": None, "index": None})
+    assert_that(array_spider_web_with_values.last_index_of(10)).is_equal_to({"level": None, "index": None})
+
+
+@pytest.mark.parametrize("operations", [
+    ["add"] * 20,
+    ["add_first"] * 20,
+    ["add", "add_first"] * 10 + ["remove_first"] * 7 + ["remove_last"] * 7,
+    ["add_first"] * 5 + ["remove_last"] * 5 + ["add"] * 7 + ["remove_first"] * 4
+])
+@pytest.mark.array_spider_web
+def test_matches_node_engine(operations: list) -> None:
+    """
+    Test that the ArraySpiderWeb and the node SpiderWeb agree after the same sequence of operations.
+
+    :param operations: The sequence of mutating methods to apply to both engines.
+    """
+    array_spider_web = ArraySpiderWeb(max_element_per_level=3)
+    spider_web = SpiderWeb(max_element_per_level=3)
+    for value, operation in enumerate(operations):
+        if operation.startswith("remove"):
+            assert_that(getattr(array_spider_web, operation)()).is_equal_to(getattr(spider_web, operation)())
+        else:
+            getattr(array_spider_web, operation)(value)
+            getattr(spider_web, operation)(value)
+
+        assert_that(array_spider_web.size()).is_equal_to(spider_web.size())
+        assert_that(array_spider_web.get_level()).is_equal_to(spider_web.get_level())
+        assert_that(array_spider_web.get_index()).is_equal_to(spider_web.get_index())
+
+    for level in range(spider_web.get_level() + 1):
+        for index in range(spider_web.get_maximum_index_for_level(level) + 1):
+            assert_that(array_spider_web.get(level, index)).is_equal_to(spider_web.get(level, index))
+
+
+@pytest.mark.array_spider_web
+def test_print(capsys, array_spider_web: ArraySpiderWeb) -> None:
+    """
+    Test the print method of the ArraySpiderWeb.
+    """
+    for i in range(4):
+        array_spider_web.add(i)
+
+    array_spider_web.print()
+    captured = capsys.readouterr()
+
+    assert_that(captured.out).is_equal_to("level: 0, index: 0, value: 0\n"
+                                          "level: 0, index: 1, value: 1\n"
+                                          "level: 0, index: 2, value: 2\n"
+                                          "level: 1, index: 0, value: 3\n")
+
+
+@pytest.mark.array_spider_web
+def test_copy_and_clear(array_spider_web_with_values: ArraySpiderWeb) -> None:
+    """
+    Test that copy is independent of the original and clear empties the ArraySpiderWeb.
+    """
+    copied_spider_web = array_spider_web_with_values.copy()
+    array_spider_web_with_values.set(0, 0, 100)
+    array_spider_web_with_values.clear()
+
+    assert_that(array_spider_web_with_values).is_empty()
+    assert_that(copied_spider_web.size()).is_equal_to(8)
+    assert_that(copied_spider_web.get(0, 0)).is_equal_to(0)
+    array_spider_web_with_values.add(5)
+    assert_that(array_spider_web_with_values.get_first()).is_equal_to(5)
+
+
+@pytest.mark.parametrize("engine, expected_type", [
+    ("node", SpiderWeb),
+    ("array", ArraySpiderWeb)
+])
+@pytest.mark.array_spider_web
+def test_create_spider_web(engine: str, expected_type: type) -> None:
+    """
+    Test that create_spider_web builds the requested storage engine.
+
+    :param engine: The name of the storage engine.
+    :param expected_type: The expected class of the created SpiderWeb.
+    """
+    spider_web = create_spider_web(4, engine=engine)
+    assert_that(spider_web).is_instance_of(expected_type)
+    assert_that(spider_web._max_element_per_level).is_equal_to(4)
+
+
+@pytest.mark.array_spider_web
+def test_create_spider_web_unknown_engine() -> None:
+    """
+    Test that create_spider_web rejects an unknown storage engine.
+    """
+    with pytest.raises(ValueError):
+        create_spider_web(engine="unknown")
@@ -0,0 +1,118 @@
+import asyncio
+import pytest
+from assertpy import assert_that
+from async_spider_web import AsyncSpiderWeb
+
+
+@pytest.mark.async_spider_web
+def test_put_and_pop() -> None:
+    """
+    Test that elements can be removed from both ends of the AsyncSpiderWeb.
+    """
+    async def scenario() -> list:
+        spider_web = AsyncSpiderWeb(3)
+        for value in range(5):
+            await spider_web.put(value)
+        return [await spider_web.pop_first(), await spider_web.pop_last(), len(spider_web)]
+
+    assert_that(asyncio.run(scenario())).is_equal_to([0, 4, 3])
+
+
+@pytest.mark.async_spider_web
+def test_pop_waits_for_put() -> None:
+    """
+    Test that pop_first and pop_last wait for an element instead of failing on an empty AsyncSpiderWeb.
+    """
+    async def scenario() -> list:
+        spider_web = AsyncSpiderWeb(3)
+        first = asyncio.create_task(spider_web.pop_first())
+        last = asyncio.create_task(spider_web.pop_last())
+        await asyncio.sleep(0)
+        assert_that(first.done() or last.done()).is_false()
+
+        spider_web.put_nowait("a")
+        spider_web.put_nowait("b")
+        return [await first, await last]
+
+    assert_that(asyncio.run(scenario())).is_equal_to(["a", "b"])
+
+
+@pytest.mark.async_spider_web
+def test_put_applies_back_pressure() -> None:
+    """
+    Test that put waits while the AsyncSpiderWeb is at its capacity, and put_nowait fails.
+    """
+    async def scenario() -> list:
+        spider_web = AsyncSpiderWeb(3, capacity=2)
+        await spider_web.put(0)
+        await spider_web.put(1)
+        with pytest.raises(asyncio.QueueFull):
+            spider_web.put_nowait(2)
+
+        blocked_put = asyncio.create_task(spider_web.put(2))
+        await asyncio.sleep(0)
+        assert_that(blocked_put.done()).is_false()
+        removed = await spider_web.pop_first()
+        await blocked_put
+        return [removed, await spider_web.pop_first(), await spider_web.pop_first()]
+
+    assert_that(asyncio.run(scenario())).is_equal_to([0, 1, 2])
+
+
+@pytest.mark.async_spider_web
+def test_async_for_consumes_until_closed() -> None:
+    """
+    Test that async for removes elements as they are added and stops once the AsyncSpiderWeb is closed and empty.
+    """
+    async def produce(spider_web: AsyncSpiderWeb) -> None:
+        for value in range(10):
+            await spider_web.put(value)
+            await asyncio.sleep(0)
+        spider_web.close()
+
+    async def scenario() -> list:
+        spider_web = AsyncSpiderWeb(3, capacity=3)
+        producer = asyncio.create_task(produce(spider_web))
+        received = [value async for value in spider_web]
+        await producer
+        return received
+
+    assert_that(asyncio.run(scenario())).is_equal_to(list(range(10)))
+
+
+@pytest.mark.async_spider_web
+def test_close() -> None:
+    """
+    Test that a closed AsyncSpiderWeb rejects new elements and wakes waiting consumers.
+    """
+    async def scenario() -> None:
+        spider_web = AsyncSpiderWeb()
+        waiting = asyncio.create_task(spider_web.pop_first())
+        await asyncio.sleep(0)
+        spider_web.close()
+
+        with pytest.raises(IndexError):
+            await waiting
+        with pytest.raises(RuntimeError):
+            await spider_web.put(1)
+        assert_that(spider_web.is_closed()).is_true()
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.async_spider_web
+def test_cancelled_waiter_passes_the_wake_up_on() -> None:
+    """
+    Test that cancelling a woken consumer does not strand the element for the next consumer.
+    """
+    async def scenario() -> str:
+        spider_web = AsyncSpiderWeb()
+        cancelled = asyncio.create_task(spider_web.pop_first())
+        waiting = asyncio.create_task(spider_web.pop_first())
+        await asyncio.sleep(0)
+
+        spider_web.put_nowait("a")
+        cancelled.cancel()
+        return await asyncio.wait_for(waiting, 1)
+
+    assert_that(asyncio.run(scenario())).is_equal_to("a")
@@ -0,0 +1,211 @@
+import multiprocessing
+import struct
+import pytest
+from assertpy import assert_that
+from mapped_spider_web import MappedSpiderWeb
+
+
+@pytest.fixture(scope="function")
+def path(tmp_path) -> str:
+    """
+    Fixture for the path of a MappedSpiderWeb file in a temporary directory.
+    """
+    return str(tmp_path / "records.spw")
+
+
+@pytest.fixture(scope="function")
+def mapped_spider_web(path: str) -> MappedSpiderWeb:
+    """
+    Fixture for creating a MappedSpiderWeb of (int64, float64) records with a custom max_element_per_level (3).
+    """
+    spider_web = MappedSpiderWeb(path, 3, record_format="<qd")
+    yield spider_web
+    spider_web.close()
+
+
+def read_size(path: str) -> int:
+    with MappedSpiderWeb(path, read_only=True) as spider_web:
+        return spider_web.size()
+
+
+@pytest.mark.mapped_spider_web
+def test_empty_mapped_spider_web(mapped_spider_web: MappedSpiderWeb) -> None:
+    """
+    Test the properties of an empty MappedSpiderWeb.
+    """
+    assert_that(mapped_spider_web).is_empty()
+    assert_that(mapped_spider_web.get_level()).is_equal_to(-1)
+    assert_that(mapped_spider_web.get_index()).is_equal_to(-1)
+    assert_that(mapped_spider_web.get_record_format()).is_equal_to("<qd")
+    with pytest.raises(IndexError):
+        mapped_spider_web.get_first()
+    with pytest.raises(IndexError):
+        mapped_spider_web.remove_last()
+
+
+@pytest.mark.parametrize("level, index, expected_value", [
+    (0, 0, (0, 0.0)),
+    (1, 2, (5, 2.5)),
+    (2, 1, (7, 3.5)),
+    (-1, 0, ValueError),
+    (0, 3, ValueError),
+    (2, 2, ValueError)
+])
+@pytest.mark.mapped_spider_web
+def test_get(mapped_spider_web: MappedSpiderWeb, level: int, index: int, expected_value) -> None:
+    """
+    Test the get method of the MappedSpiderWeb.
+
+    :param level: The level of the record to retrieve.
+    :param index: The index within the specified level to retrieve.
+    :param expected_value: The expected record or ValueError if an error is expected.
+    """
+    mapped_spider_web.extend((i, i / 2) for i in range(8))
+
+    if expected_value == ValueError:
+        with pytest.raises(ValueError):
+            mapped_spider_web.get(level, index)
+    else:
+        assert_that(mapped_spider_web.get(level, index)).is_equal_to(expected_value)
+
+
+@pytest.mark.mapped_spider_web
+def test_add_set_and_remove_last(mapped_spider_web: MappedSpiderWeb) -> None:
+    """
+    Test that add, set and remove_last keep the layout of the other SpiderWeb engines.
+    """
+    for i in range(7):
+        mapped_spider_web.add((i, float(i)))
+
+    assert_that(mapped_spider_web.get_level()).is_equal_to(2)
+    assert_that(mapped_spider_web.get_index()).is_equal_to(0)
+    assert_that(mapped_spider_web.set(1, 1, (40, 4.5))).is_equal_to((4, 4.0))
+    assert_that(mapped_spider_web.remove_last()).is_equal_to((6, 6.0))
+    assert_that(mapped_spider_web.get_last()).is_equal_to((5, 5.0))
+    assert_that(mapped_spider_web.index_of((40, 4.5))).is_equal_to({"level": 1, "index": 1})
+    assert_that(mapped_spider_web.last_index_of((0, 0.0))).is_equal_to({"level": 0, "index": 0})
+    assert_that(mapped_spider_web.index_of((6, 6.0))).is_equal_to({"level": None, "index": None})
+    with pytest.raises(struct.error):
+        mapped_spider_web.add((1, 2.0, 3))
+
+
+@pytest.mark.mapped_spider_web
+def test_get_view(mapped_spider_web: MappedSpiderWeb) -> None:
+    """
+    Test that get_view returns the bytes of a record or a level without copying them.
+    """
+    record = struct.Struct("<qd")
+    mapped_spider_web.extend((i, i / 2) for i in range(5))
+
+    level_view = mapped_spider_web.get_view(1)
+    record_view = mapped_spider_web.get_view(0, 2)
+    mapped_spider_web.set(1, 0, (30, 1.0))
+    mapped_spider_web.extend((i, 0.0) for i in range(100))
+
+    assert_that(level_view.nbytes).is_equal_to(2 * record.size)
+    assert_that(list(record.iter_unpack(level_view))).is_equal_to([(30, 1.0), (4, 2.0)])
+    assert_that(record.unpack(record_view)).is_equal_to((2, 1.0))
+    with pytest.raises(ValueError):
+        mapped_spider_web.get_view(0, 3)
+    level_view.release()
+    record_view.release()
+
+
+@pytest.mark.mapped_spider_web
+def test_file_grows_by_whole_levels(path: str) -> None:
+    """
+    Test that the file grows by whole levels and doubles the levels it has room for.
+    """
+    with MappedSpiderWeb(path, 4, record_format="<i") as spider_web:
+        spider_web.add(0)
+        one_level = len(spider_web._map)
+        spider_web.extend(range(1, 5))
+        two_levels = len(spider_web._map)
+        spider_web.extend(range(5, 9))
+
+        assert_that(two_levels - one_level).is_equal_to(4 * 4)
+        assert_that(len(spider_web._map) - one_level).is_equal_to(3 * 4 * 4)
+
+
+@pytest.mark.mapped_spider_web
+def test_reopen(path: str) -> None:
+    """
+    Test that a reopened MappedSpiderWeb takes its options and records from the file.
+    """
+    with MappedSpiderWeb(path, 3, record_format="<q") as spider_web:
+        spider_web.extend(range(10))
+        spider_web.remove_last()
+
+    with MappedSpiderWeb(path) as spider_web:
+        assert_that(list(spider_web)).is_equal_to(list(range(9)))
+        assert_that(spider_web.get(2, 2)).is_equal_to(8)
+        spider_web.add(9)
+
+    assert_that(read_size(path)).is_equal_to(10)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"max_element_per_level": 4},
+    {"record_format": "<d"}
+])
+@pytest.mark.mapped_spider_web
+def test_reopen_rejects_other_options(path: str, kwargs: dict) -> None:
+    """
+    Test that reopening a file with different options fails.
+
+    :param kwargs: The options that differ from the file.
+    """
+    MappedSpiderWeb(path, 3, record_format="<q").close()
+
+    with pytest.raises(ValueError):
+        MappedSpiderWeb(path, **kwargs)
+
+
+@pytest.mark.parametrize("content", [b"", b"SPWM", b"JUNK" + bytes(60)])
+@pytest.mark.mapped_spider_web
+def test_open_rejects_other_files(path: str, content: bytes) -> None:
+    """
+    Test that opening a file that is not a MappedSpiderWeb fails.
+
+    :param content: The content of the file.
+    """
+    with open(path, "wb") as file:
+        file.write(content)
+
+    with pytest.raises(ValueError):
+        MappedSpiderWeb(path)
+
+
+@pytest.mark.mapped_spider_web
+def test_read_only(path: str) -> None:
+    """
+    Test that a read-only MappedSpiderWeb sees the records of a writer and rejects changes.
+    """
+    with MappedSpiderWeb(path, 3, record_format="<q") as writer:
+        writer.extend(range(4))
+        reader = MappedSpiderWeb(path, read_only=True)
+        writer.extend(range(4, 100))
+
+        assert_that(reader.size()).is_equal_to(4)
+        reader.refresh()
+        assert_that(reader.size()).is_equal_to(100)
+        assert_that(reader.get_last()).is_equal_to(99)
+        assert_that(reader.is_read_only()).is_true()
+        with pytest.raises(RuntimeError):
+            reader.add(100)
+        with pytest.raises(RuntimeError):
+            reader.set(0, 0, 1)
+        reader.close()
+
+
+@pytest.mark.mapped_spider_web
+def test_shared_between_processes(path: str) -> None:
+    """
+    Test that another process can open the file read-only.
+    """
+    with MappedSpiderWeb(path, 64, record_format="<q") as spider_web:
+        spider_web.extend(range(1000))
+        spider_web.flush()
+
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        assert_that(pool.apply(read_size, (path,))).is_equal_to(1000)
@@ -0,0 +1,244 @@
+import pickle
+import pytest
+import numeric_spider_web as numeric_spider_web_module
+from assertpy import assert_that
+from numeric_spider_web import NumericSpiderWeb
+from spider_web import SpiderWeb
+
+
+@pytest.fixture(scope="function")
+def numeric_spider_web() -> NumericSpiderWeb:
+    """
+    Fixture for creating a NumericSpiderWeb instance of float64 values with max_element_per_level (3).
+    """
+    return NumericSpiderWeb(max_element_per_level=3)
+
+
+@pytest.fixture(scope="function")
+def numeric_spider_web_with_values() -> NumericSpiderWeb:
+    """
+    Fixture for creating a NumericSpiderWeb instance of int64 values [5, 1, 7, 3, 9, 2, 9, 4].
+    """
+    spider_web = NumericSpiderWeb(max_element_per_level=3, typecode="q")
+    for value in [5, 1, 7, 3, 9, 2, 9, 4]:
+        spider_web.add(value)
+    return spider_web
+
+
+@pytest.mark.numeric_spider_web
+def test_empty_numeric_spider_web(numeric_spider_web: NumericSpiderWeb) -> None:
+    """
+    Test the properties and aggregates of an empty NumericSpiderWeb.
+    """
+    assert_that(numeric_spider_web).is_empty()
+    assert_that(numeric_spider_web.get_level()).is_equal_to(-1)
+    assert_that(numeric_spider_web.get_index()).is_equal_to(-1)
+    assert_that(numeric_spider_web.sum()).is_equal_to(0)
+    for aggregate in (numeric_spider_web.min, numeric_spider_web.max, numeric_spider_web.mean,
+                      numeric_spider_web.argmax):
+        with pytest.raises(ValueError):
+            aggregate()
+    with pytest.raises(IndexError):
+        numeric_spider_web.remove_first()
+    with pytest.raises(IndexError):
+        numeric_spider_web.remove_last()
+
+
+@pytest.mark.parametrize("level, expected_sum, expected_min, expected_max, expected_mean, expected_argmax", [
+    (None, 40, 1, 9, 5.0, {"level": 1, "index": 1}),
+    (0, 13, 1, 7, 13 / 3, {"level": 0, "index": 2}),
+    (1, 14, 2, 9, 14 / 3, {"level": 1, "index": 1}),
+    (2, 13, 4, 9, 6.5, {"level": 2, "index": 0})
+])
+@pytest.mark.numeric_spider_web
+def test_aggregates(
+        numeric_spider_web_with_values: NumericSpiderWeb,
+        level: int,
+        expected_sum: int,
+        expected_min: int,
+        expected_max: int,
+        expected_mean: float,
+        expected_argmax: dict
+) -> None:
+    """
+    Test the whole and per level aggregates of the NumericSpiderWeb.
+
+    :param level: The level to aggregate, or None for the whole NumericSpiderWeb.
+    """
+    spider_web = numeric_spider_web_with_values
+    assert_that(spider_web.sum(level)).is_equal_to(expected_sum)
+    assert_that(spider_web.min(level)).is_equal_to(expected_min)
+    assert_that(spider_web.max(level)).is_equal_to(expected_max)
+    assert_that(spider_web.mean(level)).is_close_to(expected_mean, 1e-12)
+    assert_that(spider_web.argmax(level)).is_equal_to(expected_argmax)
+
+
+@pytest.mark.parametrize("values, level, expected_argmax", [
+    ([float("nan"), 1.0, 2.0, 3.0], None, {"level": 0, "index": 0}),
+    ([1.0, 3.0, float("nan"), 2.0, float("nan")], None, {"level": 0, "index": 2}),
+    ([1.0, 3.0, 2.0, 5.0, float("nan"), 4.0], 1, {"level": 1, "index": 1}),
+    ([1.0, 3.0, float("nan"), 5.0, 2.0], 1, {"level": 1, "index": 0})
+])
+@pytest.mark.numeric_spider_web
+def test_argmax_with_nan_without_numpy(monkeypatch, values: list, level: int, expected_argmax: dict) -> None:
+    """
+    Test that argmax returns the position of the first NaN, like numpy does, when numpy is not installed.
+
+    :param values: The float values.
+    :param level: The level to aggregate, or None for the whole NumericSpiderWeb.
+    :param expected_argmax: The expected level and index.
+    """
+    monkeypatch.setattr(numeric_spider_web_module, "numpy", None)
+    spider_web = NumericSpiderWeb(max_element_per_level=3)
+    for value in values:
+        spider_web.add(value)
+
+    assert_that(spider_web.argmax(level)).is_equal_to(expected_argmax)
+
+
+@pytest.mark.parametrize("level", [-1, 3])
+@pytest.mark.numeric_spider_web
+def test_aggregates_reject_invalid_level(numeric_spider_web_with_values: NumericSpiderWeb, level: int) -> None:
+    """
+    Test that the per level aggregates reject invalid levels.
+
+    :param level: The invalid level.
+    """
+    with pytest.raises(ValueError):
+        numeric_spider_web_with_values.sum(level)
+
+
+@pytest.mark.numeric_spider_web
+def test_aggregates_release_the_buffer(numeric_spider_web: NumericSpiderWeb) -> None:
+    """
+    Test that the aggregates do not keep the buffer exported, even when they fail, so it can still grow.
+    """
+    with pytest.raises(ValueError):
+        numeric_spider_web.max()
+    for value in [3.0, 7.0, 7.0, 1.0]:
+        numeric_spider_web.add(value)
+        numeric_spider_web.add_first(value)
+
+    assert_that(numeric_spider_web.sum()).is_equal_to(36.0)
+    assert_that(numeric_spider_web.argmax(level=1)).is_equal_to({"level": 1, "index": 2})
+    assert_that(numeric_spider_web.argmax()).is_equal_to({"level": 0, "index": 1})
+    numeric_spider_web.add(9.0)
+    numeric_spider_web.add_first(0.0)
+    assert_that(numeric_spider_web.max()).is_equal_to(9.0)
+
+
+@pytest.mark.parametrize("operations", [
+    ["add"] * 20,
+    ["add_first"] * 40,
+    ["add", "add_first"] * 10 + ["remove_first"] * 7 + ["remove_last"] * 7,
+    ["add"] * 30 + ["remove_first"] * 25 + ["add_first"] * 5 + ["add"] * 3
+])
+@pytest.mark.numeric_spider_web
+def test_matches_node_engine(operations: list) -> None:
+    """
+    Test that the NumericSpiderWeb and the node SpiderWeb agree after the same sequence of operations.
+
+    :param operations: The sequence of mutating methods to apply to both.
+    """
+    numeric_spider_web = NumericSpiderWeb(max_element_per_level=3)
+    spider_web = SpiderWeb(max_element_per_level=3)
+    for value, operation in enumerate(operations):
+        if operation.startswith("remove"):
+            assert_that(getattr(numeric_spider_web, operation)()).is_equal_to(getattr(spider_web, operation)())
+        else:
+            getattr(numeric_spider_web, operation)(float(value))
+            getattr(spider_web, operation)(float(value))
+
+    assert_that(list(numeric_spider_web)).is_equal_to(list(spider_web))
+    assert_that(numeric_spider_web.get_level()).is_equal_to(spider_web.get_level())
+    assert_that(numeric_spider_web.get_index()).is_equal_to(spider_web.get_index())
+    for level in range(spider_web.get_level() + 1):
+        for index in range(spider_web.get_maximum_index_for_level(level) + 1):
+            assert_that(numeric_spider_web.get(level, index)).is_equal_to(spider_web.get(level, index))
+
+
+@pytest.mark.numeric_spider_web
+def test_get_and_set(numeric_spider_web_with_values: NumericSpiderWeb) -> None:
+    """
+    Test reading and replacing values by level and index.
+    """
+    assert_that(numeric_spider_web_with_values.get(2, 1)).is_equal_to(4)
+    assert_that(numeric_spider_web_with_values.set(2, 1, 40)).is_equal_to(4)
+    assert_that(numeric_spider_web_with_values.get(2, 1)).is_equal_to(40)
+    assert_that(numeric_spider_web_with_values.max()).is_equal_to(40)
+    with pytest.raises(ValueError):
+        numeric_spider_web_with_values.get(2, 2)
+    with pytest.raises(TypeError):
+        numeric_spider_web_with_values.set(0, 0, "text")
+
+
+@pytest.mark.numeric_spider_web
+def test_index_of_and_last_index_of(numeric_spider_web_with_values: NumericSpiderWeb) -> None:
+    """
+    Test searching for values in the NumericSpiderWeb.
+    """
+    numeric_spider_web_with_values.remove_first()
+    numeric_spider_web_with_values.add_first(9)
+
+    assert_that(numeric_spider_web_with_values.index_of(9)).is_equal_to({"level": 0, "index": 0})
+    assert_that(numeric_spider_web_with_values.last_index_of(9)).is_equal_to({"level": 2, "index": 0})
+    assert_that(numeric_spider_web_with_values.index_of(100)).is_equal_to({"level": None, "index": None})
+    assert_that(numeric_spider_web_with_values.index_of("text")).is_equal_to({"level": None, "index": None})
+
+
+@pytest.mark.numeric_spider_web
+def test_copy_and_clear(numeric_spider_web_with_values: NumericSpiderWeb) -> None:
+    """
+    Test that copy is independent of the original and clear empties the NumericSpiderWeb.
+    """
+    copied_spider_web = numeric_spider_web_with_values.copy()
+    numeric_spider_web_with_values.clear()
+
+    assert_that(numeric_spider_web_with_values).is_empty()
+    assert_that(list(copied_spider_web)).is_equal_to([5, 1, 7, 3, 9, 2, 9, 4])
+    assert_that(copied_spider_web.get_typecode()).is_equal_to("q")
+
+
+@pytest.mark.numeric_spider_web
+def test_print(capsys, numeric_spider_web_with_values: NumericSpiderWeb) -> None:
+    """
+    Test the print method of the NumericSpiderWeb.
+    """
+    numeric_spider_web_with_values.print()
+    captured = capsys.readouterr()
+
+    assert_that(captured.out.splitlines()[3]).is_equal_to("level: 1, index: 0, value: 3")
+    assert_that(captured.out.splitlines()).is_length(8)
+
+
+@pytest.mark.parametrize("protocol", [2, 4, 5])
+@pytest.mark.numeric_spider_web
+def test_pickle(numeric_spider_web_with_values: NumericSpiderWeb, protocol: int) -> None:
+    """
+    Test that a pickled NumericSpiderWeb is restored with the same values, typecode and layout.
+
+    :param protocol: The pickle protocol.
+    """
+    numeric_spider_web_with_values.remove_first()
+
+    restored = pickle.loads(pickle.dumps(numeric_spider_web_with_values, protocol=protocol))
+
+    assert_that(list(restored)).is_equal_to([1, 7, 3, 9, 2, 9, 4])
+    assert_that(restored.get_typecode()).is_equal_to("q")
+    assert_that(restored.get(1, 0)).is_equal_to(numeric_spider_web_with_values.get(1, 0))
+
+
+@pytest.mark.numeric_spider_web
+def test_mutate_after_out_of_band_pickle(numeric_spider_web_with_values: NumericSpiderWeb) -> None:
+    """
+    Test that the NumericSpiderWeb can still grow while the out-of-band buffers of its pickle are held.
+    """
+    buffers = []
+    data = pickle.dumps(numeric_spider_web_with_values, protocol=5, buffer_callback=buffers.append)
+
+    numeric_spider_web_with_values.add(10)
+    numeric_spider_web_with_values.add_first(0)
+
+    restored = pickle.loads(data, buffers=buffers)
+    assert_that(list(restored)).is_equal_to([5, 1, 7, 3, 9, 2, 9, 4])
+    assert_that(list(numeric_spider_web_with_values)).is_equal_to([0, 5, 1, 7, 3, 9, 2, 9, 4, 10])
@@ -0,0 +1,219 @@
+import os
+import pytest
+import threading
+import time
+from typing import List, Any
+from assertpy import assert_that
+from spider_web import SpiderWeb
+from spider_web_journal import SpiderWebJournal
+
+
+@pytest.fixture(scope="function")
+def path(tmp_path) -> str:
+    """
+    Fixture for the path of a journal in a temporary directory.
+    """
+    return str(tmp_path / "events.wal")
+
+
+def recovered_values(path: str, **kwargs) -> List[Any]:
+    journal = SpiderWebJournal(path)
+    spider_web = journal.recover(3, **kwargs)
+    values = list(spider_web)
+    journal.close()
+    return values
+
+
+@pytest.mark.spider_web_journal
+def test_recover_replays_every_operation(path: str) -> None:
+    """
+    Test that every mutation recorded in the journal is replayed in order.
+    """
+    journal = SpiderWebJournal(path)
+    spider_web = journal.recover(3)
+    spider_web.extend(range(10))
+    spider_web.add(10.5)
+    spider_web.add("eleven")
+    spider_web.add_first(-1)
+    spider_web.set(1, 1, "four")
+    spider_web[0] = -10
+    spider_web.insert(2, 0, ("inserted", 1))
+    spider_web.remove_at(0, 2)
+    spider_web.remove_node(spider_web.get_node(1, 2))
+    spider_web.remove_first()
+    spider_web.remove_last()
+    spider_web.remove_first(2)
+    spider_web.remove_last(1)
+    spider_web.set_level_values(0, ["a", "b", "c"])
+    list(spider_web.drain(1))
+    expected = list(spider_web)
+    journal.close()
+
+    assert_that(recovered_values(path)).is_equal_to(expected)
+
+
+@pytest.mark.spider_web_journal
+def test_recover_after_clear(path: str) -> None:
+    """
+    Test that clear is replayed, and that elements added afterwards survive.
+    """
+    with SpiderWebJournal(path) as journal:
+        spider_web = journal.recover(3)
+        spider_web.extend(range(5))
+        spider_web.clear()
+        spider_web.add(7)
+
+    assert_that(recovered_values(path)).is_equal_to([7])
+
+
+@pytest.mark.spider_web_journal
+def test_recover_bounded_spider_web(path: str) -> None:
+    """
+    Test that the evictions of a bounded SpiderWeb are replayed as well.
+    """
+    with SpiderWebJournal(path) as journal:
+        spider_web = journal.recover(3, capacity=4)
+        spider_web.extend(range(10))
+        spider_web.insert(0, 1, "x")
+        expected = list(spider_web)
+
+    assert_that(recovered_values(path, capacity=4)).is_equal_to(expected)
+
+
+@pytest.mark.parametrize("method, arguments, capacity", [
+    ("add", (threading.Lock(),), None),
+    ("add", (threading.Lock(),), 9),
+    ("add_first", (threading.Lock(),), 9),
+    ("set", (1, 1, threading.Lock()), None),
+    ("insert", (1, 1, threading.Lock()), None),
+    ("insert", (1, 1, threading.Lock()), 9),
+    ("extend", ([9, threading.Lock()],), None),
+    ("set_level_values", (1, [9, threading.Lock(), 9]), None)
+])
+@pytest.mark.spider_web_journal
+def test_value_that_cannot_be_encoded_leaves_the_spider_web_alone(
+        path: str,
+        method: str,
+        arguments: tuple,
+        capacity: int
+) -> None:
+    """
+    Test that a mutation whose value the journal cannot encode fails before it changes the SpiderWeb, even
+    before a full bounded SpiderWeb evicts, so the SpiderWeb and the recovered SpiderWeb still match.
+
+    :param method: The mutating method.
+    :param arguments: The arguments, holding a value that cannot be pickled.
+    :param capacity: The capacity of the SpiderWeb.
+    """
+    with SpiderWebJournal(path) as journal:
+        spider_web = journal.recover(3, capacity=capacity)
+        for value in range(9):
+            spider_web.add(value)
+
+        with pytest.raises(TypeError):
+            getattr(spider_web, method)(*arguments)
+        expected = list(spider_web)
+
+    assert_that(expected).is_equal_to(list(range(9)))
+    assert_that(recovered_values(path, capacity=capacity)).is_equal_to(expected)
+
+
+@pytest.mark.spider_web_journal
+def test_group_commit(path: str) -> None:
+    """
+    Test that records are written in groups of fsync_every records.
+    """
+    with SpiderWebJournal(path, fsync_every=4, fsync_interval=None) as journal:
+        spider_web = journal.recover(3)
+        for value in range(6):
+            spider_web.add(value)
+
+        assert_that(journal.get_pending()).is_equal_to(2)
+        assert_that(recovered_values(path)).is_equal_to([0, 1, 2, 3])
+        journal.commit()
+        assert_that(journal.get_pending()).is_equal_to(0)
+        assert_that(recovered_values(path)).is_equal_to(list(range(6)))
+
+
+@pytest.mark.spider_web_journal
+def test_fsync_interval_without_further_appends(path: str) -> None:
+    """
+    Test that pending records are written once fsync_interval runs out, even if no further record comes in.
+    """
+    with SpiderWebJournal(path, fsync_interval=0.01) as journal:
+        spider_web = journal.recover(3)
+        spider_web.add(0)
+        spider_web.add(1)
+        deadline = time.monotonic() + 5
+        while journal.get_pending() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert_that(journal.get_pending()).is_equal_to(0)
+        assert_that(recovered_values(path)).is_equal_to([0, 1])
+
+
+@pytest.mark.spider_web_journal
+def test_torn_record_is_dropped(path: str) -> None:
+    """
+    Test that a record torn by a crash at the end of the log is dropped, and the log continues after it.
+    """
+    with SpiderWebJournal(path) as journal:
+        spider_web = journal.recover(3)
+        spider_web.extend(range(5))
+        spider_web.add("lost")
+    with open(path, "rb+") as file:
+        file.truncate(os.path.getsize(path) - 2)
+
+    with SpiderWebJournal(path) as journal:
+        spider_web = journal.recover(3)
+        assert_that(list(spider_web)).is_equal_to(list(range(5)))
+        spider_web.add(5)
+
+    assert_that(recovered_values(path)).is_equal_to(list(range(6)))
+
+
+@pytest.mark.spider_web_journal
+def test_compaction(path: str) -> None:
+    """
+    Test that a log past the threshold is compacted into a snapshot, and the old snapshot is deleted.
+    """
+    with SpiderWebJournal(path, fsync_every=1, compact_threshold=256) as journal:
+        spider_web = journal.recover(3)
+        for value in range(100):
+            spider_web.add(value)
+            if value % 3 == 0:
+                spider_web.remove_first()
+
+        expected = list(spider_web)
+        assert_that(journal.get_log_size()).is_less_than(256 + 64)
+
+    snapshots = [name for name in os.listdir(os.path.dirname(path)) if name.endswith(".snapshot")]
+    assert_that(snapshots).is_length(1)
+    assert_that(recovered_values(path)).is_equal_to(expected)
+
+
+@pytest.mark.spider_web_journal
+def test_attach_existing_spider_web(path: str) -> None:
+    """
+    Test that attaching a journal to a SpiderWeb that already has elements snapshots them first.
+    """
+    spider_web = SpiderWeb.from_iterable(range(20), 3, thread_safe=True)
+    journal = SpiderWebJournal(path)
+    spider_web.attach_journal(journal)
+    spider_web.add(20)
+    journal.close()
+    spider_web.add(21)
+
+    assert_that(recovered_values(path)).is_equal_to(list(range(21)))
+
+
+@pytest.mark.spider_web_journal
+def test_recover_rejects_other_files(path: str) -> None:
+    """
+    Test that recover rejects a file that is not a SpiderWeb journal.
+    """
+    with open(path, "wb") as file:
+        file.write(b"JUNK" + bytes(20))
+
+    with pytest.raises(ValueError):
+        SpiderWebJournal(path).recover()
@@ -315,3 +315,13 @@ def test_reset_spider_web_node_sets_value_and_pointers_to_none(spider_web_node:
     assert_that(spider_web_node.get_next_node()).is_none()
     assert_that(spider_web_node.get_prev_level_node()).is_none()
     assert_that(spider_web_node.get_next_level_node()).is_none()
+
+
+@pytest.mark.spider_web_node
+def test_spider_web_node_has_no_instance_dict(spider_web_node: SpiderWebNode) -> None:
+    """
+    Test that the SpiderWebNode is slotted and rejects attributes outside of its layout.
+    """
+    assert_that(hasattr(spider_web_node, "__dict__")).is_false()
+    with pytest.raises(AttributeError):
+        spider_web_node.extra = "value"
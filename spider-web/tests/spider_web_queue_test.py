@@ -0,0 +1,136 @@
+import threading
+import pytest
+from queue import Empty, Full
+from assertpy import assert_that
+from spider_web_queue import SpiderWebQueue
+
+
+@pytest.fixture(scope="function")
+def spider_web_queue() -> SpiderWebQueue:
+    """
+    Fixture for creating an unbounded SpiderWebQueue instance with a custom max_element_per_level (3).
+    """
+    return SpiderWebQueue(max_element_per_level=3)
+
+
+@pytest.mark.spider_web_queue
+def test_put_and_get_keep_fifo_order(spider_web_queue: SpiderWebQueue) -> None:
+    """
+    Test that items come out in the order they were put in, across swaps of the head and tail SpiderWebs.
+    """
+    spider_web_queue.put(0)
+    spider_web_queue.put_many(range(1, 5))
+    assert_that(spider_web_queue.get()).is_equal_to(0)
+    spider_web_queue.put_many(range(5, 8))
+
+    assert_that(spider_web_queue.qsize()).is_equal_to(7)
+    assert_that(spider_web_queue.get_many(2)).is_equal_to([1, 2])
+    assert_that(spider_web_queue.get_many(10)).is_equal_to([3, 4, 5, 6, 7])
+    assert_that(spider_web_queue.empty()).is_true()
+    assert_that(len(spider_web_queue)).is_equal_to(0)
+
+
+@pytest.mark.spider_web_queue
+def test_get_from_empty_queue(spider_web_queue: SpiderWebQueue) -> None:
+    """
+    Test that get fails with queue.Empty without blocking or after the timeout.
+    """
+    with pytest.raises(Empty):
+        spider_web_queue.get_nowait()
+    with pytest.raises(Empty):
+        spider_web_queue.get(timeout=0.01)
+    with pytest.raises(Empty):
+        spider_web_queue.get_many(3, block=False)
+    with pytest.raises(ValueError):
+        spider_web_queue.get_many(0)
+
+
+@pytest.mark.spider_web_queue
+def test_put_into_full_queue() -> None:
+    """
+    Test that put fails with queue.Full on a full bounded SpiderWebQueue, and put_many keeps the items it added.
+    """
+    spider_web_queue = SpiderWebQueue(maxsize=3)
+
+    with pytest.raises(Full):
+        spider_web_queue.put_many(range(5), timeout=0.01)
+    assert_that(spider_web_queue.full()).is_true()
+    with pytest.raises(Full):
+        spider_web_queue.put_nowait(5)
+
+    assert_that(spider_web_queue.get_many(5)).is_equal_to([0, 1, 2])
+
+
+@pytest.mark.spider_web_queue
+def test_blocking_get_and_put() -> None:
+    """
+    Test that a waiting consumer is woken by a producer, and a waiting producer by a consumer.
+    """
+    spider_web_queue = SpiderWebQueue(maxsize=1)
+    received = []
+    consumer = threading.Thread(target=lambda: received.extend([spider_web_queue.get(), spider_web_queue.get()]))
+    consumer.start()
+
+    spider_web_queue.put("a")
+    spider_web_queue.put("b", timeout=1)
+    consumer.join(1)
+
+    assert_that(consumer.is_alive()).is_false()
+    assert_that(received).is_equal_to(["a", "b"])
+
+
+@pytest.mark.spider_web_queue
+def test_producers_and_consumers() -> None:
+    """
+    Test that many producers and consumers pass every item exactly once.
+    """
+    spider_web_queue = SpiderWebQueue(maxsize=50, max_element_per_level=4)
+    received = []
+    received_lock = threading.Lock()
+    produced = threading.Event()
+
+    def produce(offset: int) -> None:
+        for value in range(offset, offset + 500, 5):
+            spider_web_queue.put_many(range(value, value + 5))
+
+    def consume() -> None:
+        while not produced.is_set():
+            try:
+                batch = spider_web_queue.get_many(7, timeout=0.01)
+            except Empty:
+                continue
+            with received_lock:
+                received.extend(batch)
+            for _ in batch:
+                spider_web_queue.task_done()
+
+    consumers = [threading.Thread(target=consume) for _ in range(3)]
+    producers = [threading.Thread(target=produce, args=(offset,)) for offset in range(0, 2000, 500)]
+    for thread in consumers + producers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    spider_web_queue.join()
+    produced.set()
+    for thread in consumers:
+        thread.join()
+
+    assert_that(sorted(received)).is_equal_to(list(range(2000)))
+
+
+@pytest.mark.spider_web_queue
+def test_task_done_and_join(spider_web_queue: SpiderWebQueue) -> None:
+    """
+    Test that join waits for every item to be marked done, and task_done rejects extra calls.
+    """
+    spider_web_queue.put_many(["a", "b"])
+    worker = threading.Thread(target=lambda: [spider_web_queue.get() and spider_web_queue.task_done()
+                                              for _ in range(2)])
+    worker.start()
+
+    spider_web_queue.join()
+    worker.join()
+
+    with pytest.raises(ValueError):
+        spider_web_queue.task_done()
+    assert_that(str(spider_web_queue)).is_equal_to("SpiderWebQueue(size=0, maxsize=0)")
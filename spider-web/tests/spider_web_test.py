@@ -1,7 +1,12 @@
+import gc
+import logging
+import pickle
+import threading
 import pytest
 from assertpy import assert_that
 from typing import Tuple, List, Any
-from spider_web import SpiderWeb, SpiderWebNode
+from spider_web import SpiderWeb, SpiderWebNode, SpiderWebView, ReadWriteLock, AggregateMonoid, AggregateSummary, \
+    OperationStats, SlowOperation
 
 
 def assert_common_properties_add(spider_web, values, index=0, level=0) -> None:
@@ -20,6 +25,25 @@ def assert_common_properties_add_node(spider_web: SpiderWeb, nodes: list, index:
     assert_common_properties_add(spider_web, values, index, level)
 
 
+def assert_vertical_links(spider_web: SpiderWeb, max_element_per_level: int) -> None:
+    nodes = []
+    current = spider_web.get_first_node()
+    while current is not None:
+        nodes.append(current)
+        current = current.get_next_node()
+
+    for position, node in enumerate(nodes):
+        above = nodes[position - max_element_per_level] if position >= max_element_per_level else None
+        below = nodes[position + max_element_per_level] if position + max_element_per_level < len(nodes) else None
+        assert_that(node.get_prev_level_node()).is_same_as(above)
+        assert_that(node.get_next_level_node()).is_same_as(below)
+
+    if len(nodes) >= max_element_per_level:
+        assert_that(spider_web.get_prev_level()).is_same_as(nodes[len(nodes) - max_element_per_level])
+    else:
+        assert_that(spider_web.get_prev_level()).is_none()
+
+
 @pytest.fixture(scope="function")
 def spider_web_default_max_element() -> SpiderWeb:
     """
@@ -617,6 +641,43 @@ def test_set(spider_web_with_values: SpiderWeb, level: int, index: int, new_valu
         assert_that(spider_web_with_values.get(level=level, index=index)).is_equal_to(new_value)
 
 
+@pytest.mark.parametrize("operations", [
+    ["add"] * 20,
+    ["add_first"] * 20,
+    ["add"] * 10 + ["remove_last"] * 4 + ["add"] * 6,
+    ["add"] * 10 + ["remove_first"] * 4 + ["add"] * 6,
+    ["add", "add_first"] * 8 + ["remove_last", "remove_first"] * 3 + ["add"] * 5,
+    ["add"] * 4 + ["remove_last"] * 4 + ["add_first"] * 7
+])
+@pytest.mark.spider_web
+def test_get_follows_vertical_links_after_mutations(spider_web_custom_max_element: SpiderWeb, operations: list) -> None:
+    """
+    Test that get, get_node and set reach the correct element through the level links after mixed mutations.
+
+    :param operations: The sequence of mutating SpiderWeb methods to apply.
+    """
+    expected = []
+    for value, operation in enumerate(operations):
+        if operation == "add":
+            spider_web_custom_max_element.add(value)
+            expected.append(value)
+        elif operation == "add_first":
+            spider_web_custom_max_element.add_first(value)
+            expected.insert(0, value)
+        elif operation == "remove_first":
+            assert_that(spider_web_custom_max_element.remove_first()).is_equal_to(expected.pop(0))
+        else:
+            assert_that(spider_web_custom_max_element.remove_last()).is_equal_to(expected.pop())
+
+    assert_vertical_links(spider_web_custom_max_element, 3)
+    for position, value in enumerate(expected):
+        level, index = divmod(position, 3)
+        assert_that(spider_web_custom_max_element.get(level, index)).is_equal_to(value)
+        assert_that(spider_web_custom_max_element.get_node(level, index).get_value()).is_equal_to(value)
+        assert_that(spider_web_custom_max_element.set(level, index, -value)).is_equal_to(value)
+        assert_that(spider_web_custom_max_element.get(level, index)).is_equal_to(-value)
+
+
 @pytest.mark.parametrize("initial_elements, expected_first_value, expected_size, expected_new_first_value", [
     ([], IndexError, 0, None),
     ([1], 1, 0, IndexError),
@@ -746,3 +807,1552 @@ def test_copy_non_empty_spider_web(spider_web_with_values: SpiderWeb) -> None:
         assert_that(spider_web_first_node.get_value()).is_equal_to(copied_first_node.get_value())
         copied_spider_web.remove_first()
         spider_web_with_values.remove_first()
+
+
+@pytest.mark.spider_web
+def test_iter_and_reversed(spider_web_with_values: SpiderWeb) -> None:
+    """
+    Test that iterating a SpiderWeb yields its elements in order and in reverse order.
+    """
+    assert_that(list(spider_web_with_values)).is_equal_to([0, 1, 2, 3, 4, 1, 2, 3])
+    assert_that(list(reversed(spider_web_with_values))).is_equal_to([3, 2, 1, 4, 3, 2, 1, 0])
+
+
+@pytest.mark.spider_web
+def test_iter_empty_spider_web(spider_web_default_max_element: SpiderWeb) -> None:
+    """
+    Test that iterating an empty SpiderWeb yields nothing.
+    """
+    assert_that(list(spider_web_default_max_element)).is_empty()
+    assert_that(list(reversed(spider_web_default_max_element))).is_empty()
+    assert_that(list(spider_web_default_max_element.iter_nodes())).is_empty()
+    assert_that(list(spider_web_default_max_element.iter_with_positions())).is_empty()
+
+
+@pytest.mark.spider_web
+def test_iter_nodes(spider_web_with_nodes: Tuple[SpiderWeb, List[SpiderWebNode]]) -> None:
+    """
+    Test that iter_nodes yields the SpiderWebNodes of the SpiderWeb in order.
+    """
+    spider_web, nodes = spider_web_with_nodes
+    for node, expected_node in zip(spider_web.iter_nodes(), nodes):
+        assert_that(node).is_same_as(expected_node)
+
+
+@pytest.mark.spider_web
+def test_iter_with_positions(spider_web_with_values: SpiderWeb) -> None:
+    """
+    Test that iter_with_positions yields the level, index and value of every element.
+    """
+    result = list(spider_web_with_values.iter_with_positions())
+    assert_that(result).is_equal_to([(0, 0, 0), (0, 1, 1), (0, 2, 2), (1, 0, 3),
+                                     (1, 1, 4), (1, 2, 1), (2, 0, 2), (2, 1, 3)])
+
+
+@pytest.mark.spider_web
+def test_iterators_are_independent(spider_web_with_values: SpiderWeb) -> None:
+    """
+    Test that interleaved iterators over the same SpiderWeb do not share their position.
+    """
+    first_iterator = iter(spider_web_with_values)
+    second_iterator = spider_web_with_values.iter_with_positions()
+    next(first_iterator)
+    next(first_iterator)
+
+    assert_that(next(second_iterator)).is_equal_to((0, 0, 0))
+    assert_that(next(first_iterator)).is_equal_to(2)
+    assert_that(spider_web_with_values.get(1, 1)).is_equal_to(4)
+    assert_that(next(second_iterator)).is_equal_to((0, 1, 1))
+
+
+@pytest.mark.parametrize("level, expected_values", [
+    (0, [0, 1, 2]),
+    (1, [3, 4, 1]),
+    (2, [2, 3]),
+    (-1, ValueError),
+    (3, ValueError)
+])
+@pytest.mark.spider_web
+def test_iter_level(spider_web_with_values: SpiderWeb, level: int, expected_values: Any) -> None:
+    """
+    Test that iter_level yields the elements of a single level.
+
+    :param level: The level to iterate over.
+    :param expected_values: The expected elements or ValueError if an error is expected.
+    """
+    if expected_values == ValueError:
+        with pytest.raises(ValueError):
+            spider_web_with_values.iter_level(level)
+    else:
+        assert_that(list(spider_web_with_values.iter_level(level))).is_equal_to(expected_values)
+
+
+@pytest.mark.spider_web
+def test_concurrent_readers_see_consistent_positions() -> None:
+    """
+    Test that concurrent readers of the same SpiderWeb do not disturb each other's traversal positions.
+    """
+    spider_web = SpiderWeb(max_element_per_level=4, thread_safe=True)
+    for value in range(200):
+        spider_web.add(value)
+    errors = []
+
+    def read() -> None:
+        for value in range(200):
+            if spider_web.index_of(value) != {"level": value // 4, "index": value % 4}:
+                errors.append(value)
+            if spider_web.last_index_of(value) != {"level": value // 4, "index": value % 4}:
+                errors.append(value)
+            if spider_web.get(value // 4, value % 4) != value:
+                errors.append(value)
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert_that(errors).is_empty()
+
+
+@pytest.mark.spider_web
+def test_thread_safe_spider_web_serializes_writers() -> None:
+    """
+    Test that concurrent appends to a thread safe SpiderWeb keep the size and the level bookkeeping intact.
+    """
+    spider_web = SpiderWeb(max_element_per_level=3, thread_safe=True)
+
+    def write() -> None:
+        for value in range(500):
+            spider_web.add(value)
+
+    threads = [threading.Thread(target=write) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert_that(spider_web.size()).is_equal_to(2000)
+    assert_that(len(list(spider_web))).is_equal_to(2000)
+    assert_vertical_links(spider_web, 3)
+
+
+@pytest.mark.spider_web
+def test_copy_keeps_thread_safety(spider_web_default_max_element: SpiderWeb) -> None:
+    """
+    Test that copying a thread safe SpiderWeb returns a thread safe SpiderWeb.
+    """
+    thread_safe_spider_web = SpiderWeb(thread_safe=True)
+    assert_that(thread_safe_spider_web.copy()._lock).is_not_none()
+    assert_that(spider_web_default_max_element.copy()._lock).is_none()
+
+
+@pytest.mark.spider_web
+def test_read_write_lock_allows_concurrent_readers() -> None:
+    """
+    Test that several threads can hold the read lock at the same time.
+    """
+    lock = ReadWriteLock()
+    barrier = threading.Barrier(3, timeout=5)
+    passed = []
+
+    def read() -> None:
+        with lock.read_locked():
+            barrier.wait()
+            passed.append(True)
+
+    threads = [threading.Thread(target=read) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert_that(passed).is_length(3)
+
+
+@pytest.mark.spider_web
+def test_read_write_lock_writer_waits_for_readers() -> None:
+    """
+    Test that the write lock is only granted after the readers released the read lock.
+    """
+    lock = ReadWriteLock()
+    events = []
+    lock.acquire_read()
+
+    def write() -> None:
+        with lock.write_locked():
+            events.append("write")
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    writer.join(timeout=0.1)
+    events.append("read released")
+    lock.release_read()
+    writer.join()
+
+    assert_that(events).is_equal_to(["read released", "write"])
+
+
+@pytest.mark.spider_web
+def test_read_write_lock_is_reentrant() -> None:
+    """
+    Test that the lock can be re-acquired by the thread holding it and rejects upgrades.
+    """
+    lock = ReadWriteLock()
+    with lock.write_locked():
+        with lock.write_locked():
+            with lock.read_locked():
+                pass
+
+    with lock.read_locked():
+        with lock.read_locked():
+            with pytest.raises(RuntimeError):
+                lock.acquire_write()
+
+    with pytest.raises(RuntimeError):
+        lock.release_read()
+    with pytest.raises(RuntimeError):
+        lock.release_write()
+
+
+@pytest.mark.spider_web
+def test_get_first_and_get_last_take_the_read_lock() -> None:
+    """
+    Test that get_first and get_last are both read operations.
+    """
+    assert_that(hasattr(SpiderWeb.get_first, "__wrapped__")).is_true()
+    assert_that(hasattr(SpiderWeb.get_last, "__wrapped__")).is_true()
+
+    spider_web = SpiderWeb.from_iterable(range(10), 3, thread_safe=True)
+    spider_web.enable_stats()
+    spider_web.get_first()
+    spider_web.get_last()
+    assert_that(spider_web.stats()).contains_key("get_first", "get_last")
+
+
+@pytest.mark.parametrize("index_values", [False, True])
+@pytest.mark.spider_web
+def test_count_and_contains(index_values: bool) -> None:
+    """
+    Test the count method and the in operator with and without the value index.
+
+    :param index_values: Whether the SpiderWeb keeps a value index.
+    """
+    spider_web = SpiderWeb(max_element_per_level=3, index_values=index_values)
+    for value in [0, 1, 2, 3, 4, 1, 2, 3]:
+        spider_web.add(value)
+
+    assert_that(spider_web.count(1)).is_equal_to(2)
+    assert_that(spider_web.count(10)).is_equal_to(0)
+    assert_that(spider_web.count([1])).is_equal_to(0)
+    assert_that(4 in spider_web).is_true()
+    assert_that(10 in spider_web).is_false()
+    assert_that([4] in spider_web).is_false()
+
+
+@pytest.mark.parametrize("operations", [
+    [("add", 1), ("add", 2), ("add", 1), ("add_first", 2), ("add_first", 3)],
+    [("add", 1), ("add", 2), ("add", 1), ("remove_first", None), ("remove_last", None), ("add", 2)],
+    [("add", 1), ("add", 1), ("add", 1), ("set", (0, 1, 5)), ("add_first", 5), ("remove_first", None)],
+    [("add", [1]), ("add", 1), ("add_first", [2]), ("set", (0, 0, 2)), ("remove_last", None)],
+    [("add", 1), ("add", 2), ("clear", None), ("add", 2), ("add_first", 1)],
+    [("add", 1)] * 20 + [("add_first", 2)] * 5 + [("remove_first", None)] * 8 + [("add_first", 1)] * 3
+    + [("remove_last", None)] * 6 + [("set", (1, 0, 2)), ("add", 2), ("remove_first", None)],
+    [("add", 2), ("add", 1)] * 10 + [("remove_first", None)] * 7 + [("add_first", 2)] * 4 + [("add", 1)] * 3
+])
+@pytest.mark.spider_web
+def test_value_index_matches_scan(operations: list) -> None:
+    """
+    Test that a SpiderWeb with a value index answers searches like a SpiderWeb that scans.
+
+    :param operations: The sequence of (method, argument) pairs to apply to both SpiderWebs.
+    """
+    indexed = SpiderWeb(max_element_per_level=2, index_values=True)
+    scanned = SpiderWeb(max_element_per_level=2)
+    for name, argument in operations:
+        for spider_web in (indexed, scanned):
+            if name == "set":
+                spider_web.set(*argument)
+            elif argument is None:
+                getattr(spider_web, name)()
+            else:
+                getattr(spider_web, name)(argument)
+
+    for item in [1, 2, 3, 5, [1], [2]]:
+        assert_that(indexed.index_of(item)).is_equal_to(scanned.index_of(item))
+        assert_that(indexed.last_index_of(item)).is_equal_to(scanned.last_index_of(item))
+        assert_that(indexed.count(item)).is_equal_to(scanned.count(item))
+        assert_that(item in indexed).is_equal_to(item in scanned)
+
+
+@pytest.mark.spider_web
+def test_enable_and_disable_value_index(spider_web_with_values: SpiderWeb) -> None:
+    """
+    Test that the value index can be built for an existing SpiderWeb and dropped again.
+    """
+    spider_web_with_values.enable_value_index()
+    spider_web_with_values.add_first(4)
+
+    assert_that(spider_web_with_values.index_of(4)).is_equal_to({"level": 0, "index": 0})
+    assert_that(spider_web_with_values.last_index_of(3)).is_equal_to({"level": 2, "index": 2})
+    assert_that(spider_web_with_values.copy()._value_index).is_not_none()
+
+    spider_web_with_values.disable_value_index()
+    assert_that(spider_web_with_values.index_of(1)).is_equal_to({"level": 0, "index": 2})
+
+
+@pytest.mark.parametrize("initial_count, extend_count", [
+    (0, 0),
+    (0, 2),
+    (0, 3),
+    (0, 10),
+    (2, 1),
+    (3, 7),
+    (4, 11)
+])
+@pytest.mark.spider_web
+def test_extend_matches_add(initial_count: int, extend_count: int) -> None:
+    """
+    Test that extend builds the same SpiderWeb as a loop of add calls.
+
+    :param initial_count: The number of elements added before extending.
+    :param extend_count: The number of elements passed to extend.
+    """
+    extended = SpiderWeb(max_element_per_level=3)
+    added = SpiderWeb(max_element_per_level=3)
+    for value in range(initial_count):
+        extended.add(value)
+        added.add(value)
+
+    extended.extend(value for value in range(initial_count, initial_count + extend_count))
+    for value in range(initial_count, initial_count + extend_count):
+        added.add(value)
+
+    assert_that(list(extended)).is_equal_to(list(added))
+    assert_that(list(reversed(extended))).is_equal_to(list(reversed(added)))
+    assert_that(extended.size()).is_equal_to(added.size())
+    assert_that(extended.get_level()).is_equal_to(added.get_level())
+    assert_that(extended.get_index()).is_equal_to(added.get_index())
+    assert_vertical_links(extended, 3)
+    extended.add("next")
+    assert_vertical_links(extended, 3)
+
+
+@pytest.mark.spider_web
+def test_extend_keeps_consumed_elements_when_iterable_fails() -> None:
+    """
+    Test that the elements consumed before the iterable raised stay in a consistent SpiderWeb.
+    """
+    def failing():
+        yield from range(5)
+        raise RuntimeError("source failed")
+
+    spider_web = SpiderWeb(max_element_per_level=3)
+    with pytest.raises(RuntimeError):
+        spider_web.extend(failing())
+
+    assert_that(list(spider_web)).is_equal_to([0, 1, 2, 3, 4])
+    assert_that(spider_web.get_level()).is_equal_to(1)
+    assert_that(spider_web.get_index()).is_equal_to(1)
+    assert_vertical_links(spider_web, 3)
+
+
+@pytest.mark.spider_web
+def test_from_iterable() -> None:
+    """
+    Test that from_iterable creates a SpiderWeb with the elements and the options passed to it.
+    """
+    spider_web = SpiderWeb.from_iterable(iter("abcdefg"), 3, index_values=True)
+
+    assert_that(list(spider_web)).is_equal_to(list("abcdefg"))
+    assert_that(spider_web.get(2, 0)).is_equal_to("g")
+    assert_that(spider_web.index_of("e")).is_equal_to({"level": 1, "index": 1})
+    assert_that(spider_web._max_element_per_level).is_equal_to(3)
+
+
+@pytest.mark.spider_web
+def test_copy_rebuilds_level_links(spider_web_with_values: SpiderWeb) -> None:
+    """
+    Test that copy rebuilds the horizontal and vertical links of the SpiderWeb.
+    """
+    copied_spider_web = spider_web_with_values.copy()
+
+    assert_that(list(copied_spider_web)).is_equal_to(list(spider_web_with_values))
+    assert_vertical_links(copied_spider_web, 3)
+    assert_that(copied_spider_web.get_level()).is_equal_to(2)
+    assert_that(copied_spider_web.get_index()).is_equal_to(1)
+
+
+@pytest.mark.parametrize("operation", [
+    lambda spider_web: spider_web.add(100),
+    lambda spider_web: spider_web.extend([100, 101, 102, 103]),
+    lambda spider_web: spider_web.add_first(100),
+    lambda spider_web: spider_web.set(1, 1, 100),
+    lambda spider_web: spider_web.remove_first(),
+    lambda spider_web: spider_web.remove_last(),
+    lambda spider_web: spider_web.clear()
+])
+@pytest.mark.spider_web
+def test_snapshot_is_isolated_from_the_source(spider_web_with_values: SpiderWeb, operation) -> None:
+    """
+    Test that mutating the source SpiderWeb does not change a snapshot taken before.
+
+    :param operation: The mutation applied to the source SpiderWeb.
+    """
+    snapshot = spider_web_with_values.snapshot()
+    operation(spider_web_with_values)
+    spider_web_with_values.add(200)
+
+    assert_that(list(snapshot)).is_equal_to([0, 1, 2, 3, 4, 1, 2, 3])
+    assert_that(list(reversed(snapshot))).is_equal_to([3, 2, 1, 4, 3, 2, 1, 0])
+    assert_that(snapshot.size()).is_equal_to(8)
+    assert_that(snapshot.get(2, 1)).is_equal_to(3)
+    assert_that(snapshot.index_of(200)).is_equal_to({"level": None, "index": None})
+    assert_that(list(snapshot.copy())).is_equal_to([0, 1, 2, 3, 4, 1, 2, 3])
+
+
+@pytest.mark.parametrize("operation", [
+    lambda spider_web: spider_web.add(100),
+    lambda spider_web: spider_web.add_first(100),
+    lambda spider_web: spider_web.set(0, 0, 100),
+    lambda spider_web: spider_web.remove_first(),
+    lambda spider_web: spider_web.remove_last(),
+    lambda spider_web: spider_web.clear()
+])
+@pytest.mark.spider_web
+def test_snapshot_mutations_do_not_change_the_source(spider_web_with_values: SpiderWeb, operation) -> None:
+    """
+    Test that mutating a snapshot does not change the SpiderWeb it was taken from.
+
+    :param operation: The mutation applied to the snapshot.
+    """
+    snapshot = spider_web_with_values.snapshot()
+    spider_web_with_values.add(200)
+    operation(snapshot)
+    snapshot.add(300)
+
+    assert_that(list(spider_web_with_values)).is_equal_to([0, 1, 2, 3, 4, 1, 2, 3, 200])
+    assert_vertical_links(spider_web_with_values, 3)
+    assert_vertical_links(snapshot, 3)
+    assert_that(snapshot.get_last()).is_equal_to(300)
+
+
+@pytest.mark.spider_web
+def test_snapshot_shares_nodes_until_a_mutation(spider_web_with_values: SpiderWeb) -> None:
+    """
+    Test that taking a snapshot and appending to the source do not copy any nodes.
+    """
+    first_node = spider_web_with_values.get_first_node()
+    snapshot = spider_web_with_values.snapshot()
+    spider_web_with_values.add(100)
+
+    assert_that(snapshot.get_first_node()).is_same_as(first_node)
+    assert_that(spider_web_with_values.get_first_node()).is_same_as(first_node)
+
+    spider_web_with_values.set(0, 0, 10)
+    assert_that(spider_web_with_values.get_first_node()).is_not_same_as(first_node)
+    assert_that(snapshot.get_first_node()).is_same_as(first_node)
+    assert_that(snapshot.get_first()).is_equal_to(0)
+
+
+@pytest.mark.spider_web
+def test_source_keeps_its_nodes_when_snapshots_are_gone(spider_web_with_values: SpiderWeb) -> None:
+    """
+    Test that the source does not copy its nodes once every snapshot was garbage collected.
+    """
+    second_node = spider_web_with_values.get_first_node().get_next_node()
+    snapshot = spider_web_with_values.snapshot()
+    del snapshot
+
+    spider_web_with_values.remove_first()
+    assert_that(spider_web_with_values.get_first_node()).is_same_as(second_node)
+
+
+@pytest.mark.spider_web
+def test_snapshot_of_a_snapshot(spider_web_with_values: SpiderWeb) -> None:
+    """
+    Test that a snapshot of a snapshot stays isolated from the source once the snapshot in between is gone.
+    """
+    nested_snapshot = spider_web_with_values.snapshot().snapshot()
+    gc.collect()
+
+    spider_web_with_values.set(0, 0, "X")
+    assert_that(nested_snapshot.get(0, 0)).is_equal_to(0)
+    assert_that(list(nested_snapshot)).is_equal_to([0, 1, 2, 3, 4, 1, 2, 3])
+
+    snapshot = nested_snapshot.snapshot()
+    snapshot.add(9)
+    nested_snapshot.set(0, 1, "Y")
+    assert_that(list(snapshot)).is_equal_to([0, 1, 2, 3, 4, 1, 2, 3, 9])
+    assert_that(list(nested_snapshot)).is_equal_to([0, "Y", 2, 3, 4, 1, 2, 3])
+
+
+@pytest.mark.spider_web
+def test_source_keeps_its_nodes_when_snapshots_unshared(spider_web_with_values: SpiderWeb) -> None:
+    """
+    Test that the source does not copy its nodes once every live snapshot copied its own nodes.
+    """
+    second_node = spider_web_with_values.get_first_node().get_next_node()
+    snapshot = spider_web_with_values.snapshot()
+    nested_snapshot = snapshot.snapshot()
+    snapshot.add(8)
+    nested_snapshot.remove_last()
+
+    spider_web_with_values.remove_first()
+    assert_that(spider_web_with_values.get_first_node()).is_same_as(second_node)
+    assert_that(list(snapshot)).is_equal_to([0, 1, 2, 3, 4, 1, 2, 3, 8])
+    assert_that(list(nested_snapshot)).is_equal_to([0, 1, 2, 3, 4, 1, 2])
+
+
+@pytest.mark.spider_web
+def test_snapshot_of_empty_spider_web(spider_web_default_max_element: SpiderWeb) -> None:
+    """
+    Test that a snapshot of an empty SpiderWeb is an independent empty SpiderWeb.
+    """
+    snapshot = spider_web_default_max_element.snapshot()
+    snapshot.add(1)
+
+    assert_that(spider_web_default_max_element).is_empty()
+    assert_that(list(snapshot)).is_equal_to([1])
+
+
+@pytest.mark.spider_web
+def test_add_first_does_not_walk_the_level(monkeypatch) -> None:
+    """
+    Test that add_first links the new head to the next level without walking along a level.
+    """
+    spider_web = SpiderWeb(max_element_per_level=100)
+    spider_web.extend(range(250))
+    hops = []
+    get_next_node = SpiderWebNode.get_next_node
+    monkeypatch.setattr(SpiderWebNode, "get_next_node", lambda node: hops.append(node) or get_next_node(node))
+
+    for value in range(5):
+        spider_web.add_first(-value)
+
+    monkeypatch.undo()
+    assert_that(hops).is_empty()
+    assert_vertical_links(spider_web, 100)
+    assert_that(spider_web.get(1, 0)).is_equal_to(95)
+
+
+@pytest.mark.parametrize("element_count", [2, 3, 4, 6, 7])
+@pytest.mark.spider_web
+def test_add_first_keeps_levels_and_links(spider_web_custom_max_element: SpiderWeb, element_count: int) -> None:
+    """
+    Test that add_first keeps the positions and the vertical links correct around level boundaries.
+
+    :param element_count: The number of elements prepended to the SpiderWeb.
+    """
+    for value in range(element_count):
+        spider_web_custom_max_element.add_first(value)
+        assert_vertical_links(spider_web_custom_max_element, 3)
+
+    assert_that(list(spider_web_custom_max_element)).is_equal_to(list(reversed(range(element_count))))
+    assert_that(spider_web_custom_max_element.get_level()).is_equal_to((element_count - 1) // 3)
+    assert_that(spider_web_custom_max_element.get_index()).is_equal_to((element_count - 1) % 3)
+
+
+@pytest.mark.parametrize("position, expected_value", [
+    (0, 0),
+    (4, 4),
+    (7, 3),
+    (-1, 3),
+    (-8, 0),
+    (8, IndexError),
+    (-9, IndexError)
+])
+@pytest.mark.spider_web
+def test_getitem_with_flat_position(spider_web_with_values: SpiderWeb, position: int, expected_value: Any) -> None:
+    """
+    Test reading elements by their flat position.
+
+    :param position: The flat position of the element.
+    :param expected_value: The expected element or IndexError if an error is expected.
+    """
+    if expected_value == IndexError:
+        with pytest.raises(IndexError, match=f"out of range: {position}$"):
+            spider_web_with_values[position]
+    else:
+        assert_that(spider_web_with_values[position]).is_equal_to(expected_value)
+
+
+@pytest.mark.spider_web
+def test_setitem_with_flat_position(spider_web_with_values: SpiderWeb) -> None:
+    """
+    Test replacing elements by their flat position.
+    """
+    spider_web_with_values[4] = 40
+    spider_web_with_values[-1] = 30
+
+    assert_that(spider_web_with_values.get(1, 1)).is_equal_to(40)
+    assert_that(spider_web_with_values.get(2, 1)).is_equal_to(30)
+    with pytest.raises(IndexError):
+        spider_web_with_values[8] = 0
+    with pytest.raises(TypeError):
+        spider_web_with_values[0:2] = [1, 2]
+
+
+@pytest.mark.parametrize("key", [
+    slice(None),
+    slice(2, 6),
+    slice(1, None, 3),
+    slice(None, None, 4),
+    slice(None, None, -1),
+    slice(-2, 1, -2),
+    slice(6, 2),
+    slice(-100, 100, 7)
+])
+@pytest.mark.spider_web
+def test_getitem_with_slice(key: slice) -> None:
+    """
+    Test that slicing a SpiderWeb returns a lazy view matching list slicing.
+
+    :param key: The slice to apply.
+    """
+    values = list(range(20))
+    spider_web = SpiderWeb.from_iterable(values, 3)
+
+    view = spider_web[key]
+    assert_that(view).is_instance_of(SpiderWebView)
+    assert_that(list(view)).is_equal_to(values[key])
+    assert_that(len(view)).is_equal_to(len(values[key]))
+
+
+@pytest.mark.spider_web
+def test_slice_view_is_lazy(spider_web_with_values: SpiderWeb) -> None:
+    """
+    Test that a slice view reads the current elements and writes through to the SpiderWeb.
+    """
+    view = spider_web_with_values[2:6]
+    spider_web_with_values[3] = 30
+    view[0] = 20
+
+    assert_that(list(view)).is_equal_to([20, 30, 4, 1])
+    assert_that(view[-1]).is_equal_to(1)
+    assert_that(list(view[1:3])).is_equal_to([30, 4])
+    assert_that(spider_web_with_values.get(0, 2)).is_equal_to(20)
+    assert_that(str(view)).is_equal_to("SpiderWebView(start=2, stop=6, step=1, size=4)")
+
+
+@pytest.mark.parametrize("thread_safe", [False, True])
+@pytest.mark.parametrize("method, arguments", [("remove_last", (5,)), ("clear", ())])
+@pytest.mark.spider_web
+def test_view_after_the_spider_web_shrinks(thread_safe: bool, method: str, arguments: tuple) -> None:
+    """
+    Test that iterating a slice or level view whose positions no longer exist raises IndexError, like item
+    access does.
+
+    :param thread_safe: Whether the SpiderWeb is thread safe.
+    :param method: The method that removes elements from the SpiderWeb.
+    :param arguments: The arguments of the method.
+    """
+    spider_web = SpiderWeb.from_iterable(range(12), 3, thread_safe=thread_safe)
+    view = spider_web[0:10]
+    reversed_view = spider_web[9::-3]
+    level_view = spider_web.get_level_values(3)
+    getattr(spider_web, method)(*arguments)
+
+    for stale_view in [view, reversed_view, level_view]:
+        with pytest.raises(IndexError):
+            list(stale_view)
+    with pytest.raises(IndexError):
+        view[-1]
+    with pytest.raises(IndexError):
+        reversed_view[0]
+    with pytest.raises(IndexError):
+        level_view[0]
+    assert_that(list(spider_web[0:spider_web.size()])).is_equal_to(list(spider_web))
+    # The iteration released the read lock again.
+    spider_web.add(12)
+
+
+@pytest.mark.parametrize("level, expected_values", [
+    (0, [0, 1, 2]),
+    (1, [3, 4, 1]),
+    (2, [2, 3]),
+    (-1, ValueError),
+    (3, ValueError)
+])
+@pytest.mark.spider_web
+def test_get_level_values(spider_web_with_values: SpiderWeb, level: int, expected_values: Any) -> None:
+    """
+    Test that get_level_values returns a view over a single level.
+
+    :param level: The level to view.
+    :param expected_values: The expected elements or ValueError if an error is expected.
+    """
+    if expected_values == ValueError:
+        with pytest.raises(ValueError):
+            spider_web_with_values.get_level_values(level)
+    else:
+        row = spider_web_with_values.get_level_values(level)
+        assert_that(row).is_instance_of(SpiderWebView)
+        assert_that(len(row)).is_equal_to(len(expected_values))
+        assert_that(list(row)).is_equal_to(expected_values)
+        assert_that(row[-1]).is_equal_to(expected_values[-1])
+
+
+@pytest.mark.spider_web
+def test_set_level_values() -> None:
+    """
+    Test that set_level_values replaces a whole level and keeps the value index up to date.
+    """
+    spider_web = SpiderWeb.from_iterable([0, 1, 2, 3, 4, 1, 2, 3], 3, index_values=True)
+
+    old_values = spider_web.set_level_values(1, ["a", "b", "c"])
+
+    assert_that(old_values).is_equal_to([3, 4, 1])
+    assert_that(list(spider_web)).is_equal_to([0, 1, 2, "a", "b", "c", 2, 3])
+    assert_that(spider_web.index_of("b")).is_equal_to({"level": 1, "index": 1})
+    assert_that(spider_web.last_index_of(1)).is_equal_to({"level": 0, "index": 1})
+    assert_that(spider_web.count(4)).is_equal_to(0)
+
+
+@pytest.mark.parametrize("level, values", [
+    (2, [1, 2, 3]),
+    (0, [1, 2]),
+    (3, [1])
+])
+@pytest.mark.spider_web
+def test_set_level_values_rejects_invalid_input(spider_web_with_values: SpiderWeb, level: int, values: list) -> None:
+    """
+    Test that set_level_values rejects invalid levels and values that do not fill the level exactly.
+
+    :param level: The level to replace.
+    :param values: The new elements.
+    """
+    with pytest.raises(ValueError):
+        spider_web_with_values.set_level_values(level, values)
+    assert_that(list(spider_web_with_values)).is_equal_to([0, 1, 2, 3, 4, 1, 2, 3])
+
+
+def brute_force_summary(values: list) -> Any:
+    if not values:
+        return None
+    return AggregateSummary(len(values), sum(values), min(values), max(values))
+
+
+@pytest.mark.parametrize("start, end", [
+    (0, None),
+    (0, 8),
+    (1, 7),
+    (3, 6),
+    (2, 4),
+    (5, 5),
+    (7, 8)
+])
+@pytest.mark.spider_web
+def test_aggregate(spider_web_with_values: SpiderWeb, start: int, end: Any) -> None:
+    """
+    Test that aggregate summarizes a range of flat positions with and without the level summaries.
+
+    :param start: The flat position of the first element in the range.
+    :param end: The flat position after the last element in the range.
+    """
+    expected_summary = brute_force_summary([0, 1, 2, 3, 4, 1, 2, 3][start:end])
+
+    assert_that(spider_web_with_values.aggregate(start, end)).is_equal_to(expected_summary)
+    spider_web_with_values.enable_aggregates()
+    assert_that(spider_web_with_values.aggregate(start, end)).is_equal_to(expected_summary)
+    assert_that(spider_web_with_values.aggregate(start, end)).is_equal_to(expected_summary)
+
+
+@pytest.mark.parametrize("start, end", [(-1, 3), (3, 2), (0, 9)])
+@pytest.mark.spider_web
+def test_aggregate_rejects_invalid_range(spider_web_with_values: SpiderWeb, start: int, end: int) -> None:
+    """
+    Test that aggregate rejects ranges that do not lie within the SpiderWeb.
+
+    :param start: The flat position of the first element in the range.
+    :param end: The flat position after the last element in the range.
+    """
+    with pytest.raises(IndexError):
+        spider_web_with_values.aggregate(start, end)
+
+
+@pytest.mark.spider_web
+def test_aggregate_follows_mutations() -> None:
+    """
+    Test that the level summaries stay correct through every kind of mutation.
+    """
+    spider_web = SpiderWeb(max_element_per_level=3)
+    spider_web.enable_aggregates()
+    values = []
+    mutations = [
+        lambda value: (spider_web.add(value), values.append(value)),
+        lambda value: (spider_web.add_first(value), values.insert(0, value)),
+        lambda value: (spider_web.extend([value, value + 1]), values.extend([value, value + 1])),
+        lambda value: values and (spider_web.set(0, 0, value), values.__setitem__(0, value)),
+        lambda value: values and (spider_web.remove_first(), values.pop(0)),
+        lambda value: values and (spider_web.remove_last(), values.pop()),
+        lambda value: len(values) >= 3 and (spider_web.set_level_values(0, [value] * 3), values.__setitem__(
+            slice(0, 3), [value] * 3))
+    ]
+
+    for step in range(200):
+        mutations[(step * 7) % len(mutations)](step % 17)
+        if step % 5 == 0:
+            mutations[0](step)
+        for start in range(0, len(values), 2):
+            assert_that(spider_web.aggregate(start)).is_equal_to(brute_force_summary(values[start:]))
+
+
+@pytest.mark.spider_web
+def test_aggregate_with_custom_monoid(spider_web_with_values: SpiderWeb) -> None:
+    """
+    Test that aggregate uses the monoid given to enable_aggregates, and that copies keep it.
+    """
+    spider_web_with_values.enable_aggregates(AggregateMonoid(lift=lambda value: [value], combine=lambda a, b: a + b))
+
+    assert_that(spider_web_with_values.aggregate(1, 7)).is_equal_to([1, 2, 3, 4, 1, 2])
+    assert_that(spider_web_with_values.copy().aggregate()).is_equal_to([0, 1, 2, 3, 4, 1, 2, 3])
+    spider_web_with_values.disable_aggregates()
+    assert_that(spider_web_with_values.aggregate(0, 2)).is_equal_to(AggregateSummary(2, 1, 0, 1))
+
+
+@pytest.mark.parametrize("level, index, expected_values", [
+    (0, 0, [9, 0, 1, 2, 3, 4, 1, 2, 3]),
+    (0, 2, [0, 1, 9, 2, 3, 4, 1, 2, 3]),
+    (1, 0, [0, 1, 2, 9, 3, 4, 1, 2, 3]),
+    (2, 1, [0, 1, 2, 3, 4, 1, 2, 9, 3]),
+    (2, 2, [0, 1, 2, 3, 4, 1, 2, 3, 9])
+])
+@pytest.mark.spider_web
+def test_insert(spider_web_with_values: SpiderWeb, level: int, index: int, expected_values: list) -> None:
+    """
+    Test that insert places the element at the specified position and keeps the level links consistent.
+
+    :param level: The level at which to insert the element.
+    :param index: The index within the specified level at which to insert the element.
+    :param expected_values: The expected elements after the insertion.
+    """
+    spider_web_with_values.insert(level, index, 9)
+
+    assert_that(list(spider_web_with_values)).is_equal_to(expected_values)
+    assert_that(spider_web_with_values.get_level()).is_equal_to(2)
+    assert_that(spider_web_with_values.get_index()).is_equal_to(2)
+    assert_vertical_links(spider_web_with_values, 3)
+
+
+@pytest.mark.parametrize("level, index", [(-1, 0), (0, 3), (2, 3), (3, 0)])
+@pytest.mark.spider_web
+def test_insert_rejects_invalid_position(spider_web_with_values: SpiderWeb, level: int, index: int) -> None:
+    """
+    Test that insert rejects positions that are neither occupied nor right after the last element.
+
+    :param level: The level at which to insert the element.
+    :param index: The index within the specified level at which to insert the element.
+    """
+    with pytest.raises(ValueError):
+        spider_web_with_values.insert(level, index, 9)
+    assert_that(list(spider_web_with_values)).is_equal_to([0, 1, 2, 3, 4, 1, 2, 3])
+
+
+@pytest.mark.parametrize("level, index, expected_value, expected_values", [
+    (0, 0, 0, [1, 2, 3, 4, 1, 2, 3]),
+    (0, 2, 2, [0, 1, 3, 4, 1, 2, 3]),
+    (1, 1, 4, [0, 1, 2, 3, 1, 2, 3]),
+    (2, 0, 2, [0, 1, 2, 3, 4, 1, 3]),
+    (2, 1, 3, [0, 1, 2, 3, 4, 1, 2])
+])
+@pytest.mark.spider_web
+def test_remove_at(
+        spider_web_with_values: SpiderWeb,
+        level: int,
+        index: int,
+        expected_value: int,
+        expected_values: list
+) -> None:
+    """
+    Test that remove_at removes the element at the specified position and keeps the level links consistent.
+
+    :param level: The level of the element to remove.
+    :param index: The index within the specified level of the element to remove.
+    :param expected_value: The expected removed element.
+    :param expected_values: The expected elements after the removal.
+    """
+    assert_that(spider_web_with_values.remove_at(level, index)).is_equal_to(expected_value)
+
+    assert_that(list(spider_web_with_values)).is_equal_to(expected_values)
+    assert_that(spider_web_with_values.get_level()).is_equal_to(2)
+    assert_that(spider_web_with_values.get_index()).is_equal_to(0)
+    assert_vertical_links(spider_web_with_values, 3)
+    with pytest.raises(ValueError):
+        spider_web_with_values.remove_at(2, 1)
+
+
+@pytest.mark.parametrize("max_element_per_level", [1, 2, 3, 5])
+@pytest.mark.spider_web
+def test_insert_and_remove_at_match_a_list(max_element_per_level: int) -> None:
+    """
+    Test that a mix of insertions and removals agrees with a list, including the value index and aggregates.
+
+    :param max_element_per_level: The maximum number of elements per level.
+    """
+    spider_web = SpiderWeb(max_element_per_level, index_values=True)
+    spider_web.enable_aggregates()
+    values = []
+
+    for step in range(120):
+        if step % 3 == 2 and values:
+            position = (step * 5) % len(values)
+            assert_that(spider_web.remove_at(*divmod(position, max_element_per_level))).is_equal_to(
+                values.pop(position))
+        else:
+            position = (step * 7) % (len(values) + 1)
+            spider_web.insert(*divmod(position, max_element_per_level), step % 11)
+            values.insert(position, step % 11)
+
+        assert_that(list(spider_web)).is_equal_to(values)
+        assert_that(list(reversed(spider_web))).is_equal_to(values[::-1])
+        assert_vertical_links(spider_web, max_element_per_level)
+        for value in range(11):
+            expected_position = values.index(value) if value in values else None
+            assert_that(spider_web.index_of(value)["level"]).is_equal_to(
+                None if expected_position is None else expected_position // max_element_per_level)
+            assert_that(spider_web.count(value)).is_equal_to(values.count(value))
+        assert_that(spider_web.aggregate()).is_equal_to(brute_force_summary(values))
+
+
+@pytest.mark.spider_web
+def test_insert_and_remove_at_leave_snapshots_alone(spider_web_with_values: SpiderWeb) -> None:
+    """
+    Test that insert and remove_at on the source SpiderWeb do not change a snapshot taken before.
+    """
+    snapshot = spider_web_with_values.snapshot()
+
+    spider_web_with_values.insert(1, 1, 9)
+    spider_web_with_values.remove_at(0, 1)
+
+    assert_that(list(spider_web_with_values)).is_equal_to([0, 2, 3, 9, 4, 1, 2, 3])
+    assert_that(list(snapshot)).is_equal_to([0, 1, 2, 3, 4, 1, 2, 3])
+    assert_vertical_links(snapshot, 3)
+
+
+@pytest.mark.spider_web
+def test_index_of_node_uses_the_node_numbers(monkeypatch, spider_web_with_values: SpiderWeb) -> None:
+    """
+    Test that index_of and last_index_of find a node of the SpiderWeb without searching the chain, and that
+    adding at either end keeps the node numbers.
+    """
+    spider_web_with_values.index_of(node=spider_web_with_values.get_first_node())
+    spider_web_with_values.add_first(-1)
+    spider_web_with_values.add(8)
+    spider_web_with_values.extend([9, 10])
+    nodes = list(spider_web_with_values.iter_nodes())
+    monkeypatch.setattr(SpiderWebNode, "get_next_node", lambda node: pytest.fail("walked the chain"))
+    monkeypatch.setattr(SpiderWebNode, "get_prev_node", lambda node: pytest.fail("walked the chain"))
+
+    for position, node in enumerate(nodes):
+        expected_result = {"level": position // 3, "index": position % 3}
+        assert_that(spider_web_with_values.index_of(node=node)).is_equal_to(expected_result)
+        assert_that(spider_web_with_values.last_index_of(node=node)).is_equal_to(expected_result)
+
+
+@pytest.mark.spider_web
+def test_remove_node() -> None:
+    """
+    Test that remove_node unlinks nodes anywhere in the SpiderWeb and keeps the positions of the others.
+    """
+    spider_web = SpiderWeb.from_iterable(range(20), 3)
+    values = list(range(20))
+    nodes = {node.get_value(): node for node in spider_web.iter_nodes()}
+    spider_web.insert(2, 1, 100)
+    values.insert(7, 100)
+    nodes[100] = spider_web.get_node(2, 1)
+
+    for value in [10, 0, 19, 5, 6, 18, 1, 100]:
+        assert_that(spider_web.remove_node(nodes.pop(value))).is_equal_to(value)
+        values.remove(value)
+
+        assert_that(list(spider_web)).is_equal_to(values)
+        assert_vertical_links(spider_web, 3)
+        for position, remaining in enumerate(values):
+            if remaining in nodes:
+                assert_that(spider_web.index_of(node=nodes[remaining])).is_equal_to(
+                    {"level": position // 3, "index": position % 3})
+
+
+@pytest.mark.spider_web
+def test_remove_node_while_a_snapshot_is_alive(spider_web_with_values: SpiderWeb) -> None:
+    """
+    Test that remove_node removes the node at the position of the handle while a snapshot shares the nodes.
+    """
+    snapshot = spider_web_with_values.snapshot()
+
+    assert_that(spider_web_with_values.remove_node(spider_web_with_values.get_node(1, 1))).is_equal_to(4)
+
+    assert_that(list(spider_web_with_values)).is_equal_to([0, 1, 2, 3, 1, 2, 3])
+    assert_vertical_links(spider_web_with_values, 3)
+    assert_that(list(snapshot)).is_equal_to([0, 1, 2, 3, 4, 1, 2, 3])
+    assert_that(snapshot.remove_node(snapshot.get_node(0, 0))).is_equal_to(0)
+    assert_that(list(snapshot)).is_equal_to([1, 2, 3, 4, 1, 2, 3])
+
+
+@pytest.mark.spider_web
+def test_remove_node_rejects_foreign_nodes(spider_web_with_values: SpiderWeb) -> None:
+    """
+    Test that remove_node rejects nodes that were removed, belong to another SpiderWeb or were never added.
+    """
+    removed_node = spider_web_with_values.get_node(2, 1)
+    spider_web_with_values.remove_last()
+    other_spider_web = SpiderWeb.from_iterable([1, 2, 3], 3)
+
+    for node in [removed_node, other_spider_web.get_first_node(), SpiderWebNode(1)]:
+        with pytest.raises(ValueError):
+            spider_web_with_values.remove_node(node)
+        assert_that(spider_web_with_values.index_of(node=node)).is_equal_to({"level": None, "index": None})
+    assert_that(spider_web_with_values.size()).is_equal_to(7)
+
+
+@pytest.mark.spider_web
+def test_node_handles_after_copy_on_write(spider_web_with_values: SpiderWeb) -> None:
+    """
+    Test that node handles stop resolving once the SpiderWeb copies its nodes away from a snapshot.
+    """
+    node = spider_web_with_values.get_node(1, 0)
+    snapshot = spider_web_with_values.snapshot()
+    spider_web_with_values.add(8)
+    assert_that(spider_web_with_values.index_of(node=node)).is_equal_to({"level": 1, "index": 0})
+
+    spider_web_with_values.remove_first()
+
+    assert_that(spider_web_with_values.index_of(node=node)).is_equal_to({"level": None, "index": None})
+    assert_that(snapshot.index_of(node=node)).is_equal_to({"level": 1, "index": 0})
+    new_node = spider_web_with_values.get_node(0, 2)
+    assert_that(spider_web_with_values.remove_node(new_node)).is_equal_to(3)
+    assert_that(list(spider_web_with_values)).is_equal_to([1, 2, 4, 1, 2, 3, 8])
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 3, 4, 6, 7, 8])
+@pytest.mark.spider_web
+def test_remove_first_and_last_with_count(count: int) -> None:
+    """
+    Test that removing a batch from either end matches removing the elements one by one.
+
+    :param count: The number of elements to remove.
+    """
+    values = [0, 1, 2, 3, 4, 1, 2, 3]
+    for method, expected_removed, expected_values in [
+        ("remove_first", values[:count], values[count:]),
+        ("remove_last", values[::-1][:count], values[:len(values) - count])
+    ]:
+        spider_web = SpiderWeb.from_iterable(values, 3, index_values=True)
+        spider_web.enable_aggregates()
+
+        assert_that(getattr(spider_web, method)(count)).is_equal_to(expected_removed)
+
+        assert_that(list(spider_web)).is_equal_to(expected_values)
+        assert_that(list(reversed(spider_web))).is_equal_to(expected_values[::-1])
+        assert_that(spider_web.size()).is_equal_to(len(expected_values))
+        assert_that(spider_web.get_level()).is_equal_to((len(expected_values) - 1) // 3 if expected_values else -1)
+        assert_vertical_links(spider_web, 3)
+        assert_that(spider_web.count(1)).is_equal_to(expected_values.count(1))
+        assert_that(spider_web.aggregate()).is_equal_to(brute_force_summary(expected_values))
+        spider_web.add(9)
+        spider_web.add_first(-1)
+        assert_that(list(spider_web)).is_equal_to([-1] + expected_values + [9])
+        assert_vertical_links(spider_web, 3)
+
+
+@pytest.mark.parametrize("count, expected_error", [(-1, ValueError), (9, IndexError)])
+@pytest.mark.spider_web
+def test_remove_with_invalid_count(spider_web_with_values: SpiderWeb, count: int, expected_error: type) -> None:
+    """
+    Test that batch removal rejects negative counts and counts larger than the SpiderWeb.
+
+    :param count: The number of elements to remove.
+    :param expected_error: The expected exception.
+    """
+    with pytest.raises(expected_error):
+        spider_web_with_values.remove_first(count)
+    with pytest.raises(expected_error):
+        spider_web_with_values.remove_last(count)
+    assert_that(spider_web_with_values.size()).is_equal_to(8)
+
+
+@pytest.mark.spider_web
+def test_drain(spider_web_with_values: SpiderWeb) -> None:
+    """
+    Test that drain removes batches from the beginning and stops quietly when the SpiderWeb runs out.
+    """
+    first_node = spider_web_with_values.get_first_node()
+
+    assert_that(list(spider_web_with_values.drain(5))).is_equal_to([0, 1, 2, 3, 4])
+    assert_that(spider_web_with_values.index_of(node=first_node)).is_equal_to({"level": None, "index": None})
+    assert_that(list(spider_web_with_values)).is_equal_to([1, 2, 3])
+    assert_that(list(spider_web_with_values.drain(5))).is_equal_to([1, 2, 3])
+    assert_that(list(spider_web_with_values.drain())).is_empty()
+
+    spider_web_with_values.extend(range(4))
+    assert_that(list(spider_web_with_values.drain())).is_equal_to([0, 1, 2, 3])
+    assert_that(spider_web_with_values).is_empty()
+    with pytest.raises(ValueError):
+        spider_web_with_values.drain(-1)
+
+
+@pytest.mark.spider_web
+def test_drain_leaves_snapshots_alone(spider_web_with_values: SpiderWeb) -> None:
+    """
+    Test that draining the source SpiderWeb does not change a snapshot taken before.
+    """
+    snapshot = spider_web_with_values.snapshot()
+
+    assert_that(list(spider_web_with_values.drain(4))).is_equal_to([0, 1, 2, 3])
+    assert_that(spider_web_with_values.remove_last(2)).is_equal_to([3, 2])
+
+    assert_that(list(spider_web_with_values)).is_equal_to([4, 1])
+    assert_that(list(snapshot)).is_equal_to([0, 1, 2, 3, 4, 1, 2, 3])
+    assert_vertical_links(snapshot, 3)
+
+
+@pytest.mark.parametrize("capacity, overflow, expected_values", [
+    (5, "drop_oldest", [5, 6, 7, 8, 9]),
+    (5, "drop_newest", [0, 1, 2, 3, 4]),
+    (1, "drop_oldest", [9]),
+    (10, "drop_oldest", list(range(10)))
+])
+@pytest.mark.spider_web
+def test_bounded_add(capacity: int, overflow: str, expected_values: list) -> None:
+    """
+    Test that adding to a full bounded SpiderWeb applies the overflow policy.
+
+    :param capacity: The maximum number of elements.
+    :param overflow: The overflow policy.
+    :param expected_values: The expected elements after adding 0 to 9.
+    """
+    spider_web = SpiderWeb(3, index_values=True, capacity=capacity, overflow=overflow)
+    for value in range(10):
+        spider_web.add(value)
+        assert_vertical_links(spider_web, 3)
+
+    assert_that(list(spider_web)).is_equal_to(expected_values)
+    assert_that(spider_web.get_capacity()).is_equal_to(capacity)
+    assert_that(spider_web.index_of(expected_values[-1])).is_equal_to(
+        {"level": (len(expected_values) - 1) // 3, "index": (len(expected_values) - 1) % 3})
+    assert_that(list(SpiderWeb.from_iterable(range(10), 3, capacity=capacity, overflow=overflow))).is_equal_to(
+        expected_values)
+    assert_that(spider_web.copy().get_capacity()).is_equal_to(capacity)
+
+
+@pytest.mark.spider_web
+def test_bounded_add_recycles_nodes() -> None:
+    """
+    Test that a full SpiderWeb with the drop_oldest policy reuses the evicted nodes.
+    """
+    spider_web = SpiderWeb(3, capacity=4)
+    spider_web.extend(range(4))
+    node_ids = [id(node) for node in spider_web.iter_nodes()]
+
+    for value in range(4, 8):
+        spider_web.add(value)
+
+    assert_that(list(spider_web)).is_equal_to([4, 5, 6, 7])
+    assert_that([id(node) for node in spider_web.iter_nodes()]).is_equal_to(node_ids)
+
+
+@pytest.mark.spider_web
+def test_bounded_add_does_not_recycle_held_nodes() -> None:
+    """
+    Test that a handle to an evicted node is not reused for a new element, and is rejected afterwards.
+    """
+    spider_web = SpiderWeb(3, capacity=2)
+    spider_web.add(1)
+    node = spider_web.get_node(0, 0)
+    spider_web.add(2)
+    spider_web.add(3)
+
+    assert_that(list(spider_web)).is_equal_to([2, 3])
+    assert_that(node.get_value()).is_equal_to(1)
+    assert_that(spider_web.index_of(node=node)).is_equal_to({"level": None, "index": None})
+    with pytest.raises(ValueError):
+        spider_web.remove_node(node)
+    assert_that(list(spider_web)).is_equal_to([2, 3])
+
+
+@pytest.mark.spider_web
+def test_bounded_add_first_and_insert() -> None:
+    """
+    Test that add_first and insert on a full bounded SpiderWeb apply the overflow policy as well.
+    """
+    spider_web = SpiderWeb.from_iterable(range(6), 3, capacity=6)
+
+    spider_web.insert(1, 1, "x")
+    spider_web.add_first("y")
+
+    assert_that(list(spider_web)).is_equal_to(["y", 2, 3, "x", 4, 5])
+    assert_vertical_links(spider_web, 3)
+
+    spider_web = SpiderWeb.from_iterable(range(6), 3, capacity=6, overflow="drop_newest")
+    spider_web.insert(1, 1, "x")
+    spider_web.add_first("y")
+    assert_that(list(spider_web)).is_equal_to(list(range(6)))
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"capacity": 0},
+    {"overflow": "drop_everything"},
+    {"capacity": 3, "overflow": "block"}
+])
+@pytest.mark.spider_web
+def test_bounded_rejects_invalid_options(kwargs: dict) -> None:
+    """
+    Test that invalid capacities and overflow policies are rejected.
+
+    :param kwargs: The SpiderWeb options.
+    """
+    with pytest.raises(ValueError):
+        SpiderWeb(3, **kwargs)
+
+
+@pytest.mark.spider_web
+def test_bounded_add_blocks_until_there_is_room() -> None:
+    """
+    Test that adding to a full SpiderWeb with the block policy waits for a consumer.
+    """
+    spider_web = SpiderWeb(3, thread_safe=True, capacity=2, overflow="block")
+    spider_web.extend([0, 1])
+    producer = threading.Thread(target=lambda: spider_web.extend([2, 3]))
+
+    producer.start()
+    producer.join(0.05)
+    assert_that(producer.is_alive()).is_true()
+    assert_that(list(spider_web)).is_equal_to([0, 1])
+
+    consumed = []
+    while len(consumed) < 4:
+        consumed.extend(spider_web.drain())
+    producer.join(1)
+
+    assert_that(producer.is_alive()).is_false()
+    assert_that(consumed).is_equal_to([0, 1, 2, 3])
+
+
+@pytest.mark.parametrize("values", [
+    list(range(20)),
+    [0.5 * i for i in range(20)],
+    [1, "two", 3.0, None, (4, 5), 2 ** 70],
+    []
+])
+@pytest.mark.parametrize("protocol", [2, 4, 5])
+@pytest.mark.spider_web
+def test_pickle(values: list, protocol: int) -> None:
+    """
+    Test that a pickled SpiderWeb is restored with the same elements and layout.
+
+    :param values: The elements of the SpiderWeb.
+    :param protocol: The pickle protocol.
+    """
+    spider_web = SpiderWeb.from_iterable(values, 3)
+
+    restored = pickle.loads(pickle.dumps(spider_web, protocol=protocol))
+
+    assert_that(restored).is_instance_of(SpiderWeb)
+    assert_that(list(restored)).is_equal_to(values)
+    assert_that(restored.get_level()).is_equal_to(spider_web.get_level())
+    assert_that(restored.get_index()).is_equal_to(spider_web.get_index())
+    if values:
+        assert_vertical_links(restored, 3)
+
+
+@pytest.mark.spider_web
+def test_pickle_out_of_band_buffers() -> None:
+    """
+    Test that pickle protocol 5 passes the elements of a SpiderWeb of ints out-of-band.
+    """
+    spider_web = SpiderWeb.from_iterable(range(100), 4)
+    buffers = []
+
+    data = pickle.dumps(spider_web, protocol=5, buffer_callback=buffers.append)
+    restored = pickle.loads(data, buffers=buffers)
+
+    assert_that(buffers).is_length(1)
+    assert_that(len(data)).is_less_than(100 * 8)
+    assert_that(list(restored)).is_equal_to(list(range(100)))
+
+
+@pytest.mark.spider_web
+def test_pickle_long_spider_web() -> None:
+    """
+    Test that pickling does not recurse through the node chain of a long SpiderWeb.
+    """
+    spider_web = SpiderWeb.from_iterable((str(i) for i in range(100_000)), 6)
+
+    restored = pickle.loads(pickle.dumps(spider_web))
+
+    assert_that(restored.size()).is_equal_to(100_000)
+    assert_that(restored.get_last()).is_equal_to("99999")
+
+
+@pytest.mark.spider_web
+def test_pickle_keeps_options_and_aggregates() -> None:
+    """
+    Test that the options and the aggregates of a SpiderWeb survive pickling.
+    """
+    spider_web = SpiderWeb.from_iterable(range(10), 3, thread_safe=True, index_values=True, capacity=10)
+    spider_web.enable_aggregates()
+
+    restored = pickle.loads(pickle.dumps(spider_web))
+
+    assert_that(restored._lock).is_not_none()
+    assert_that(restored.index_of(7)).is_equal_to({"level": 2, "index": 1})
+    assert_that(restored.get_capacity()).is_equal_to(10)
+    assert_that(restored.aggregate(0, 10)).is_equal_to(spider_web.aggregate(0, 10))
+
+
+@pytest.mark.parametrize("values", [
+    list(range(-50, 50)),
+    [0.25 * i for i in range(50)],
+    [1, "two", 3.0, None, 2 ** 70],
+    []
+])
+@pytest.mark.spider_web
+def test_dump_and_load(tmp_path, values: list) -> None:
+    """
+    Test that a SpiderWeb written by dump is restored by load.
+
+    :param values: The elements of the SpiderWeb.
+    """
+    path = str(tmp_path / "checkpoint.spw")
+    SpiderWeb.from_iterable(values, 4).dump(path)
+
+    restored = SpiderWeb.load(path, index_values=True)
+
+    assert_that(list(restored)).is_equal_to(values)
+    assert_that(restored._max_element_per_level).is_equal_to(4)
+    assert_that(restored._value_index).is_not_none()
+
+
+@pytest.mark.parametrize("content", [b"", b"SPW", b"JUNK" + bytes(14)])
+@pytest.mark.spider_web
+def test_load_rejects_other_files(tmp_path, content: bytes) -> None:
+    """
+    Test that load rejects a file that is not a SpiderWeb checkpoint.
+
+    :param content: The content of the file.
+    """
+    path = tmp_path / "checkpoint.spw"
+    path.write_bytes(content)
+
+    with pytest.raises(ValueError):
+        SpiderWeb.load(str(path))
+
+
+@pytest.mark.spider_web
+def test_stats_disabled_by_default(spider_web_custom_max_element: SpiderWeb) -> None:
+    """
+    Test that a SpiderWeb collects no stats until they are enabled.
+    """
+    spider_web_custom_max_element.add(1)
+    spider_web_custom_max_element.get(0, 0)
+
+    assert_that(spider_web_custom_max_element.stats()).is_empty()
+
+
+@pytest.mark.spider_web
+def test_stats_count_calls_hops_and_latency() -> None:
+    """
+    Test that the stats count the calls, node hops and latencies of every operation.
+    """
+    spider_web = SpiderWeb.from_iterable(range(100), 10)
+    spider_web.enable_stats()
+
+    spider_web.get(4, 3)
+    spider_web.get(9, 9)
+    spider_web.index_of(50)
+    spider_web.last_index_of(1000)
+    spider_web.insert(10, 0, "last")
+    stats = spider_web.stats()
+
+    assert_that(stats["get"]).is_instance_of(OperationStats)
+    assert_that(stats["get"].calls).is_equal_to(2)
+    assert_that(stats["get"].hops).is_equal_to(7)
+    assert_that(stats["get"].max_hops).is_equal_to(7)
+    assert_that(stats["index_of"].hops).is_equal_to(50)
+    assert_that(stats["last_index_of"].hops).is_equal_to(99)
+    assert_that(sum(stats["get"].histogram.values())).is_equal_to(2)
+    assert_that(stats["get"].seconds).is_greater_than_or_equal_to(stats["get"].max_seconds)
+    # insert appends through add, which is counted as part of the insert.
+    assert_that(stats).contains_key("insert").does_not_contain_key("add")
+
+    spider_web.remove_first(20)
+    spider_web.remove_last(5)
+    spider_web.extend(range(4))
+    snapshot = spider_web.snapshot()
+    spider_web.set(0, 0, "first")
+    spider_web.set_level_values(1, range(10))
+    stats = spider_web.stats()
+
+    assert_that(stats["remove_first"].hops).is_equal_to(20 + 10)
+    assert_that(stats["remove_last"].hops).is_equal_to(5 + 10)
+    assert_that(stats["extend"].hops).is_equal_to(4)
+    # The first mutation after the snapshot copies the 80 shared nodes away from it.
+    assert_that(stats["set"].hops).is_equal_to(80)
+    assert_that(stats["set_level_values"].hops).is_equal_to(1 + 9)
+    assert_that(list(snapshot)[0]).is_equal_to(20)
+
+
+@pytest.mark.spider_web
+def test_stats_count_the_node_numbering_of_remove_node() -> None:
+    """
+    Test that the hops of numbering the nodes on demand count towards remove_node.
+    """
+    spider_web = SpiderWeb.from_iterable(range(20), 3)
+    spider_web.enable_stats()
+
+    spider_web.remove_node(spider_web.get_last_node())
+    assert_that(spider_web.stats()["remove_node"].hops).is_equal_to(20)
+    # Removing at either end keeps the numbers, so the next lookup numbers nothing.
+    spider_web.remove_node(spider_web.get_last_node())
+    stats = spider_web.stats()
+    assert_that((stats["remove_node"].calls, stats["remove_node"].hops)).is_equal_to((2, 20))
+    assert_that(stats).does_not_contain_key("remove_last")
+
+
+@pytest.mark.spider_web
+def test_reset_and_disable_stats() -> None:
+    """
+    Test that reset_stats sets the stats back to zero, and disable_stats stops collecting them.
+    """
+    spider_web = SpiderWeb.from_iterable(range(10), 3)
+    spider_web.enable_stats()
+    spider_web.get(1, 1)
+
+    spider_web.reset_stats()
+    assert_that(spider_web.stats()).is_empty()
+    spider_web.remove_first()
+    assert_that(spider_web.stats()["remove_first"].calls).is_equal_to(1)
+
+    spider_web.disable_stats()
+    spider_web.remove_first()
+    assert_that(spider_web.stats()).is_empty()
+
+
+@pytest.mark.spider_web
+def test_stats_of_a_thread_safe_spider_web() -> None:
+    """
+    Test that the stats of concurrent readers add up.
+    """
+    spider_web = SpiderWeb.from_iterable(range(100), 10, thread_safe=True)
+    spider_web.enable_stats()
+
+    def read() -> None:
+        for _ in range(100):
+            spider_web.get(2, 3)
+
+    threads = [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert_that(spider_web.stats()["get"].calls).is_equal_to(400)
+    assert_that(spider_web.stats()["get"].hops).is_equal_to(400 * 5)
+
+
+@pytest.mark.spider_web
+def test_on_slow_op_reports_operations_over_budget() -> None:
+    """
+    Test that the slow operation hook reports the calls over the hop budget, with their position and callers.
+    """
+    spider_web = SpiderWeb.from_iterable(range(100), 10)
+    slow_operations: List[SlowOperation] = []
+    spider_web.on_slow_op(slow_operations.append, threshold_hops=5)
+
+    spider_web.get(0, 1)
+    spider_web.get(4, 3)
+    spider_web.index_of(42)
+    spider_web.add_first(-1)
+
+    assert_that([operation.operation for operation in slow_operations]).is_equal_to(["get", "index_of"])
+    get, index_of = slow_operations
+    assert_that(get.args).is_equal_to((4, 3))
+    assert_that((get.level, get.index, get.hops)).is_equal_to((4, 3, 7))
+    assert_that((index_of.level, index_of.index, index_of.hops)).is_equal_to((4, 2, 42))
+    assert_that(get.stack[0]).contains("spider_web_test.py").contains("test_on_slow_op_reports_operations_over_budget")
+    assert_that(spider_web.stats()).is_empty()
+
+
+@pytest.mark.spider_web
+def test_on_slow_op_with_dict_values() -> None:
+    """
+    Test that a dict returned by get or set is not mistaken for the position of a search.
+    """
+    spider_web = SpiderWeb(3)
+    spider_web.add({"level": 7})
+    slow_operations: List[SlowOperation] = []
+    spider_web.on_slow_op(slow_operations.append, threshold_seconds=0.0)
+
+    assert_that(spider_web.get(0, 0)).is_equal_to({"level": 7})
+    spider_web.set(0, 0, {"level": 8})
+
+    positions = [(operation.operation, operation.level, operation.index) for operation in slow_operations]
+    assert_that(positions).is_equal_to([("get", 0, 0), ("set", 0, 0)])
+
+
+@pytest.mark.spider_web
+def test_on_slow_op_with_keyword_arguments() -> None:
+    """
+    Test that the slow operation hook reports the position of calls that pass the level or index by name.
+    """
+    spider_web = SpiderWeb.from_iterable(range(200), 2)
+    slow_operations: List[SlowOperation] = []
+    spider_web.on_slow_op(slow_operations.append, threshold_hops=5)
+
+    spider_web.get(90, index=1)
+    spider_web.get_node(level=80, index=0)
+    spider_web.set(70, element="x", index=1)
+
+    positions = [(operation.operation, operation.level, operation.index) for operation in slow_operations]
+    assert_that(positions).is_equal_to([("get", 90, 1), ("get_node", 80, 0), ("set", 70, 1)])
+
+
+@pytest.mark.spider_web
+def test_on_slow_op_logs_without_callback(caplog) -> None:
+    """
+    Test that the slow operation hook logs a warning when no callback is given.
+    """
+    spider_web = SpiderWeb.from_iterable(range(100), 10)
+    spider_web.on_slow_op(threshold_seconds=0.0)
+
+    with caplog.at_level(logging.WARNING, logger="spider_web"):
+        spider_web.copy()
+
+    assert_that(caplog.records).is_length(1)
+    assert_that(caplog.records[0].getMessage()).starts_with("Slow SpiderWeb operation copy()")
+    assert_that(caplog.records[0].slow_operation.hops).is_equal_to(99)
+
+
+@pytest.mark.spider_web
+def test_on_slow_op_sampling_and_disable() -> None:
+    """
+    Test that the sample rate thins out the reports, and that disable_slow_op removes the hook.
+    """
+    spider_web = SpiderWeb.from_iterable(range(100), 10, thread_safe=True)
+    slow_operations: List[SlowOperation] = []
+    spider_web.on_slow_op(slow_operations.append, threshold_hops=0, sample_rate=0.25)
+
+    for _ in range(1000):
+        spider_web.get(5, 5)
+    assert_that(len(slow_operations)).is_between(150, 350)
+
+    spider_web.disable_slow_op()
+    spider_web.get(5, 5)
+    assert_that(spider_web._stats).is_none()
+
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"threshold_hops": 10, "sample_rate": 0},
+    {"threshold_seconds": 0.1, "sample_rate": 1.5}
+])
+@pytest.mark.spider_web
+def test_on_slow_op_rejects_invalid_options(kwargs: dict) -> None:
+    """
+    Test that the slow operation hook needs a threshold and a valid sample rate.
+
+    :param kwargs: The options of the hook.
+    """
+    with pytest.raises(ValueError):
+        SpiderWeb(3).on_slow_op(**kwargs)